@@ -0,0 +1,80 @@
+"""Benchmark how the data structures videos are built from scale.
+
+Run ``python -m benchmarks --output results.json`` to record results, and pass a previous recording with
+``--baseline`` to fail when anything got slower or uses more memory.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from code_curator.custom_logging.custom_logger import CustomLogger
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare
+from benchmarks.runner import read_results
+from benchmarks.runner import run_case
+from benchmarks.runner import write_results
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+logger = CustomLogger.getLogger(__name__)
+
+
+def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(CASES),
+        default=list(CASES),
+        help="Cases to run. Every case is run by default.",
+    )
+    parser.add_argument(
+        "--large",
+        action="store_true",
+        help="Also run every case at the scale of interview constraints, e.g. linked lists with 5000 nodes.",
+    )
+    parser.add_argument("--frames", type=int, default=30, help="Number of frames to measure each case over.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times to measure building each case.")
+    parser.add_argument("--output", type=Path, default=None, help="Where to write the results as JSON.")
+    parser.add_argument("--baseline", type=Path, default=None, help="Results to compare with.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Fraction a metric may be worse than in the baseline by before it counts as a regression.",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    args = parse_args(args)
+
+    results = {}
+    for case_name in args.cases:
+        case = CASES[case_name]
+        for size in [*case.sizes, *(case.large_sizes if args.large else [])]:
+            case_id = case.get_id(size)
+            results[case_id] = run_case(case, size, num_frames=args.frames, repeat=args.repeat)
+            logger.info(f"{case_id}: {results[case_id]}")
+
+    if args.output is not None:
+        write_results(results, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(results, read_results(args.baseline), tolerance=args.tolerance)
+    for regression in regressions:
+        logger.error(f"Regression in {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Parameterized scenes for the data structures videos are built from.
+
+Every case builds one data structure at a given size and, when it's shown over several frames, moves it a little on
+every frame so its updaters run as they would while being animated.
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from manim import RIGHT
+
+from code_curator.code.code_diff import CodeDiff
+from code_curator.code.custom_code import CustomCode
+from code_curator.data_structures.graph import Graph
+from code_curator.data_structures.singly_linked_list import SinglyLinkedList
+
+if TYPE_CHECKING:
+    from manim import Mobject
+
+
+FRAME_RATE = 15
+FRAME_SHIFT = 0.01 * RIGHT
+
+
+class BenchmarkCase:
+    def __init__(
+        self,
+        name: str,
+        build: Callable[..., Any],
+        step: Callable[[Any], None] | None,
+        sizes: list[dict[str, int]],
+        large_sizes: list[dict[str, int]],
+    ) -> None:
+        """Benchmark building ``name`` at every size and, optionally, updating it frame by frame.
+
+        Args:
+            name: Name of the case.
+            build: Builds what is benchmarked from the keyword arguments in one of ``sizes``.
+            step: Advances what ``build`` returned by one frame. Only building is benchmarked when ``None``.
+            sizes: Keyword arguments of ``build`` benchmarked by default.
+            large_sizes: Keyword arguments of ``build`` at the scale of interview constraints, which take much longer
+                to benchmark.
+        """
+        self.name = name
+        self.build = build
+        self.step = step
+        self.sizes = sizes
+        self.large_sizes = large_sizes
+
+    def get_id(self, size: dict[str, int]) -> str:
+        return f"{self.name}[{','.join(f'{name}={value}' for name, value in size.items())}]"
+
+
+def build_singly_linked_list(num_nodes: int) -> SinglyLinkedList:
+    sll = SinglyLinkedList(*range(num_nodes))
+    sll.add_null()
+    sll.add_head_pointer()
+    sll.add_tail_pointer()
+    return sll
+
+
+def build_graph(num_vertices: int, num_edges: int) -> Graph:
+    graph = Graph()
+    radius = max(2.0, num_vertices / 4)
+    for index in range(num_vertices):
+        angle = math.tau * index / num_vertices
+        graph.add_vertex(index, position=(radius * math.cos(angle), radius * math.sin(angle), 0.0))
+
+    edge_rng = random.Random(num_edges)
+    for _ in range(num_edges):
+        graph.add_edge(*edge_rng.sample(range(num_vertices), 2))
+
+    return graph
+
+
+def step_graph(graph: Graph) -> None:
+    # Moving a single vertex makes every edge update, as all edges are redrawn by their updaters
+    graph.get_vertex(0).shift(FRAME_SHIFT)
+    graph.update(1 / FRAME_RATE)
+
+
+def build_code(num_lines: int) -> CustomCode:
+    return CustomCode(code="\n".join(f"value_{index} = compute({index})" for index in range(num_lines)))
+
+
+def build_code_diff(num_lines: int) -> CodeDiff:
+    source = build_code(num_lines)
+    destination = CustomCode(
+        code="\n".join(
+            f"value_{index} = compute({index})" if index % 5 else f"value_{index} = recompute({index})"
+            for index in range(num_lines)
+        ),
+    )
+    return CodeDiff(source, destination)
+
+
+def step_mobject(mobject: Mobject) -> None:
+    mobject.shift(FRAME_SHIFT)
+    mobject.update(1 / FRAME_RATE)
+
+
+CASES = {
+    case.name: case
+    for case in (
+        BenchmarkCase(
+            "singly_linked_list",
+            build=build_singly_linked_list,
+            step=step_mobject,
+            sizes=[{"num_nodes": 10}, {"num_nodes": 100}, {"num_nodes": 500}],
+            large_sizes=[{"num_nodes": 5000}],
+        ),
+        BenchmarkCase(
+            "graph",
+            build=build_graph,
+            step=step_graph,
+            sizes=[{"num_vertices": 10, "num_edges": 20}, {"num_vertices": 100, "num_edges": 300}],
+            large_sizes=[{"num_vertices": 1000, "num_edges": 5000}],
+        ),
+        BenchmarkCase(
+            "code",
+            build=build_code,
+            step=step_mobject,
+            sizes=[{"num_lines": 10}, {"num_lines": 100}],
+            large_sizes=[{"num_lines": 1000}],
+        ),
+        BenchmarkCase(
+            "code_diff",
+            build=build_code_diff,
+            step=None,
+            sizes=[{"num_lines": 10}, {"num_lines": 100}],
+            large_sizes=[{"num_lines": 1000}],
+        ),
+    )
+}
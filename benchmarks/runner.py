@@ -0,0 +1,134 @@
+"""Measure benchmark cases and compare the results with a baseline."""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import manim
+from manim import Camera
+
+if TYPE_CHECKING:
+    from benchmarks.cases import BenchmarkCase
+
+
+# Metrics where a higher value is an improvement. For every other metric a lower value is.
+HIGHER_IS_BETTER_METRICS = frozenset(("frames_per_second",))
+
+
+def run_case(case: BenchmarkCase, size: dict[str, int], num_frames: int, repeat: int) -> dict[str, float]:
+    """Measure building ``case`` at ``size`` and, if it has a step, updating and rasterizing it.
+
+    LaTeX output is cached on disk by manim, so the case is built once before measuring to keep compiling LaTeX
+    out of the numbers. Memory is measured in a separate build, as tracing allocations slows everything down.
+
+    Args:
+        case: The case to measure.
+        size: Keyword arguments to build ``case`` with.
+        num_frames: Number of frames to measure updating and rasterizing over.
+        repeat: Number of times to measure building. The fastest build is kept.
+
+    Returns:
+        The value of every metric measured.
+    """
+    case.build(**size)
+
+    build_seconds = []
+    for _ in range(repeat):
+        start = perf_counter()
+        case.build(**size)
+        build_seconds.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        built = case.build(**size)
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    metrics = {
+        "build_seconds": min(build_seconds),
+        "peak_memory_bytes": peak_memory_bytes,
+    }
+    if case.step is None or num_frames == 0:
+        return metrics
+
+    camera = Camera()
+    update_seconds = 0.0
+    rasterize_seconds = 0.0
+    for _ in range(num_frames):
+        start = perf_counter()
+        case.step(built)
+        update_end = perf_counter()
+        camera.reset()
+        camera.capture_mobject(built)
+        rasterize_end = perf_counter()
+
+        update_seconds += update_end - start
+        rasterize_seconds += rasterize_end - update_end
+
+    metrics.update(
+        frame_update_seconds=update_seconds / num_frames,
+        frame_rasterize_seconds=rasterize_seconds / num_frames,
+        frames_per_second=num_frames / (update_seconds + rasterize_seconds),
+    )
+    return metrics
+
+
+def write_results(results: dict[str, dict[str, float]], path: str | os.PathLike) -> None:
+    Path(path).write_text(
+        json.dumps(
+            {
+                "environment": {
+                    "python": platform.python_version(),
+                    "manim": manim.__version__,
+                    "platform": platform.platform(),
+                },
+                "results": results,
+            },
+            indent=4,
+        ),
+        encoding="utf-8",
+    )
+
+
+def read_results(path: str | os.PathLike) -> dict[str, dict[str, float]]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Describe every metric in ``results`` that is more than ``tolerance`` worse than in ``baseline``.
+
+    Args:
+        results: The metrics of every case that was just measured.
+        baseline: The metrics to compare with. Cases and metrics missing from it are ignored.
+        tolerance: The fraction of the baseline value a metric may be worse by, e.g. ``0.2`` for 20%.
+
+    Returns:
+        A description of each regression.
+    """
+    regressions = []
+    for case_id, metrics in results.items():
+        for metric, value in metrics.items():
+            try:
+                baseline_value = baseline[case_id][metric]
+            except KeyError:
+                continue
+
+            if metric in HIGHER_IS_BETTER_METRICS:
+                is_regression = value < baseline_value * (1 - tolerance)
+            else:
+                is_regression = value > baseline_value * (1 + tolerance)
+
+            if is_regression:
+                regressions.append(f"{case_id} {metric}: {value:.6g} (baseline {baseline_value:.6g})")
+
+    return regressions
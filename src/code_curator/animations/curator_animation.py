@@ -1,62 +1,228 @@
 from __future__ import annotations
 
 import collections
+import heapq
+import itertools
+import math
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 from typing import Callable
 
+import numpy as np
 from manim import Animation
+from manim import config
 from manim import prepare_animation
 
+from code_curator.custom_logging.custom_logger import CustomLogger
+from code_curator.rendering.checkpoint import get_checkpoint_keys
+from code_curator.rendering.profiler import profile
 from .utils.math_ import value_from_range_to_range
 
+if TYPE_CHECKING:
+    from code_curator.rendering.checkpoint import CheckpointStore
+    from code_curator.rendering.profiler import RenderProfiler
+
+
+logger = CustomLogger.getLogger(__name__)
+
 
 class CuratorAnimation(Animation):
-    def __init__(self, mobject, animation_script, scene, run_time: float) -> None:
+    def __init__(
+        self,
+        mobject,
+        animation_script,
+        scene,
+        run_time: float,
+        start_time: float = 0.0,
+        checkpoint_store: CheckpointStore | None = None,
+        profiler: RenderProfiler | None = None,
+    ) -> None:
+        """Play the part of ``animation_script`` that starts at ``start_time`` and lasts ``run_time`` seconds.
+
+        Args:
+            mobject: The top level mobject of ``scene``.
+            animation_script: Script whose entries name the methods of ``scene`` to call and when to call them.
+            scene: The scene the methods from ``animation_script`` belong to.
+            run_time: How much of the timeline, in seconds, to play.
+            start_time: Where on the timeline, in seconds, to start playing. Everything scheduled before it is
+                fast-forwarded through without rendering any frames.
+            checkpoint_store: Where to save the state of the scene at the entry boundaries it fast-forwards
+                through, and to restore it from when fast-forwarding. No checkpoints are used when not given.
+            profiler: What to attribute the time spent on each entry of the script to. Nothing is measured when
+                not given.
+        """
         super().__init__(mobject, run_time=run_time)
         self.animation_script = animation_script
         self.scene = scene
 
-        self.pending_queue = collections.deque()
+        timeline_run_time = animation_script.run_time
+        self.window_start_time = start_time
+        self.window_start_alpha = start_time / timeline_run_time
+        self.window_end_alpha = (start_time + run_time) / timeline_run_time
+
+        pending_methods = []
         for method_info in animation_script.entries:
             method = getattr(self.scene, method_info["name"])
             method.__func__.start_alpha = value_from_range_to_range(
                 value=method_info["start_time"],
                 init_min=0,
-                init_max=self.run_time,
+                init_max=timeline_run_time,
                 new_min=0,
                 new_max=1,
             )
-            self.pending_queue.append(method)
+            pending_methods.append(method)
+
+        # Sorting is stable, so methods starting at the same time are still called in the order of the script
+        self.pending_queue = collections.deque(sorted(pending_methods, key=lambda method: method.start_alpha))
 
-        self.animation_pool = AnimationPool(mobject=self.mobject, scene=self.scene, total_run_time=self.run_time)
+        self.animation_pool = AnimationPool(
+            mobject=self.mobject,
+            scene=self.scene,
+            total_run_time=timeline_run_time,
+            profiler=profiler,
+        )
+        self.is_fast_forwarded = False
+        # The time from the last frame played while fast-forwarding to the first frame of the window
+        self.first_frame_dt = 0.0
+
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_keys = get_checkpoint_keys(self) if checkpoint_store is not None else []
+
+    @property
+    def entry_index(self) -> int:
+        """Index of the next entry of the script to call."""
+        return len(self.animation_script.entries) - len(self.pending_queue)
 
     def begin(self) -> None:
-        """Override and do nothing to avoid ``interpolate_mobject`` being called twice with alpha equal to 0."""
+        """Override to only fast-forward, avoiding ``interpolate_mobject`` being called twice with alpha equal to 0."""
+        self.fast_forward()
+
+        # ``Scene.play`` starts counting time from the first frame of the window, which as part of the whole timeline
+        # comes ``first_frame_dt`` after the last frame played by ``fast_forward``
+        self.scene.last_t = -self.first_frame_dt
+
+    def fast_forward(self) -> None:
+        """Bring the scene to the start of the window without rendering any frames.
+
+        Methods scheduled before the timeline starts are applied in their final state. The rest of the timeline
+        before the window is played on the frames a single ``Scene.play`` of the whole timeline plays it on,
+        ``np.arange(0, start_time, 1 / frame_rate)``, each going through the same steps as in
+        ``Scene.update_to_time``: the methods due are called and the animations brought to the frame by
+        :meth:`play_frame`, then updaters run with the time since the previous frame. ``first_frame_dt`` is the time
+        between the last of these frames and the first one of the window. The window therefore starts from the same
+        state however many segments the timeline is split into.
+
+        Animations not finished by the last played frame are left in ``animation_pool``, whether they end before
+        the window starts or not, for the first frame of the window to finish or interpolate.
+
+        Only the first call does anything, so the scene can be fast-forwarded before it is rendered.
+        """
+        if self.is_fast_forwarded:
+            return
+
+        self.is_fast_forwarded = True
+
+        is_resumed = self.checkpoint_store is not None and self.restore_checkpoint()
+
         while self.pending_queue and self.pending_queue[0].start_alpha < 0:
             method = self.pending_queue.popleft()
             self.animation_pool.add(method)
-            for animation in self.animation_pool.animations.copy():
-                animation.interpolate(1)
-                animation.finish()
-                animation.clean_up_from_scene(self.scene)
-                self.animation_pool.animations.remove(animation)
+            self.animation_pool.finish_until(math.inf)
+
+        frame_times = np.arange(0, self.window_start_time, 1 / config.frame_rate)
+        frame_alphas = frame_times / self.animation_pool.total_run_time
+        # A checkpoint holds the state right before the frame the next method is called on
+        first_frame = np.searchsorted(frame_alphas, self.pending_queue[0].start_alpha) if is_resumed else 0
+
+        for frame in range(first_frame, len(frame_times)):
+            if self.pending_queue and frame_alphas[frame] >= self.pending_queue[0].start_alpha:
+                self.save_checkpoint()
+
+            dt = frame_times[frame] - frame_times[frame - 1] if frame > 0 else 0
+            self.update_mobjects(dt)
+            self.play_frame(frame_alphas[frame])
+            self.scene.update_mobjects(dt)
+            self.scene.update_self(dt)
+
+        self.first_frame_dt = self.window_start_time - frame_times[-1] if len(frame_times) else 0
+
+    def restore_checkpoint(self) -> bool:
+        """Restore the latest checkpoint taken before the window starts, skipping every entry called before it.
+
+        Returns:
+            Whether a checkpoint was restored.
+        """
+        for entry_index in reversed(range(len(self.checkpoint_keys))):
+            if self.pending_queue[entry_index].start_alpha > self.window_start_alpha:
+                continue
+
+            key = self.checkpoint_keys[entry_index]
+            if self.checkpoint_store.has(key) and self.checkpoint_store.load(key, self):
+                logger.info(f"Resuming from the checkpoint before entry {entry_index}")
+                for _ in range(entry_index):
+                    self.pending_queue.popleft()
+
+                return True
+
+        return False
+
+    def save_checkpoint(self) -> None:
+        """Save a checkpoint before the next method of the script is called, if one is due and not saved yet.
+
+        Checkpoints are only saved while fast-forwarding, right before the frame the method is called on, so
+        resuming from one replays that frame and every later one. A method called on the same frame as the one
+        before it has no state of its own to save, so no checkpoint is saved before it.
+        """
+        if self.checkpoint_store is None or not self.checkpoint_store.is_due(self.entry_index):
+            return
+
+        key = self.checkpoint_keys[self.entry_index]
+        if not self.checkpoint_store.has(key):
+            self.checkpoint_store.save(key, self)
+
+    def add_next_method(self) -> None:
+        """Call the next method of the script."""
+        self.animation_pool.add(self.pending_queue.popleft())
 
     def interpolate_mobject(self, alpha: float) -> None:
-        if len(self.pending_queue) > 0 and alpha >= self.pending_queue[0].start_alpha:
-            self.animation_pool.add(self.pending_queue.popleft())
+        self.play_frame(
+            value_from_range_to_range(
+                value=alpha,
+                init_min=0,
+                init_max=1,
+                new_min=self.window_start_alpha,
+                new_max=self.window_end_alpha,
+            ),
+        )
+
+    def play_frame(self, alpha: float) -> None:
+        """Call every method due at ``alpha`` of the whole timeline, then bring every animation to ``alpha``."""
+        # Every method due is called, so methods starting at the same time also start on the same frame
+        while len(self.pending_queue) > 0 and alpha >= self.pending_queue[0].start_alpha:
+            self.add_next_method()
 
         self.animation_pool.interpolate(alpha)
 
 
 class AnimationPool:
-    def __init__(self, mobject, scene, total_run_time: float) -> None:
+    def __init__(self, mobject, scene, total_run_time: float, profiler: RenderProfiler | None = None) -> None:
         self.mobject = mobject
         self.scene = scene
         self.total_run_time = total_run_time
-        self.animations: set[Animation] = set()
+        self.profiler = profiler
+
+        # Used as an ordered set, so animations are interpolated in the order they started
+        self.animations: dict[Animation, None] = {}
+
+        # Heap of ``(end_alpha, order, animation)``, so finding the animations that ended doesn't need to look at every
+        # running one. ``order`` breaks ties, in the order animations were added, as animations can't be compared.
+        self._end_heap: list[tuple[float, int, Animation]] = []
+        self._order = itertools.count()
 
     def add(self, method: Callable[[], Animation | Iterable[Animation]]) -> None:
-        animations = method()
+        with profile(self.profiler, method.__name__, "call"):
+            animations = method()
+
         if not isinstance(animations, Iterable):
             animations = [animations]
 
@@ -64,7 +230,10 @@ class AnimationPool:
             if anim is None:
                 continue
 
-            anim = prepare_animation(anim)
+            with profile(self.profiler, method.__name__, "prepare"):
+                anim = prepare_animation(anim)
+
+            anim.method_name = method.__name__
             anim.start_alpha = method.start_alpha
             anim.end_alpha = method.start_alpha + value_from_range_to_range(
                 value=anim.run_time,
@@ -73,13 +242,21 @@ class AnimationPool:
                 new_min=0,
                 new_max=1,
             )
-            self.animations.add(anim)
-            anim._setup_scene(self.scene)
-            anim.begin()
+            self.schedule(anim)
+            with profile(self.profiler, method.__name__, "begin"):
+                anim._setup_scene(self.scene)
+                anim.begin()
+
+    def schedule(self, anim: Animation) -> None:
+        """Track ``anim``, which already has ``start_alpha`` and ``end_alpha`` set and has begun, until it ends."""
+        self.animations[anim] = None
+        heapq.heappush(self._end_heap, (anim.end_alpha, next(self._order), anim))
 
     def interpolate(self, alpha: float) -> None:
-        for anim in self.animations.copy():
-            if alpha < anim.end_alpha:
+        self._finish_ended(alpha)
+
+        for anim in self.animations:
+            with profile(self.profiler, anim.method_name, "interpolate"):
                 anim.interpolate(
                     value_from_range_to_range(
                         value=alpha,
@@ -89,7 +266,30 @@ class AnimationPool:
                         new_max=1,
                     ),
                 )
-            else:
+
+    def finish_until(self, alpha: float) -> None:
+        """Finish, in the order they end, every animation that ends at or before ``alpha``.
+
+        Unlike :meth:`interpolate`, animations still running at ``alpha`` are left untouched, which is what
+        fast-forwarding through part of the timeline needs.
+        """
+        if self._finish_ended(alpha):
+            # Let updaters settle as they would have over the frames that were skipped
+            self.scene.update_mobjects(dt=0)
+
+    def _finish_ended(self, alpha: float) -> bool:
+        """Finish, in the order they end, every animation that ends at or before ``alpha``.
+
+        Returns:
+            Whether any animation was finished.
+        """
+        has_finished_any = False
+        while self._end_heap and self._end_heap[0][0] <= alpha:
+            _, _, anim = heapq.heappop(self._end_heap)
+            with profile(self.profiler, anim.method_name, "finish"):
                 anim.finish()
                 anim.clean_up_from_scene(self.scene)
-                self.animations.remove(anim)
+            del self.animations[anim]
+            has_finished_any = True
+
+        return has_finished_any
@@ -24,79 +24,68 @@ class TransformSinglyLinkedList(AnimationGroup):
         self.methods = methods
         self.target_mobject = self.mobject.target
 
-        mobject_family_members = set(self.mobject.family_members_with_points())
-        target_mobject_family_members = set(self.target_mobject.family_members_with_points())
-
         def get_original_id(mobject: Mobject) -> str:
             try:
                 return mobject.original_id
             except AttributeError:
                 return str(id(mobject))
 
-        mobject_family_ids = {str(id(mob)) for mob in mobject_family_members}
-        target_mobject_family_original_ids = {get_original_id(mob) for mob in target_mobject_family_members}
-
-        transforming_submobject_ids = mobject_family_ids.intersection(target_mobject_family_original_ids)
-        fading_out_submobject_ids = mobject_family_ids - target_mobject_family_original_ids
-        fading_in_submobject_ids = target_mobject_family_original_ids - mobject_family_ids
-
-        self.transform_animations = []
-
-        for submobject_id in transforming_submobject_ids:
-            original_to_target = []
-
-            for mobject in mobject_family_members:
-                if str(id(mobject)) == submobject_id:
-                    original_to_target.append(mobject)
-                    break
-
-            for mobject in target_mobject_family_members:
-                if get_original_id(mobject) == submobject_id:
-                    original_to_target.append(mobject)
-                    break
-
-            self.transform_animations.append(Transform(*original_to_target, suspend_mobject_updating=False))
-
-        # Exclude animations that animate submobjects of other FadeIn animations
-        for outer_mob_animtion in self.transform_animations.copy():
-            outer_mob = outer_mob_animtion.mobject
-            for inner_mob_animation in self.transform_animations.copy():
-                inner_mob = inner_mob_animation.mobject
-                # Exclude self by excluding first element from slice
-                if inner_mob in outer_mob.family_members_with_points()[1:]:
-                    self.transform_animations.remove(inner_mob_animation)
-
-        self.fading_out_animations = []
-
-        for submobject_id in fading_out_submobject_ids:
-            for mobject in mobject_family_members:
-                if str(id(mobject)) == submobject_id:
-                    self.fading_out_animations.append(FadeOut(mobject, suspend_mobject_updating=False))
-
-        # Exclude animations that animate submobjects of other FadeIn animations
-        for outer_mob_animtion in self.fading_out_animations.copy():
-            outer_mob = outer_mob_animtion.mobject
-            for inner_mob_animation in self.fading_out_animations.copy():
-                inner_mob = inner_mob_animation.mobject
-                # Exclude self by excluding first element from slice
-                if inner_mob in outer_mob.family_members_with_points()[1:]:
-                    self.fading_out_animations.remove(inner_mob_animation)
-
-        self.fading_in_animations = []
-
-        for submobject_id in fading_in_submobject_ids:
-            for mobject in target_mobject_family_members:
-                if get_original_id(mobject) == submobject_id:
-                    self.fading_in_animations.append(FadeIn(mobject, suspend_mobject_updating=False))
-
-        # Exclude animations that animate submobjects of other FadeIn animations
-        for outer_mob_animtion in self.fading_in_animations.copy():
-            outer_mob = outer_mob_animtion.mobject
-            for inner_mob_animation in self.fading_in_animations.copy():
-                inner_mob = inner_mob_animation.mobject
-                # Exclude self by excluding first element from slice
-                if inner_mob in outer_mob.family_members_with_points()[1:]:
-                    self.fading_in_animations.remove(inner_mob_animation)
+        # A target made by ``copy_on_write`` shares the mobjects that don't change. Those are left as they are, and
+        # are matched by identity rather than by ``original_id``, which a copy of a copy (such as the glyphs manim
+        # hands out from its SVG cache) carries from a mobject that isn't in the family.
+        mobject_family_ids = {id(mob) for mob in self.mobject.get_family()}
+        target_mobject_family_ids = {id(mob) for mob in self.target_mobject.get_family()}
+
+        # Family members by id, in family order so the animations are always created in the same order
+        mobject_family_members_by_id = {
+            str(id(mob)): mob
+            for mob in self.mobject.family_members_with_points()
+            if id(mob) not in target_mobject_family_ids
+        }
+        target_mobject_family_members_by_original_id = {}
+        for mob in self.target_mobject.family_members_with_points():
+            if id(mob) not in mobject_family_ids:
+                target_mobject_family_members_by_original_id.setdefault(get_original_id(mob), mob)
+
+        # The mobjects holding shared ones only change through the mobjects written to, which are transformed instead
+        holds_shared_mobject: dict[Mobject, bool] = {}
+        for mob in reversed(self.target_mobject.get_family()):
+            holds_shared_mobject[mob] = id(mob) in mobject_family_ids or any(
+                holds_shared_mobject.get(submob, False) for submob in mob.submobjects
+            )
+
+        transforming_mobjects = []
+        fading_out_mobjects = []
+        for submobject_id, mobject in mobject_family_members_by_id.items():
+            if submobject_id in target_mobject_family_members_by_original_id:
+                if not holds_shared_mobject[target_mobject_family_members_by_original_id[submobject_id]]:
+                    transforming_mobjects.append(mobject)
+            else:
+                fading_out_mobjects.append(mobject)
+
+        fading_in_mobjects = [
+            mobject
+            for original_id, mobject in target_mobject_family_members_by_original_id.items()
+            if original_id not in mobject_family_members_by_id
+        ]
+
+        # Exclude mobjects that are submobjects of other mobjects animated the same way
+        self.transform_animations = [
+            Transform(
+                mobject,
+                target_mobject_family_members_by_original_id[str(id(mobject))],
+                suspend_mobject_updating=False,
+            )
+            for mobject in _exclude_descendants(transforming_mobjects, self.mobject)
+        ]
+        self.fading_out_animations = [
+            FadeOut(mobject, suspend_mobject_updating=False)
+            for mobject in _exclude_descendants(fading_out_mobjects, self.mobject)
+        ]
+        self.fading_in_animations = [
+            FadeIn(mobject, suspend_mobject_updating=False)
+            for mobject in _exclude_descendants(fading_in_mobjects, self.target_mobject)
+        ]
 
         super().__init__(
             *(self.transform_animations + self.fading_out_animations + self.fading_in_animations),
@@ -119,3 +108,34 @@ class TransformSinglyLinkedList(AnimationGroup):
             method.__func__(self.ungroupified_mobject, *method_args, **method_kwargs)
 
         self.ungroupified_mobject.resume_updating()
+
+
+def _exclude_descendants(mobjects: list[Mobject], root: Mobject) -> list[Mobject]:
+    """Get the mobjects of ``mobjects`` that aren't a submobject, at any depth, of another one of them.
+
+    Args:
+        mobjects: Members of the family of ``root``.
+        root: The mobject whose family ``mobjects`` are taken from.
+    """
+    parents: dict[Mobject, list[Mobject]] = {}
+    for mob in root.get_family():
+        for submob in mob.submobjects:
+            parents.setdefault(submob, []).append(mob)
+
+    candidates = set(mobjects)
+
+    def has_candidate_ancestor(mob: Mobject) -> bool:
+        visited = set()
+        stack = list(parents.get(mob, ()))
+        while stack:
+            ancestor = stack.pop()
+            if ancestor in candidates:
+                return True
+
+            if ancestor not in visited:
+                visited.add(ancestor)
+                stack.extend(parents.get(ancestor, ()))
+
+        return False
+
+    return [mob for mob in mobjects if not has_candidate_ancestor(mob)]
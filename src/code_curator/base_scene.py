@@ -1,20 +1,30 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from manim import config
+from manim import Camera
 from manim import Mobject
+from manim import RendererType
 from manim import Scene
 
 from code_curator.animations.curator_animation import CuratorAnimation
 from code_curator.custom_logging.custom_logger import CustomLogger
+from code_curator.rendering.curator_renderer import CuratorCairoRenderer
+from code_curator.rendering.profiler import UPDATERS_ENTRY_NAME
+from code_curator.rendering.profiler import profile
 
 if TYPE_CHECKING:
     import types
+    from code_curator.rendering.checkpoint import CheckpointStore
+    from code_curator.rendering.profiler import RenderProfiler
 
 logger = CustomLogger.getLogger(__name__)
 
 config["background_color"] = "#282C34"
+# A video is a single ``play`` call, which manim's cache can only reuse as a whole. Segments rendered by
+# ``code_curator.rendering`` are cached by ``code_curator.rendering.segment_cache`` instead.
 config["disable_caching"] = True
 
 
@@ -39,9 +49,43 @@ class _OneElementMobjectListDescriptor:
 class BaseScene(Scene):
     mobjects = _OneElementMobjectListDescriptor()
 
-    def __init__(self, animation_script=None, **kwargs) -> None:
+    def __init__(
+        self,
+        animation_script=None,
+        render_window: tuple[float, float] | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+        profiler: RenderProfiler | None = None,
+        **kwargs,
+    ) -> None:
+        """Create a scene that plays ``animation_script``.
+
+        Args:
+            animation_script: Script whose entries name the methods of this scene to call and when to call them.
+            render_window: The ``(start, end)`` times, in seconds, of the part of the timeline to render. The whole
+                timeline is rendered when not given.
+            checkpoint_store: Where to save checkpoints of the state of the scene and to resume from them. No
+                checkpoints are used when not given.
+            profiler: What to attribute the time spent on each entry of ``animation_script`` to, including while
+                fast-forwarding to ``render_window``. Use :meth:`attach_profiler` to only measure rendering. Nothing
+                is measured when not given.
+            kwargs: Forwarded to :class:`~manim.scene.scene.Scene`. Unless another renderer is given, Cairo renders
+                with a :class:`~rendering.curator_renderer.CuratorCairoRenderer`.
+        """
+        if config.renderer == RendererType.CAIRO and kwargs.get("renderer") is None:
+            kwargs["renderer"] = CuratorCairoRenderer(
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+
         super().__init__(**kwargs)
         self.animation_script = animation_script
+        self.render_window = render_window
+        self.checkpoint_store = checkpoint_store
+        self.profiler = profiler
+
+        # Everything set from here on, by the ``__init__`` of subclasses or by the methods of the script, is the state
+        # of the video that checkpoints save
+        self.non_state_attr_names = frozenset((*self.__dict__, "non_state_attr_names", "curator_animation"))
 
     @property
     def submobjects(self) -> list[Mobject]:
@@ -67,17 +111,36 @@ class BaseScene(Scene):
     def remove_foreground_mobject(self, mobject: Mobject):
         mobject.z_index = 0
 
+    def update_mobjects(self, dt: float) -> None:
+        with profile(self.profiler, UPDATERS_ENTRY_NAME, "updaters"):
+            super().update_mobjects(dt)
+
+    def attach_profiler(self, profiler: RenderProfiler | None) -> None:
+        """Attribute the time spent on each entry of ``animation_script`` from now on to ``profiler``.
+
+        Attached after fast-forwarding, only the entries playing in ``render_window`` are measured.
+        """
+        self.profiler = profiler
+        self.curator_animation.animation_pool.profiler = profiler
+
     def get_start_time(self, method: types.MethodType) -> float:
         for entry in self.animation_script.entries:
             if entry["name"] == method.__name__:
                 return entry["start_time"]
 
-    def construct(self) -> None:
-        self.play(
-            CuratorAnimation(
-                self.mobjects[0],
-                animation_script=self.animation_script,
-                scene=self,
-                run_time=self.animation_script.run_time,
-            ),
+    @cached_property
+    def curator_animation(self) -> CuratorAnimation:
+        """The animation playing ``render_window`` of ``animation_script``."""
+        start_time, end_time = self.render_window or (0.0, self.animation_script.run_time)
+        return CuratorAnimation(
+            self.mobjects[0],
+            animation_script=self.animation_script,
+            scene=self,
+            run_time=end_time - start_time,
+            start_time=start_time,
+            checkpoint_store=self.checkpoint_store,
+            profiler=self.profiler,
         )
+
+    def construct(self) -> None:
+        self.play(self.curator_animation)
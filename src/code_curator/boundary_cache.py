@@ -0,0 +1,216 @@
+"""Boundaries of :class:`~custom_vmobject.CustomVMobject` cached until the points of their family change.
+
+Every ``get_center``, ``move_to``, ``next_to`` and ``get_boundary_point`` reads the points defining the boundary of a
+mobject, and gathering them from a whole family is O(total points). Here, the boundary of a mobject is computed once
+and every member of the family it was computed from watches it. Writing the points of a member, or changing its
+submobjects, invalidates the boundaries watching it, along with the anchors cached for the member itself. Reading a
+boundary nothing changed in is then O(1), and recomputing it after a change only recomputes the anchors of the
+members that were written.
+
+Writes are seen through hooks installed on :class:`~manim.Mobject` for ``points`` and ``submobjects``. They only
+define ``__set__``, so reading either attribute still goes straight to the ``__dict__`` of the mobject. Augmented
+assignments, like the ``mob.points += vector`` manim shifts with, assign the attribute and are seen too. Writing
+into the points array by index, e.g. ``mob.points[0] = point``, isn't seen, which manim only does for a
+``ValueTracker``, for ``DecimalNumber`` and right after assigning fresh points. Changing a list of submobjects in
+place is seen for the lists of watched mobjects, which are replaced by a :class:`_WatchedList`.
+
+Cached state is kept here by ``id`` rather than on the mobjects, so copies and pickles of a mobject start uncached.
+"""
+from __future__ import annotations
+
+import functools
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+from manim import Mobject
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from manim.typing import Point3D_Array
+
+
+class _CacheEntry:
+    __slots__ = ("ref", "watchers", "anchors", "boundary", "bounds")
+
+    def __init__(self, ref: weakref.ref) -> None:
+        self.ref = ref
+        # The watching mobjects by id, whose boundaries were computed from this one
+        self.watchers: dict[int, weakref.ref] = {}
+        self.anchors: Point3D_Array | None = None
+        self.boundary: Point3D_Array | None = None
+        self.bounds: tuple[np.ndarray, np.ndarray] | None = None
+
+
+_entries: dict[int, _CacheEntry] = {}
+
+
+def get_boundary(
+    mobject: Mobject,
+    excluded: Iterable[Mobject],
+    get_anchors: Callable[[Mobject], Point3D_Array],
+) -> Point3D_Array:
+    """Get the anchors of every member of the family of ``mobject`` but the families of ``excluded``, in order.
+
+    The result is read-only, as it's shared by every call until the family changes.
+
+    Args:
+        mobject: The mobject to get the boundary of.
+        excluded: The members whose families don't contribute to the boundary. The boundary has to be invalidated
+            with :func:`invalidate` whenever these change.
+        get_anchors: Gets the anchors of a single member with points.
+    """
+    entry = _get_entry(mobject)
+    if entry.boundary is not None:
+        return entry.boundary
+
+    excluded_ids = {id(member) for mob in excluded for member in mob.get_family()}
+    anchors = []
+    stack = [mobject]
+    while stack:
+        mob = stack.pop()
+        if id(mob) in excluded_ids:
+            continue
+
+        mob_entry = _watch(mob, watcher_entry=entry)
+        if len(mob.points):
+            if mob_entry.anchors is None:
+                mob_entry.anchors = get_anchors(mob)
+
+            anchors.append(mob_entry.anchors)
+
+        stack.extend(reversed(mob.submobjects))
+
+    boundary = np.concatenate(anchors) if anchors else np.zeros((0, 3))
+    boundary.flags.writeable = False
+    entry.boundary = boundary
+    return boundary
+
+
+def get_bounds(
+    mobject: Mobject,
+    excluded: Iterable[Mobject],
+    get_anchors: Callable[[Mobject], Point3D_Array],
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Get the lowest and highest coordinates of the boundary :func:`get_boundary` gets, or ``None`` if it's empty."""
+    entry = _get_entry(mobject)
+    if entry.boundary is None or entry.bounds is None:
+        boundary = get_boundary(mobject, excluded, get_anchors)
+        if not len(boundary):
+            return None
+
+        entry.bounds = (boundary.min(axis=0), boundary.max(axis=0))
+
+    return entry.bounds
+
+
+def invalidate(mobject: Mobject) -> None:
+    """Forget the anchors of ``mobject`` and every boundary computed from it."""
+    entry = _entries.get(id(mobject))
+    if entry is None or entry.ref() is not mobject:
+        return
+
+    entry.anchors = None
+    entry.boundary = entry.bounds = None
+    for watcher_ref in entry.watchers.values():
+        watcher = watcher_ref()
+        watcher_entry = _entries.get(id(watcher)) if watcher is not None else None
+        if watcher_entry is not None and watcher_entry.ref is watcher_ref:
+            watcher_entry.boundary = watcher_entry.bounds = None
+
+    # Watchers watch again when they recompute their boundary
+    entry.watchers.clear()
+
+
+def _get_entry(mobject: Mobject) -> _CacheEntry:
+    mobject_id = id(mobject)
+    entry = _entries.get(mobject_id)
+    if entry is None or entry.ref() is not mobject:
+        entry = _entries[mobject_id] = _CacheEntry(weakref.ref(mobject, functools.partial(_forget, mobject_id)))
+
+    return entry
+
+
+def _forget(mobject_id: int, ref: weakref.ref) -> None:
+    entry = _entries.get(mobject_id)
+    if entry is not None and entry.ref is ref:
+        del _entries[mobject_id]
+
+
+def _watch(mobject: Mobject, watcher_entry: _CacheEntry) -> _CacheEntry:
+    entry = _get_entry(mobject)
+    entry.watchers[id(watcher_entry.ref())] = watcher_entry.ref
+    if type(mobject.submobjects) is not _WatchedList:
+        mobject.__dict__["submobjects"] = _WatchedList(mobject, mobject.submobjects)
+
+    return entry
+
+
+class _WatchedList(list):
+    """List of submobjects that invalidates what its mobject is watched by when it changes."""
+
+    def __init__(self, owner: Mobject, submobjects: Iterable[Mobject]) -> None:
+        super().__init__(submobjects)
+        self._owner_ref = weakref.ref(owner)
+
+    def __reduce_ex__(self, protocol):
+        # Copied and pickled as a plain list, as copies aren't watched
+        return list, (list(self),)
+
+    def _invalidate_owner(self) -> None:
+        owner = self._owner_ref()
+        if owner is not None:
+            invalidate(owner)
+
+
+def _invalidating(method_name: str):
+    method = getattr(list, method_name)
+
+    @functools.wraps(method)
+    def wrapper(self: _WatchedList, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._invalidate_owner()
+        return result
+
+    return wrapper
+
+
+for _method_name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_WatchedList, _method_name, _invalidating(_method_name))
+
+
+class _InvalidatingAttribute:
+    """Invalidate what a mobject is watched by whenever the attribute ``name`` of it is assigned.
+
+    Without ``__get__``, reading the attribute still finds it in the ``__dict__`` of the mobject as fast as before.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __set__(self, mobject: Mobject, value) -> None:
+        mobject.__dict__[self.name] = value
+        if _entries:
+            invalidate(mobject)
+
+    def __delete__(self, mobject: Mobject) -> None:
+        del mobject.__dict__[self.name]
+        invalidate(mobject)
+
+
+Mobject.points = _InvalidatingAttribute("points")
+Mobject.submobjects = _InvalidatingAttribute("submobjects")
@@ -4,6 +4,7 @@ import itertools as it
 import math
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from manim import Animation
 from manim import Code
@@ -16,6 +17,11 @@ from code_curator.animations.singly_linked_list.transform_sll import TransformSi
 from code_curator.code.code_highlighter import CodeHighlighter
 from code_curator.code.one_dark_colors import OneDarkStyle
 from code_curator.code.python_lexer import MyPythonLexer
+from code_curator.custom_vmobject import copy_on_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from manim import Mobject
 
 
 class CustomCode(Code):
@@ -102,31 +108,35 @@ class CustomCode(Code):
     # TODO: Give better name than fade in. I'd like to have the entire mobject be on the screen just with 0 opacity
     #  So, fading in is misleading because it implies that it's not yet present on the screen.
     def fade_in_lines(self, *line_numbers: int) -> tuple[CustomCode, Animation]:
-        copy = self._create_animation_copy()
-        for line_no in line_numbers:
-            copy.code[line_no].set_opacity(1)
+        target, lines = self._create_animation_target(self.code[line_no] for line_no in line_numbers)
+        for line in lines:
+            line.set_opacity(1)
 
-        return copy, TransformSinglyLinkedList(self, copy)
+        return target, TransformSinglyLinkedList(self, [])
 
     def fade_in_substring(self, substring: str, occurrence: int = 1) -> tuple[CustomCode, Animation]:
-        copy = self._create_animation_copy()
-        copy.get_code_substring(substring, occurrence=occurrence).set_opacity(1)
-        return copy, TransformSinglyLinkedList(self, copy)
+        target, chars = self._create_animation_target(self.get_code_substring(substring, occurrence=occurrence))
+        for char in chars:
+            char.set_opacity(1)
+
+        return target, TransformSinglyLinkedList(self, [])
 
     def saturation_highlight_substring(self, substring: str, occurrence: int = 1) -> tuple[CustomCode, Animation]:
-        copy = self._create_animation_copy()
         substring_start_index = self.get_substring_starting_index(substring, occurrence=occurrence)
+        target, desaturated_chars = self._create_animation_target(
+            [
+                *self.code.lines_text[:substring_start_index],
+                *self.code.lines_text[substring_start_index + len(substring) :],
+            ],
+        )
 
         desaturate_opacity = 0.25
-        copy.code.lines_text[:substring_start_index].set_opacity(desaturate_opacity)
-        copy.code.lines_text[substring_start_index + len(substring) :].set_opacity(desaturate_opacity)
+        for char in desaturated_chars:
+            char.set_opacity(desaturate_opacity)
 
-        return copy, TransformSinglyLinkedList(self, copy)
+        return target, TransformSinglyLinkedList(self, [])
 
     def change_code_text(self, new_code_string: str) -> tuple[CustomCode, Animation]:
-        copy = self._create_animation_copy()
-        copy._original__init__(code=new_code_string)
-
         return CodeTransform(self, CustomCode(code=new_code_string))
 
     def get_substring_starting_index(self, substring: str, occurrence: int = 1, line_index: int | None = None) -> int:
@@ -172,12 +182,20 @@ class CustomCode(Code):
     def set_background_color(self, color: str) -> None:
         self.background_mobject.set(color=color)
 
-    def _create_animation_copy(self) -> CustomCode:
-        attr_name = "_copy_for_animation"
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, self.copy())
+    def _create_animation_target(self, written: Iterable[Mobject]) -> tuple[CustomCode, list[Mobject]]:
+        """Make the target of an animation in which only the mobjects of ``written`` change.
+
+        Only ``written`` is copied, the rest of the code is shared with the target, so highlighting part of a long
+        listing doesn't copy all of it.
+
+        Args:
+            written: Members of the family of ``self`` that the animation changes.
 
-        return getattr(self, attr_name)
+        Returns:
+            The target and the copies of ``written`` in it, which are the only mobjects of it that can be changed.
+        """
+        self.target, written_copies = copy_on_write(self, written)
+        return self.target, written_copies
 
     def _gen_html_string(self):
         """Function to generate html string with code highlighted and stores in variable html_string."""
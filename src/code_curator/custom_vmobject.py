@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import collections
+import copy
 import inspect
-import itertools as it
+import types
+import weakref
+from typing import Any
 from typing import TYPE_CHECKING
 
 import numpy as np
+from manim import Mobject
 from manim import VMobject
-from manim.utils.family_ops import restructure_list_to_exclude_certain_family_members
 
+from code_curator import boundary_cache
+from code_curator import updater_cache
 from code_curator.custom_logging.custom_logger import CustomLogger
 from code_curator.null_vmobject import NullVMobject
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from manim.mobject.mobject import Updater
+    from manim.typing import Point3D
     from manim.typing import Point3D_Array
+    from manim.typing import Vector3
 
 
 logger = CustomLogger.getLogger(__name__)
@@ -23,6 +34,9 @@ class CustomVMobject(VMobject):
         super().__init__(*args, **kwargs)
         self.quasi_mobjects: list[VMobject] = []
 
+        # Whether each updater takes ``dt``, so it's only looked up once rather than on every update
+        self._updaters_take_dt: dict[Updater, bool] = {}
+
     def add(self, *mobjects: VMobject) -> None:
         non_null_vmobjects: list[VMobject] = []
         for mob in mobjects:
@@ -52,47 +66,263 @@ class CustomVMobject(VMobject):
         """
         self.add(*mobjects)
         self.quasi_mobjects.extend(mobjects)
+        boundary_cache.invalidate(self)
 
     def get_points_defining_boundary(self) -> Point3D_Array:
         """Exclude quasi_mobjects from defining boundary.
 
+        The anchors of every other member of the family are cached until the family changes, see
+        :mod:`~code_curator.boundary_cache`. The returned array is read-only.
+
         .. seealso:: :meth:`~custom_vmobject.CustomVMobject.quasi_add`
         """
-        return np.array(
-            tuple(
-                it.chain(
-                    *(
-                        sm.get_anchors()
-                        for sm in restructure_list_to_exclude_certain_family_members(
-                            self.get_family(),
-                            to_remove=self.quasi_mobjects,
-                        )
-                    ),
-                ),
-            ),
-        )
+        return boundary_cache.get_boundary(self, self.quasi_mobjects, _get_anchors)
 
-    def force_update(self, recursive: bool = True):
-        family = self.get_family()
-        is_suspended_list = [mob.updating_suspended for mob in family]
-        self.resume_updating()
+    def get_critical_point(self, direction: Vector3) -> Point3D:
+        """Get the same point as :meth:`~.Mobject.get_critical_point` from the cached bounds of the boundary."""
+        bounds = boundary_cache.get_bounds(self, self.quasi_mobjects, _get_anchors)
+        if bounds is None:
+            return np.zeros(self.dim)
+
+        lowest, highest = bounds
+        direction = np.asarray(direction)
+        return np.where(direction < 0, lowest, np.where(direction > 0, highest, (lowest + highest) / 2))
 
-        for index, mob in enumerate(family):
-            if is_suspended_list[index]:
-                mob.suspend_updating(recursive=False)
+    def get_boundary_point(self, direction: Vector3) -> Point3D:
+        # Copied out of the cached boundary, which is read-only, so the point can be changed in place
+        boundary = self.get_points_defining_boundary()
+        return boundary[np.argmax(np.dot(boundary, np.array(direction).T))].copy()
 
+    def force_update(self, recursive: bool = True):
+        force_update_each(self.get_family() if recursive else [self])
         return self
 
+    def get_updater_dependencies(self) -> Iterable[Mobject] | None:
+        """Get the mobjects read by the updaters of ``self`` and of its family, or ``None`` if they aren't known.
+
+        .. seealso:: :func:`~custom_vmobject.get_updater_dependents`
+        """
+        return None
+
+    def add_updater(self, update_function: Updater, index: int | None = None, call_updater: bool = False):
+        self._updaters_take_dt[update_function] = _takes_dt(update_function)
+        return super().add_updater(update_function, index=index, call_updater=call_updater)
+
+    def remove_updater(self, update_function: Updater):
+        self._updaters_take_dt.pop(update_function, None)
+        return super().remove_updater(update_function)
+
     def update(self, dt: float = 0, recursive: bool = True):
         if not self.updating_suspended:
             for updater in self.updaters:
-                if "dt" in inspect.signature(updater).parameters:
+                takes_dt = self._updaters_take_dt.get(updater)
+                if takes_dt is None:
+                    # Added without going through ``add_updater``, such as by ``match_updaters``
+                    takes_dt = self._updaters_take_dt[updater] = _takes_dt(updater)
+
+                if takes_dt:
                     updater(self, dt)
                 else:
                     updater(self)
 
         if recursive:
             for submob in self.submobjects:
-                submob.update(dt, recursive)
+                # Most of a family is the paths making up Tex and shapes, which have nothing to update
+                if updater_cache.has_updaters_in_family(submob):
+                    submob.update(dt, recursive)
 
         return self
+
+
+def force_update_each(mobjects: Iterable[Mobject]) -> None:
+    """Run the updaters of each of ``mobjects``, but not of its submobjects, even if its updating is suspended."""
+    for mob in mobjects:
+        is_suspended = mob.updating_suspended
+        mob.updating_suspended = False
+        mob.update(dt=0, recursive=False)
+        mob.updating_suspended = is_suspended
+
+
+def get_updater_dependents(mobject: Mobject, changed: Iterable[Mobject]) -> list[Mobject]:
+    """Get the members of the family of ``mobject`` whose updaters have to run again because ``changed`` changed.
+
+    A :class:`CustomVMobject` whose updaters, and those of its family, are known to only read certain mobjects
+    depends on those mobjects and their families, and, through them, on whatever they depend on. Any other member
+    with updaters is assumed to depend on everything, and to change its own family when its updaters run.
+
+    Args:
+        mobject: The mobject whose family to search for dependents.
+        changed: The mobjects that changed.
+
+    Returns:
+        The members with updaters to run, in the order to run them in.
+    """
+    dependents_by_dependency: dict[int, list[Mobject]] = {}
+    dependents = []
+    stack = [mobject]
+    while stack:
+        mob = stack.pop()
+        dependencies = mob.get_updater_dependencies() if isinstance(mob, CustomVMobject) else None
+        if dependencies is not None:
+            for dependency in dependencies:
+                dependents_by_dependency.setdefault(id(dependency), []).append(mob)
+
+            continue
+
+        if mob.updaters:
+            dependents.append(mob)
+
+        stack.extend(reversed(mob.submobjects))
+
+    visited = set()
+    # Families can overlap, e.g. when a dependent is nested in another one, so each member is only listed once
+    dependent_ids = {id(dependent) for dependent in dependents}
+    queue = collections.deque([*changed, *dependents])
+    while queue:
+        for changed_member in queue.popleft().get_family():
+            for dependent in dependents_by_dependency.get(id(changed_member), ()):
+                if id(dependent) in visited:
+                    continue
+
+                visited.add(id(dependent))
+                for member in dependent.get_family():
+                    if member.updaters and id(member) not in dependent_ids:
+                        dependent_ids.add(id(member))
+                        dependents.append(member)
+
+                queue.append(dependent)
+
+    return dependents
+
+
+def writes(get_written: Callable[..., Iterable[Mobject]]) -> Callable[[Callable], Callable]:
+    """Declare which members of the family of a mobject a method of it changes, so animating it copies only those.
+
+    Args:
+        get_written: Gets the members the method changes, from the same arguments as the method, ``self`` included.
+
+    .. seealso:: :func:`~custom_vmobject.get_written_mobjects`
+    """
+
+    def decorator(method: Callable) -> Callable:
+        method._get_written_mobjects = get_written
+        return method
+
+    return decorator
+
+
+def get_written_mobjects(method: types.MethodType, args: Iterable[Any], kwargs: dict[str, Any]) -> list[Mobject]:
+    """Get the members of the family of the mobject ``method`` is bound to that calling it with ``args`` changes.
+
+    A method that doesn't declare them with :func:`writes` is assumed to change the whole family.
+    """
+    get_written = getattr(method, "_get_written_mobjects", None)
+    if get_written is None:
+        return [method.__self__]
+
+    return list(get_written(method.__self__, *args, **kwargs))
+
+
+def copy_on_write(mobject: Mobject, written: Iterable[Mobject]) -> tuple[Mobject, list[Mobject]]:
+    """Copy ``mobject`` such that only the members of its family that are going to be changed are copied.
+
+    Each mobject of ``written`` is copied along with its family, and each mobject it's a submobject of is copied
+    without its submobjects to hold the copy. Every other member of the family of ``mobject`` is shared by the copy,
+    so the copy must only be changed through the copies of ``written``. As with :meth:`~.Mobject.copy`, every copy
+    has the ``original_id`` of the mobject it copies.
+
+    The attributes of the mobjects copied without their submobjects get new lists, sets, dicts and arrays, and copies
+    of every other value, such as mobjects outside of the family. Only the members of the family that aren't copied,
+    and whatever weak references and bound methods refer to outside of the family, are shared with ``mobject``.
+
+    Args:
+        mobject: The mobject to copy.
+        written: Members of the family of ``mobject`` that are going to be changed.
+
+    Returns:
+        The copy of ``mobject`` and the copies of ``written``, in the same order.
+    """
+    written = list(written)
+    family = mobject.get_family()
+    parents: dict[Mobject, list[Mobject]] = {}
+    for mob in family:
+        for submob in mob.submobjects:
+            parents.setdefault(submob, []).append(mob)
+
+    written_family = {id(member) for mob in written for member in mob.get_family()}
+    holders: dict[int, Mobject] = {}
+    stack = [parent for mob in written for parent in parents.get(mob, ())]
+    while stack:
+        mob = stack.pop()
+        if id(mob) not in holders and id(mob) not in written_family:
+            holders[id(mob)] = mob
+            stack.extend(parents.get(mob, ()))
+
+    # Seeding the memo of ``copy.deepcopy`` with the shared mobjects keeps the copies of ``written`` from copying
+    # the mobjects they reference, such as the vertices of an edge
+    memo: dict[int, Any] = {id(mob): mob for mob in family if id(mob) not in written_family}
+    for mob_id, holder in holders.items():
+        shell = copy.copy(holder)
+        shell.original_id = str(id(holder))
+        memo[mob_id] = shell
+
+    written_copies = [copy.deepcopy(mob, memo) for mob in written]
+
+    for mob_id in holders:
+        shell = memo[mob_id]
+        for attr, value in list(vars(shell).items()):
+            setattr(shell, attr, _share_or_copy(value, memo))
+
+    return memo.get(id(mobject), mobject), written_copies
+
+
+def _share_or_copy(value: Any, memo: dict[int, Any]) -> Any:
+    """Get ``value`` for an attribute of a mobject copied by :func:`copy_on_write`, with its mobjects replaced.
+
+    Members of the family are replaced by their copies, or shared if they aren't copied. Anything else is copied, as
+    :meth:`~.Mobject.copy` would, so changing the copy never changes the source through an attribute.
+    """
+    if isinstance(value, Mobject) and id(value) in memo:
+        return memo[id(value)]
+
+    if isinstance(value, types.MethodType):
+        # Such as updaters, which have to be bound to the copy for updating it not to change ``mobject``
+        return types.MethodType(value.__func__, memo.get(id(value.__self__), value.__self__))
+
+    if isinstance(value, weakref.ref):
+        # Such as the graph of an edge, which has to be its copy if there is one
+        referent = value()
+        return weakref.ref(memo[id(referent)]) if referent is not None and id(referent) in memo else value
+
+    if isinstance(value, np.ndarray):
+        return value.copy()
+
+    if isinstance(value, list):
+        # Also turns the watched lists of submobjects of ``boundary_cache`` into plain lists, as copies aren't watched
+        return [_share_or_copy(item, memo) for item in value]
+
+    if type(value) is set:
+        return {_share_or_copy(item, memo) for item in value}
+
+    if type(value) is dict:
+        return {_share_or_copy(key, memo): _share_or_copy(item, memo) for key, item in value.items()}
+
+    # Such as mobjects outside of the family, like the lines of a ``Paragraph``, which are copied along with
+    # whatever they reference but keep sharing the members of the family they hold
+    return copy.deepcopy(value, memo)
+
+
+def _takes_dt(updater: Updater) -> bool:
+    return "dt" in inspect.signature(updater).parameters
+
+
+def _get_anchors(vmobject: VMobject) -> Point3D_Array:
+    """Get the same anchors as :meth:`~.VMobject.get_anchors` without going through them one by one."""
+    points = vmobject.points
+    if len(points) == 1:
+        return points
+
+    start_anchors = vmobject.get_start_anchors()
+    end_anchors = vmobject.get_end_anchors()
+    num_curves = min(len(start_anchors), len(end_anchors))
+    return np.stack((start_anchors[:num_curves], end_anchors[:num_curves]), axis=1).reshape(-1, 3)
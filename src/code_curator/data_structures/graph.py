@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-import warnings
+import weakref
 from typing import Any
 from typing import TYPE_CHECKING
 
@@ -93,56 +93,23 @@ class Vertex(CustomVMobject):
         if show_label and label is None:
             raise ValueError("You must provide a label for it to be shown")
 
-        if not isinstance(label, Mobject) and label is not None:
-            label = Element(
-                label,
-                color=color,
-                font_size=DEFAULT_LABEL_FONT_SIZE,
-            )
-
-        if show_label:
-            self.quasi_add(label)
-            label.move_to(container.get_center())
-
-            try:
-                container_radius = container.radius
-            except AttributeError:
-                container_radius = Circle().surround(container, stretch=True, buffer_factor=1).radius
-
-            if label_out:
-                buffer_factor = (container_radius + label_dist) / container_radius
-            else:
-                buffer_factor = label_dist / container_radius
-
-            label_placement_helper_circle = (
-                Circle(
-                    stroke_width=container.stroke_width,
-                )
-                .match_style(container)
-                .surround(
-                    container,
-                    stretch=True,
-                    buffer_factor=buffer_factor,
-                )
-            )
-
-            label_placement_helper_circle.move_to(container.get_center())
-
-            label.move_to(
-                label_placement_helper_circle.point_at_angle(
-                    math.radians(label_revolve_angle_in_degrees),
-                ),
-            )
-
-            label.rotate(
-                math.radians(label_rotate_angle_in_degrees),
-                axis=IN,
-                about_point=label.get_center(),
-            )
-
-        self.label_mobject = label
         self.container = container
         self.contents_mobject = contents
+        self._contents_color = color
+        self._contents_font_size = contents_font_size
+
+        # The label is only made into a mobject once it's shown or asked for, as it'd otherwise cost a LaTeX run
+        # for every vertex whose label is hidden
+        self._label = label
+        self._label_mobject: Mobject | None = label if isinstance(label, Mobject) else None
+        self._label_color = color
+        self._label_out = label_out
+        self._label_dist = label_dist
+        self._label_revolve_angle_in_degrees = label_revolve_angle_in_degrees
+        self._label_rotate_angle_in_degrees = label_rotate_angle_in_degrees
+
+        if show_label:
+            self.add_label()
 
         if self.contents == "null":
             mock_contents = Element("n")
@@ -162,10 +129,93 @@ class Vertex(CustomVMobject):
 
     @property
     def label(self):
-        if self.label_mobject is None:
-            return None
+        if self._label_mobject is None:
+            return self._label
 
-        return self.label_mobject.value
+        return self._label_mobject.value
+
+    @property
+    def label_mobject(self) -> Mobject | None:
+        if self._label_mobject is None and self._label is not None:
+            self._label_mobject = Element(
+                self._label,
+                color=self._label_color,
+                font_size=DEFAULT_LABEL_FONT_SIZE,
+            )
+
+        return self._label_mobject
+
+    def set_contents(self, contents: Any) -> None:
+        """Show ``contents`` inside the container instead of the current contents.
+
+        Args:
+            contents: The new contents, made into an :class:`Element` unless it's a mobject already.
+        """
+        if not isinstance(contents, Mobject):
+            contents = Element(
+                contents,
+                color=self._contents_color,
+                font_size=self._contents_font_size,
+            )
+
+        if self.contents_mobject is not None:
+            self.container.remove(self.contents_mobject)
+
+        contents.move_to(self.container.get_center())
+        self.container.add(contents)
+        self.contents_mobject = contents
+
+    def add_label(self) -> None:
+        """Show the label, placed relative to the container as given when the vertex was created."""
+        label = self.label_mobject
+        if label is None:
+            raise ValueError("You must provide a label for it to be shown")
+
+        if label in self.submobjects:
+            return
+
+        container = self.container
+        self.quasi_add(label)
+
+        try:
+            container_radius = container.radius
+        except AttributeError:
+            container_radius = Circle().surround(container, stretch=True, buffer_factor=1).radius
+
+        if self._label_out:
+            buffer_factor = (container_radius + self._label_dist) / container_radius
+        else:
+            buffer_factor = self._label_dist / container_radius
+
+        angle = math.radians(self._label_revolve_angle_in_degrees)
+        if _is_circle(container):
+            # A circle surrounding a circle of width w has a radius of w / sqrt(2) before being scaled by the buffer
+            # factor, so the label is placed on it directly rather than on a helper circle
+            label_placement_radius = buffer_factor * container.width / math.sqrt(2)
+            label.move_to(
+                container.get_center() + label_placement_radius * np.array([math.cos(angle), math.sin(angle), 0.0]),
+            )
+        else:
+            label_placement_helper_circle = (
+                Circle(
+                    stroke_width=container.stroke_width,
+                )
+                .match_style(container)
+                .surround(
+                    container,
+                    stretch=True,
+                    buffer_factor=buffer_factor,
+                )
+            )
+
+            label_placement_helper_circle.move_to(container.get_center())
+            label.move_to(label_placement_helper_circle.point_at_angle(angle))
+
+        label.rotate(
+            math.radians(self._label_rotate_angle_in_degrees),
+            axis=IN,
+            about_point=label.get_center(),
+        )
 
     def proportion_from_point(self, point) -> float:
         return self.container.proportion_from_point(point)
@@ -199,8 +249,11 @@ class Edge(CustomVMobject):
         if not isinstance(vertex_one, Mobject) or not isinstance(vertex_two, Mobject):
             raise TypeError("You must provide Mobjects as the vertices")
 
-        self.vertex_one = vertex_one
-        self.vertex_two = vertex_two
+        # Graph whose adjacency index has to follow the vertices of this edge, set once it's added to one. Only
+        # weakly referenced, so that copying the edge doesn't copy the whole graph along with it.
+        self._graph: weakref.ref[Graph] | None = None
+        self._vertex_one = vertex_one
+        self._vertex_two = vertex_two
         self.line = Line(
             self.vertex_one,
             self.vertex_two,
@@ -232,72 +285,113 @@ class Edge(CustomVMobject):
 
         return f"{start} {self.directedness} {end}"
 
+    def __deepcopy__(self, memo) -> Edge:
+        result = super().__deepcopy__(memo)
+
+        # The copy only belongs to the copy of the graph, if that's being copied too. Otherwise, e.g. when only the
+        # edge is copied, it belongs to no graph, as the graph doesn't know about it.
+        result.graph = memo.get(id(self.graph)) if self.graph is not None else None
+        return result
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Weak references can't be pickled, so the graph is pickled along with the edge instead
+        return {**self.__dict__, "_graph": self.graph}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.graph = state["_graph"]
+
+    @property
+    def graph(self) -> Graph | None:
+        return self._graph() if self._graph is not None else None
+
+    @graph.setter
+    def graph(self, graph: Graph | None) -> None:
+        self._graph = weakref.ref(graph) if graph is not None else None
+
+    @property
+    def vertex_one(self) -> Vertex | None:
+        return self._vertex_one
+
+    @vertex_one.setter
+    def vertex_one(self, vertex: Vertex | None) -> None:
+        self._set_vertices(vertex, self._vertex_two)
+
+    @property
+    def vertex_two(self) -> Vertex | None:
+        return self._vertex_two
+
+    @vertex_two.setter
+    def vertex_two(self, vertex: Vertex | None) -> None:
+        self._set_vertices(self._vertex_one, vertex)
+
     def set_path_arc(self, angle_in_degrees: float):
         self.line.set_path_arc(math.radians(angle_in_degrees))
         return self
 
+    def get_updater_dependencies(self) -> Iterable[Mobject]:
+        return [vertex for vertex in (self.vertex_one, self.vertex_two) if vertex is not None]
+
     def shortest_path_updater(self, some_obj) -> None:
+        if hasattr(self, "invisible_to_avoid_divide_by_zero"):
+            self.line.restore()
+            delattr(self, "invisible_to_avoid_divide_by_zero")
+
+        if self.vertex_one is None and self.vertex_two is None:
+            return
+
+        # The ends of the line without its tips, which sit between the line and the vertices
         if self.vertex_one is None:
-            reference_start = self.line.get_start()
+            reference_start = self.line.start_tip.tip_point if self.line.has_start_tip() else self.line.get_start()
         else:
             reference_start = self.vertex_one.container.get_center()
 
         if self.vertex_two is None:
-            reference_end = self.line.get_end()
+            reference_end = self.line.tip.tip_point if self.line.has_tip() else self.line.get_end()
         else:
             reference_end = self.vertex_two.container.get_center()
 
-        reference_line = Line(
-            reference_start,
-            reference_end,
-            color=self.color,
-        )
+        offset = reference_end - reference_start
+        length = np.linalg.norm(offset)
+        if length == 0:
+            self.line.save_state()
+            self.set_opacity(0)
+            self.invisible_to_avoid_divide_by_zero = True
+            return
 
-        if hasattr(self, "invisible_to_avoid_divide_by_zero"):
-            self.line.restore()
-            delattr(self, "invisible_to_avoid_divide_by_zero")
+        if self.vertex_one is None:
+            start = reference_start
+        else:
+            start = reference_start + offset * min(1, self.vertex_one.container.radius / length)
 
-        with warnings.catch_warnings():
-            warnings.filterwarnings("error")
+        if self.vertex_two is None:
+            end = reference_end
+        else:
+            end = reference_start + offset * max(0, 1 - self.vertex_two.container.radius / length)
 
-            try:
-                if self.vertex_one is None:
-                    new_line_start = self.line.get_start()
-                else:
-                    new_line_start = reference_line.point_from_proportion(
-                        min(1, self.vertex_one.container.radius / reference_line.get_length()),
-                    )
-
-                if self.vertex_two is None:
-                    new_line_end = self.line.get_end()
-                else:
-                    new_line_end = reference_line.point_from_proportion(
-                        max(0, 1 - (self.vertex_two.container.radius / reference_line.get_length())),
-                    )
-
-                new_line = Line(
-                    new_line_start,
-                    new_line_end,
-                    path_arc=self.line.path_arc,
-                )
-            except RuntimeWarning:
-                self.line.save_state()
-                self.set_opacity(0)
-                self.invisible_to_avoid_divide_by_zero = True
-            else:
-                if self.line.has_tip():
-                    new_line.add_tip(self.line.tip)
-                    new_line.tip.match_style(self.line.tip)
+        self._put_line_start_and_end_on(start, end)
 
-                if self.line.has_start_tip():
-                    new_line.add_tip(self.line.start_tip, at_start=True)
-                    new_line.start_tip.match_style(self.line.start_tip)
+    def _put_line_start_and_end_on(self, start: np.ndarray, end: np.ndarray) -> None:
+        """Move the line of this edge, tips included, to go from ``start`` to ``end`` without creating a new one."""
+        tips = []
+        if self.line.has_tip():
+            tips.append((self.line.tip, False))
 
-                new_line.match_style(self.line)
+        if self.line.has_start_tip():
+            tips.append((self.line.start_tip, True))
 
-                self.line.become(
-                    new_line,
-                )
+        # Taken off while the line is moved, as moving it would otherwise transform them along with it
+        self.line.remove(*(tip for tip, _ in tips))
+
+        self.line.start = start
+        self.line.end = end
+        self.line.set_points_by_ends(start, end, path_arc=self.line.path_arc)
+
+        for tip, at_start in tips:
+            self.line.position_tip(tip, at_start)
+            self.line.reset_endpoints_based_on_tip(tip, at_start)
+
+        self.line.add(*(tip for tip, _ in tips))
 
     def get_start(self):
         return self.line.get_start()
@@ -343,6 +437,54 @@ class Edge(CustomVMobject):
 
         self.set_path_arc(angle_in_degrees=angle_in_degrees)
 
+    def _set_vertices(self, vertex_one: Vertex | None, vertex_two: Vertex | None) -> None:
+        if self.graph is not None:
+            self.graph._unindex_edge(self)
+
+        self._vertex_one = vertex_one
+        self._vertex_two = vertex_two
+
+        if self.graph is not None:
+            self.graph._index_edge(self)
+
+
+def update_edges(edges: Iterable[Edge]) -> None:
+    """Run :meth:`Edge.shortest_path_updater` for every edge in ``edges``, even if its updating is suspended.
+
+    The ends of the lines are computed for all edges at once. Edges missing a vertex, or whose vertices are on top
+    of each other, go through their updater one by one instead.
+    """
+    batched_edges = []
+    for edge in edges:
+        if (
+            edge.vertex_one is None
+            or edge.vertex_two is None
+            or hasattr(edge, "invisible_to_avoid_divide_by_zero")
+        ):
+            edge.shortest_path_updater(edge)
+        else:
+            batched_edges.append(edge)
+
+    if not batched_edges:
+        return
+
+    start_centers = np.array([edge.vertex_one.container.get_center() for edge in batched_edges])
+    end_centers = np.array([edge.vertex_two.container.get_center() for edge in batched_edges])
+    start_radii = np.array([edge.vertex_one.container.radius for edge in batched_edges])
+    end_radii = np.array([edge.vertex_two.container.radius for edge in batched_edges])
+
+    offsets = end_centers - start_centers
+    lengths = np.linalg.norm(offsets, axis=1)
+    safe_lengths = np.where(lengths == 0, 1, lengths)
+    starts = start_centers + offsets * np.minimum(1, start_radii / safe_lengths)[:, np.newaxis]
+    ends = start_centers + offsets * np.maximum(0, 1 - end_radii / safe_lengths)[:, np.newaxis]
+
+    for edge, start, end, length in zip(batched_edges, starts, ends, lengths):
+        if length == 0:
+            edge.shortest_path_updater(edge)
+        else:
+            edge._put_line_start_and_end_on(start, end)
+
 
 class Graph(CustomVMobject):
     def __init__(self) -> None:
@@ -350,6 +492,28 @@ class Graph(CustomVMobject):
         self.vertices: set[Vertex] = set()
         self.edges: set[Edge] = set()
         self.labeled_pointers: dict[str, LabeledLine] = {}
+        # Vertices by their label, as several vertices may share a label. Vertices whose label can't be a key, like an
+        # unhashable one or a mobject without a ``value``, are kept apart and searched one by one instead.
+        self._vertices_by_label: dict[Any, dict[Vertex, None]] = {}
+        self._unindexed_vertices: dict[Vertex, None] = {}
+        # Changed whenever a vertex is added or removed or the vertices of an edge change, however they change, so
+        # what is found from the structure of the graph can be cached until then
+        self.structure_version = 0
+
+        # Edges by the vertices they touch, kept in step with the vertices of every edge so lookups don't have to
+        # scan ``edges``. Dicts are used as ordered sets.
+        self._incident_edges: dict[Vertex, dict[Edge, None]] = {}
+        self._outgoing_edges: dict[Vertex, dict[Edge, None]] = {}
+        self._incoming_edges: dict[Vertex, dict[Edge, None]] = {}
+
+    def __deepcopy__(self, memo) -> Graph:
+        result = super().__deepcopy__(memo)
+
+        # Edges copied before this graph started being copied couldn't find its copy yet
+        for edge in result.edges:
+            edge.graph = result
+
+        return result
 
     def add_vertex(
         self,
@@ -369,6 +533,7 @@ class Graph(CustomVMobject):
             self.add(label_or_vertex)
 
         self.vertices.add(label_or_vertex)
+        self._index_vertex_label(label_or_vertex)
 
         return label_or_vertex
 
@@ -403,6 +568,8 @@ class Graph(CustomVMobject):
             self.add_vertex(edge.vertex_two, quasi=quasi)
 
         self.edges.add(edge)
+        edge.graph = self
+        self._index_edge(edge)
 
         return edge
 
@@ -435,8 +602,9 @@ class Graph(CustomVMobject):
             mob.suspend_updating()
             if isinstance(mob, Vertex):
                 self.vertices.remove(mob)
+                self._unindex_vertex_label(mob)
 
-                for edge in self.edges:
+                for edge in self.get_incident_edges(mob):
                     if mob is edge.vertex_one:
                         edge.vertex_one = None
 
@@ -445,6 +613,8 @@ class Graph(CustomVMobject):
 
             elif isinstance(mob, Edge):
                 self.edges.remove(mob)
+                self._unindex_edge(mob)
+                mob.graph = None
                 mob.vertex_one = None
                 mob.vertex_two = None
             elif isinstance(mob, LabeledLine):
@@ -458,15 +628,38 @@ class Graph(CustomVMobject):
         return self.labeled_pointers[name]
 
     def get_vertex(self, label: str | int, /) -> Vertex:
-        for vertex in self.vertices:
-            if vertex.label == label:
-                return vertex
+        try:
+            return next(iter(self._vertices_by_label[label]))
+        except (KeyError, TypeError):
+            pass
+
+        for vertex in self._unindexed_vertices:
+            try:
+                if vertex.label == label:
+                    return vertex
+            except AttributeError:
+                continue  # The label is a mobject without a value
 
         raise LookupError(f"Unable to find vertex with label ``{label}``")
 
+    def get_incident_edges(self, vertex: Vertex) -> Sequence[Edge]:
+        return list(self._incident_edges.get(vertex, ()))
+
+    def get_outgoing_edges(self, vertex: Vertex) -> Sequence[Edge]:
+        return list(self._outgoing_edges.get(vertex, ()))
+
+    def get_incoming_edges(self, vertex: Vertex) -> Sequence[Edge]:
+        return list(self._incoming_edges.get(vertex, ()))
+
     def get_edges_connecting_vertices(self, vertex_one: Vertex, vertex_two: Vertex) -> Sequence[Edge]:
+        if vertex_one is None:
+            vertex_one, vertex_two = vertex_two, vertex_one
+
+        # Edges whose vertices were both removed aren't indexed under any vertex
+        candidate_edges = self.edges if vertex_one is None else self._incident_edges.get(vertex_one, ())
+
         edges = []
-        for edge in self.edges:
+        for edge in candidate_edges:
             if (edge.vertex_one == vertex_one and edge.vertex_two == vertex_two) or (
                 edge.vertex_one == vertex_two and edge.vertex_two == vertex_one
             ):
@@ -490,33 +683,66 @@ class Graph(CustomVMobject):
 
         return edges_to_from[0]
 
-    def get_vertices_with_no_incoming_edges(self):
-        vertices_with_no_incoming_edges = []
-        for vertex in self.vertices:
-            for edge in self.edges:
-                if vertex is edge.vertex_one and edge.directedness.startswith("<"):
-                    break
-
-                if vertex is edge.vertex_two and edge.directedness.endswith(">"):
-                    break
-            else:
-                vertices_with_no_incoming_edges.append(vertex)
+    def get_in_degree(self, vertex: Vertex) -> int:
+        return len(self._incoming_edges.get(vertex, ()))
 
-        return vertices_with_no_incoming_edges
+    def get_out_degree(self, vertex: Vertex) -> int:
+        return len(self._outgoing_edges.get(vertex, ()))
+
+    # A vertex is only indexed while it has edges, see ``_unindex_edge``
+    def get_vertices_with_no_incoming_edges(self):
+        return [vertex for vertex in self.vertices if vertex not in self._incoming_edges]
 
     def get_vertices_with_no_outgoing_edges(self):
-        vertices_with_no_outgoing_edges = []
-        for vertex in self.vertices:
-            for edge in self.edges:
-                if vertex is edge.vertex_one and edge.directedness.endswith(">"):
-                    break
-
-                if vertex is edge.vertex_two and edge.directedness.startswith("<"):
-                    break
-            else:
-                vertices_with_no_outgoing_edges.append(vertex)
+        return [vertex for vertex in self.vertices if vertex not in self._outgoing_edges]
+
+    def _index_vertex_label(self, vertex: Vertex) -> None:
+        self.structure_version += 1
+        try:
+            self._vertices_by_label.setdefault(vertex.label, {})[vertex] = None
+        except (AttributeError, TypeError):
+            self._unindexed_vertices[vertex] = None
+
+    def _unindex_vertex_label(self, vertex: Vertex) -> None:
+        self.structure_version += 1
+        if self._unindexed_vertices.pop(vertex, ...) is None:
+            return
+
+        vertices_with_label = self._vertices_by_label.get(vertex.label, {})
+        vertices_with_label.pop(vertex, None)
+        if not vertices_with_label:
+            self._vertices_by_label.pop(vertex.label, None)
+
+    def _index_edge(self, edge: Edge) -> None:
+        self.structure_version += 1
+        for vertex in (edge.vertex_one, edge.vertex_two):
+            if vertex is not None:
+                self._incident_edges.setdefault(vertex, {})[edge] = None
+
+        for from_, to, is_directed in (
+            (edge.vertex_one, edge.vertex_two, edge.directedness.endswith(">")),
+            (edge.vertex_two, edge.vertex_one, edge.directedness.startswith("<")),
+        ):
+            if not is_directed:
+                continue
+
+            if from_ is not None:
+                self._outgoing_edges.setdefault(from_, {})[edge] = None
 
-        return vertices_with_no_outgoing_edges
+            if to is not None:
+                self._incoming_edges.setdefault(to, {})[edge] = None
+
+    def _unindex_edge(self, edge: Edge) -> None:
+        self.structure_version += 1
+        for index in (self._incident_edges, self._outgoing_edges, self._incoming_edges):
+            for vertex in (edge.vertex_one, edge.vertex_two):
+                vertex_edges = index.get(vertex)
+                if vertex_edges is None:
+                    continue
+
+                vertex_edges.pop(edge, None)
+                if not vertex_edges:
+                    del index[vertex]
 
 
 class LabeledLine(CustomVMobject):
@@ -591,6 +817,17 @@ class LabeledLine(CustomVMobject):
             self.pointee.get_boundary_point(-self.line.get_unit_vector()),
         )
 
+    @property
+    def line_mob_connecting_point(self) -> np.ndarray:
+        """The point of the pointee the line ends at.
+
+        It's the anchor of the pointee furthest back along the line, which is where
+        :attr:`line_mob_connecting_proportion` is along the pointee, without searching the pointee for that
+        proportion. For a circle, that's the anchor closest to the exact boundary point rather than the boundary point
+        itself, as pointers have always ended there.
+        """
+        return self.pointee.get_boundary_point(-self.line.get_unit_vector())
+
     @property
     def start(self) -> Iterable[float]:
         return self.line.get_start()
@@ -627,13 +864,19 @@ class LabeledLine(CustomVMobject):
         self.line.put_start_and_end_on(new_start, new_end)
         self.update()
 
+    def get_updater_dependencies(self) -> Iterable[Mobject]:
+        try:
+            return [self.pointee]
+        except AttributeError:
+            return []  # Given both ends as coordinates, so it has no updaters
+
     def line_updater(self, line):
-        current_end = line.get_end()
-        new_end = self.pointee.point_from_proportion(
-            self.line_mob_connecting_proportion,
-        )
-        line.shift(new_end - current_end)
+        line.shift(self.line_mob_connecting_point - line.get_end())
 
     def label_updater(self, label) -> None:
         label.move_to(self.line.get_start())
         label.shift(-self.line.get_unit_vector() * self.label_dist)
+
+
+def _is_circle(mobject: Mobject) -> bool:
+    return isinstance(mobject, Circle) and math.isclose(mobject.width, mobject.height)
@@ -12,10 +12,16 @@ from manim import WHITE
 from manim.mobject.mobject import _AnimationBuilder
 
 from code_curator.animations.singly_linked_list.transform_sll import TransformSinglyLinkedList
+from code_curator.custom_vmobject import copy_on_write
 from code_curator.custom_vmobject import CustomVMobject
+from code_curator.custom_vmobject import force_update_each
+from code_curator.custom_vmobject import get_updater_dependents
+from code_curator.custom_vmobject import get_written_mobjects
+from code_curator.custom_vmobject import writes
 from code_curator.data_structures.graph import Edge
 from code_curator.data_structures.graph import Graph
 from code_curator.data_structures.graph import LabeledLine
+from code_curator.data_structures.graph import update_edges
 from code_curator.data_structures.graph import Vertex
 
 if TYPE_CHECKING:
@@ -49,12 +55,16 @@ class SinglyLinkedList(CustomVMobject):
         self.graph = Graph()
         self.color = color
         self.labeled_pointers: dict[Hashable, LabeledLine] = {}
+        # Cached ends of the list, checked against the structure of the graph whenever it changed since, see
+        # ``_refresh_ends``
         self._head: Node | None = None
+        self._tail: Node | None = None
+        self._null: Node | None = None
+        self._ends_version = self.graph.structure_version
 
         self.add(self.graph)
 
-        for index, value in enumerate(values):
-            self.insert_node(index, value)
+        self.extend(values, center=False)
 
         self.move_to(ORIGIN)
 
@@ -81,6 +91,7 @@ class SinglyLinkedList(CustomVMobject):
 
     @property
     def head(self) -> Node | None:
+        self._refresh_ends()
         if self._head is None:
             return None
 
@@ -93,13 +104,22 @@ class SinglyLinkedList(CustomVMobject):
 
     @property
     def tail(self) -> Node | None:
-        try:
-            return self.get_node(-1)
-        except IndexError:
-            if self.has_null:
-                return self.null
+        self._refresh_ends()
+        if self._tail is not None:
+            return self._tail
 
-            return None
+        null = self.null
+        trav = self.head
+        if trav is None or trav is null:
+            return null
+
+        next_node = self.get_next(trav)
+        while next_node is not None and next_node is not null:
+            trav = next_node
+            next_node = self.get_next(trav)
+
+        self._tail = trav
+        return self._tail
 
     @property
     def values(self):
@@ -111,8 +131,9 @@ class SinglyLinkedList(CustomVMobject):
             return []
 
         nodes = []
+        null = self.null
         trav = self.head
-        while trav is not self.null:
+        while trav is not null:
             nodes.append(trav)
             trav = self.get_next(trav)
 
@@ -142,10 +163,8 @@ class SinglyLinkedList(CustomVMobject):
 
     @property
     def null(self):
-        try:
-            return [vertex for vertex in self.graph.vertices if vertex.contents == "null"][0]
-        except IndexError:
-            return None
+        self._refresh_ends()
+        return self._null
 
     @property
     def has_null(self) -> bool:
@@ -187,6 +206,8 @@ class SinglyLinkedList(CustomVMobject):
             null = self.create_node("null", position_relative_to=position_relative_to, position=ORIGIN)
             self.graph.add_vertex(null)
 
+        self._null = null
+
         if center:
             self.move_to(ORIGIN)
 
@@ -276,6 +297,25 @@ class SinglyLinkedList(CustomVMobject):
             else:
                 raise NotImplementedError(f"Removal of mobject {mob} from SLL not yet supported")
 
+    def _refresh_ends(self) -> None:
+        """Forget the ends of the list found before the structure of the graph last changed.
+
+        The graph counts every change to its vertices and to the vertices of its edges, including those not made
+        through this list, like ``edge.vertex_two = node`` or ``sll.graph.remove(node)``.
+        """
+        if self._ends_version == self.graph.structure_version:
+            return
+
+        self._ends_version = self.graph.structure_version
+        self._tail = None
+        if self._null is not None and self._null not in self.graph.vertices:
+            self._null = None
+
+        if self._head is not None and self._head not in self.graph.vertices:
+            # Removed through the graph, which leaves whatever followed it without anything before it
+            heads = [vertex for vertex in self.graph.get_vertices_with_no_incoming_edges() if vertex is not self._null]
+            self._head = heads[0] if heads else self._null
+
     def get_node(self, index: int) -> Node:
         return self.nodes[index]
 
@@ -286,7 +326,7 @@ class SinglyLinkedList(CustomVMobject):
         return self.graph.get_edge_from_to(node, self.get_next(node))
 
     def get_next(self, curr_node):
-        for edge in self.graph.edges:
+        for edge in self.graph.get_outgoing_edges(curr_node):
             if curr_node is edge.vertex_one and edge.directedness.endswith(">"):
                 return edge.vertex_two
 
@@ -315,7 +355,7 @@ class SinglyLinkedList(CustomVMobject):
         edge.suspend_updating()
 
     def get_prev(self, curr_node):
-        for edge in self.graph.edges:
+        for edge in self.graph.get_incoming_edges(curr_node):
             if curr_node is edge.vertex_one and edge.directedness.startswith("<"):
                 return edge.vertex_two
 
@@ -347,6 +387,12 @@ class SinglyLinkedList(CustomVMobject):
     def get_labeled_pointer(self, name: str) -> LabeledLine:
         return self.graph.get_labeled_pointer(name)
 
+    # Only the pointer moves, so animating it doesn't copy the rest of the list
+    @writes(
+        lambda sll, pointer, *args, **kwargs: [
+            sll.get_labeled_pointer(pointer) if isinstance(pointer, str) else pointer,
+        ],
+    )
     def move_labeled_pointer(
         self,
         pointer: str | LabeledLine,
@@ -366,25 +412,42 @@ class SinglyLinkedList(CustomVMobject):
         labeled_pointer.force_update()
 
     def shrink_pointer(self, pointer: Edge) -> tuple[SinglyLinkedList, Animation]:
-        node_index: int = self.get_next_pointers_node_index(pointer)
-
-        copy = self._create_animation_copy()
-        start = self.get_node(node_index).next_pointer.get_start()
-        copy.get_node(node_index).next_pointer.put_start_and_end_on(start, start)
-        return copy, TransformSinglyLinkedList(
-            self,
-            copy,
-        )
+        # Only the pointer changes, so the rest of the list is shared with the target rather than copied
+        self.target, (target_pointer,) = copy_on_write(self, [pointer])
+        start = pointer.get_start()
+        target_pointer.put_start_and_end_on(start, start)
+        return self.target, TransformSinglyLinkedList(self, [])
 
     def flatten(self, center: bool = True) -> None:
+        moved_nodes = []
+        straightened_edges = []
         if self.has_head:
-            trav = self.get_next(self.head)
-            while trav is not None:
-                trav.move_to(self.get_prev(trav).get_center() + np.array([RELATIVE_POSITION]))
-                self.get_next_pointer(self.get_prev(trav)).set_path_arc(0)
-                trav = self.get_next(trav)
-
-        self.force_update()
+            nodes = [self.head]
+            while self.get_next(nodes[-1]) is not None:
+                nodes.append(self.get_next(nodes[-1]))
+
+            # Every node is placed relative to the head in one go, rather than relative to the previous node
+            centers = np.array([node.get_center() for node in nodes])
+            shifts = centers[0] + np.outer(np.arange(len(nodes)), RELATIVE_POSITION) - centers
+            for node, shift in zip(nodes[1:], shifts[1:]):
+                if shift.any():
+                    node.shift(shift)
+                    moved_nodes.append(node)
+
+            for node in nodes[:-1]:
+                next_pointer = self.get_next_pointer(node)
+                if next_pointer.line.path_arc != 0:
+                    next_pointer.set_path_arc(0)
+                    straightened_edges.append(next_pointer)
+
+        # The head and tail pointers follow the ends of the list, after which only what depends on the nodes that
+        # moved has to follow them
+        force_update_each([self])
+        dependents = [
+            dependent for submob in self.submobjects for dependent in get_updater_dependents(submob, moved_nodes)
+        ]
+        update_edges({edge: None for edge in [*straightened_edges, *dependents] if isinstance(edge, Edge)})
+        force_update_each(mob for mob in dependents if not isinstance(mob, Edge))
 
         if center:
             self.move_to(ORIGIN)
@@ -432,6 +495,45 @@ class SinglyLinkedList(CustomVMobject):
 
         self.flatten(center=center)
 
+    def extend(self, values: Iterable, center: bool = True) -> None:
+        """Append a node for each of ``values`` to the end of the list.
+
+        Unlike calling :meth:`insert_node` for each value, every node and edge is created at once and the list is
+        laid out and updated a single time, so building a list is linear in its length.
+
+        Args:
+            values: The values of the nodes to append, in order.
+            center: Whether to move the list to the origin afterwards.
+        """
+        new_nodes = [self.create_node(value) for value in values]
+        if not new_nodes:
+            return
+
+        nodes = self.nodes
+        prev_node = nodes[-1] if nodes else None
+        null = self.null
+
+        # Placed before their edges are created so that no edge starts out with both ends at the same point
+        first_center = ORIGIN if prev_node is None else prev_node.get_center() + np.array(RELATIVE_POSITION)
+        centers = first_center + np.outer(np.arange(len(new_nodes)), RELATIVE_POSITION)
+        for node, node_center in zip(new_nodes, centers):
+            node.move_to(node_center)
+
+        if prev_node is None:
+            self._head = new_nodes[0]
+            self.graph.add_vertex(new_nodes[0])
+        else:
+            self.set_next(prev_node, new_nodes[0])
+
+        for node, next_node in zip(new_nodes, new_nodes[1:]):
+            self.add_edge(node, next_node).suspend_updating()
+
+        if null is not None:
+            null.move_to(centers[-1] + RELATIVE_POSITION)
+            self.set_next(new_nodes[-1], null)
+
+        self.flatten(center=center)
+
     def remove_node(self, node: int | Node, center: bool = True) -> None:
         # Can be given index or Node instance
         if isinstance(node, int):
@@ -530,15 +632,42 @@ class Node(Vertex):
     @property
     def next_pointer(self) -> Edge:
         try:
-            return [edge for edge in self.edges if edge.vertex_one is self][0]
+            return self.sll.get_next_pointer(self)
         except IndexError:
             pass  # The last node has no next pointer
 
 
 class AnimationBuilder(_AnimationBuilder):
+    """Build the target of an animation out of :func:`~custom_vmobject.copy_on_write` rather than a full copy.
+
+    Only the members of the family the chained methods declare they change, with
+    :func:`~custom_vmobject.writes`, are copied, and the rest of the family is shared with the target. A method
+    declaring nothing changes the whole family, which is then copied as it would be by
+    :meth:`~.Mobject.generate_target`. When a chained method changes members that weren't copied yet, the target is
+    copied again with them and the earlier methods are applied to it again.
+    """
+
+    def __init__(self, mobject) -> None:
+        # ``_AnimationBuilder.__init__`` isn't called as it copies the whole family into the target
+        self.mobject = mobject
+        # An earlier target isn't copied along with ``mobject``
+        self.mobject.target = None
+
+        self.overridden_animation = None
+        self.is_chaining = False
+        self.methods = []
+
+        # Whether animation args can be passed
+        self.cannot_pass_args = False
+        self.anim_args = {}
+
+        self._family_members_by_id = {str(id(mob)): mob for mob in mobject.get_family()}
+        self._written: list[Mobject] = []
+        self._written_family_ids: set[int] = set()
+        self._target_submobjects_by_original_id: dict[str, Mobject] | None = None
+
     def __getattr__(self, method_name) -> types.MethodType:
-        method = getattr(self.mobject.target, method_name)
-        has_overridden_animation = hasattr(method, "_override_animate")
+        has_overridden_animation = hasattr(getattr(self.mobject, method_name), "_override_animate")
 
         if (self.is_chaining and has_overridden_animation) or self.overridden_animation:
             raise NotImplementedError(
@@ -547,51 +676,28 @@ class AnimationBuilder(_AnimationBuilder):
 
         def update_target(*method_args, **method_kwargs):
             if has_overridden_animation:
-                self.overridden_animation = method._override_animate(
+                self.overridden_animation = getattr(self.mobject, method_name)._override_animate(
                     self.mobject,
                     *method_args,
                     anim_args=self.anim_args,
                     **method_kwargs,
                 )
             else:
-                # We apply the requested method to the target, hence the reason ``method`` is bound to ``self.mobject.target``.
-                # Additionally, any argument from ``method_args`` and ``method_kwargs`` that is a mobject a submobject
-                # of ``self.mobject`` needs to be changed to the corresponding submobject from ``self.mobject.target``.
-                self.methods.append([method, method_args, method_kwargs])
-                method_args_with_target_submobjects = []
-
-                for positional_arg in method_args:
-                    if not isinstance(positional_arg, Mobject):
-                        method_args_with_target_submobjects.append(positional_arg)
-                        continue
-
-                    for target_sm in self.mobject.target.get_family():
-                        try:
-                            if target_sm.original_id == str(id(positional_arg)):
-                                method_args_with_target_submobjects.append(target_sm)
-                                break
-                        except AttributeError:
-                            continue  # sm in target is new and thus not present in self.mobject
-                    else:
-                        # ``positional_arg`` is not yet a submobject of ``self.mobject``
-                        method_args_with_target_submobjects.append(positional_arg)
-
-                for key, value in method_kwargs.items():
-                    if not isinstance(value, Mobject):
-                        continue
-
-                    for target_sm in self.mobject.target.get_family():
-                        try:
-                            if target_sm.original_id == str(id(value)):
-                                method_kwargs[key] = target_sm
-                                break
-                        except AttributeError:
-                            continue  # sm in target is new and thus not present in self.mobject
-                    else:
-                        # ``value`` is not yet a submobject of ``self.mobject``
-                        method_kwargs[key] = value
-
-                method(*method_args_with_target_submobjects, **method_kwargs)
+                # What a method changes is found from the state the earlier methods left the target in
+                if self.mobject.target is None:
+                    written = get_written_mobjects(getattr(self.mobject, method_name), method_args, method_kwargs)
+                else:
+                    written = get_written_mobjects(
+                        getattr(self.mobject.target, method_name),
+                        *self._get_target_arguments(method_args, method_kwargs),
+                    )
+
+                newly_written = [mob for mob in map(self._get_original, written) if mob is not None]
+                if self.mobject.target is None or any(id(mob) not in self._written_family_ids for mob in newly_written):
+                    self._copy_target(newly_written)
+
+                self.methods.append([getattr(self.mobject.target, method_name), method_args, method_kwargs])
+                self._apply(self.methods[-1])
 
             return self
 
@@ -600,6 +706,73 @@ class AnimationBuilder(_AnimationBuilder):
 
         return update_target
 
+    def get_target_submobjects_by_original_id(self) -> dict[str, Mobject]:
+        """Get the members of the family of the target by the id of the member of ``self.mobject`` they copy.
+
+        Members shared with ``self.mobject`` are left out, as they are the same mobject in both. Built once per
+        target and reused by every chained call, rather than searching the family of the target for every mobject
+        passed to a method.
+        """
+        if self._target_submobjects_by_original_id is None:
+            self._target_submobjects_by_original_id = {}
+            for target_sm in self.mobject.target.get_family():
+                if str(id(target_sm)) in self._family_members_by_id:
+                    continue  # sm is shared with self.mobject
+
+                try:
+                    original_id = target_sm.original_id
+                except AttributeError:
+                    continue  # sm in target is new and thus not present in self.mobject
+
+                self._target_submobjects_by_original_id.setdefault(original_id, target_sm)
+
+        return self._target_submobjects_by_original_id
+
+    def _get_original(self, mobject: Mobject) -> Mobject | None:
+        """Get the member of ``self.mobject`` that ``mobject``, a member of it or of the target, is or copies."""
+        if str(id(mobject)) in self._family_members_by_id:
+            return mobject
+
+        # A mobject that copies nothing in ``self.mobject`` is new to the target
+        return self._family_members_by_id.get(getattr(mobject, "original_id", None))
+
+    def _copy_target(self, newly_written: Iterable[Mobject]) -> None:
+        """Copy the target again with ``newly_written`` along with what was already written, and catch it up."""
+        for mob in newly_written:
+            if id(mob) not in self._written_family_ids:
+                self._written.append(mob)
+                self._written_family_ids.update(id(member) for member in mob.get_family())
+
+        # Neither is the earlier target copied along with ``self.mobject``, and methods declaring that they change
+        # nothing still mustn't change ``self.mobject`` through the target
+        self.mobject.target = None
+        self.mobject.target, _ = copy_on_write(self.mobject, self._written or [self.mobject])
+        self._target_submobjects_by_original_id = None
+        self.methods = [
+            [method.__func__.__get__(self.mobject.target), method_args, method_kwargs]
+            for method, method_args, method_kwargs in self.methods
+        ]
+        for method_call in self.methods:
+            self._apply(method_call)
+
+    def _get_target_arguments(self, method_args, method_kwargs) -> tuple[list, dict]:
+        """Change each mobject of ``self.mobject`` passed to a method to its copy in the target, if it has one."""
+        target_submobjects = self.get_target_submobjects_by_original_id()
+
+        def to_target(arg):
+            # A mobject that isn't in the target is shared with it, or is not yet a submobject of ``self.mobject``
+            return target_submobjects.get(str(id(arg)), arg) if isinstance(arg, Mobject) else arg
+
+        return [to_target(arg) for arg in method_args], {key: to_target(value) for key, value in method_kwargs.items()}
+
+    def _apply(self, method_call: list) -> None:
+        # We apply the requested method to the target, hence the reason ``method`` is bound to ``self.mobject.target``.
+        # Additionally, any argument from ``method_args`` and ``method_kwargs`` that is a mobject a submobject
+        # of ``self.mobject`` needs to be changed to the corresponding submobject from ``self.mobject.target``.
+        method, method_args, method_kwargs = method_call
+        target_args, target_kwargs = self._get_target_arguments(method_args, method_kwargs)
+        method(*target_args, **target_kwargs)
+
     def build(self) -> Animation:
         if self.overridden_animation:
             anim = self.overridden_animation
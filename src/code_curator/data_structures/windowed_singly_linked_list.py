@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+from typing import TYPE_CHECKING
+
+import numpy as np
+from manim import config
+from manim import DOWN
+from manim import LEFT
+from manim import ORIGIN
+from manim import RIGHT
+from manim import WHITE
+
+from code_curator.custom_vmobject import CustomVMobject
+from code_curator.data_structures.element import Element
+from code_curator.data_structures.graph import update_edges
+from code_curator.data_structures.singly_linked_list import RELATIVE_POSITION
+from code_curator.data_structures.singly_linked_list import SinglyLinkedList
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from colour import Color
+    from manim.typing import Vector
+    from code_curator.data_structures.singly_linked_list import Node
+
+
+DEFAULT_WINDOW_MARGIN = 1
+
+
+class WindowedSinglyLinkedList(CustomVMobject):
+    def __init__(
+        self,
+        *values,
+        color: str | Color = WHITE,
+        window_size: int | None = None,
+    ) -> None:
+        """Show a window of a long singly linked list, with an ellipsis in place of the nodes on either side of it.
+
+        Only the nodes inside the window exist as mobjects, so the cost of creating, updating and rasterizing the
+        list is bounded by the size of the window rather than the length of the list. Nodes leaving the window are
+        recycled for the values entering it, while the values of the whole list are kept.
+
+        Args:
+            values: The values of the whole list.
+            color: Color of the nodes, edges, pointers and ellipses.
+            window_size: Maximum number of nodes shown at once. Defaults to as many as fit in the frame, plus a
+                node on either side.
+        """
+        super().__init__()
+        self.color = color
+        self.window_size = window_size if window_size is not None else get_default_window_size()
+        self.window_start = 0
+        self._values = list(values)
+        self.pointer_indices: dict[str, int] = {}
+        self.pointer_directions: dict[str, Vector] = {}
+
+        self.sll = SinglyLinkedList(*self._values[: self.window_size], color=color)
+        self.leading_ellipsis = Element(r"\dots", color=color)
+        self.trailing_ellipsis = Element(r"\dots", color=color)
+
+        self.add(self.sll)
+        self._update_ellipses()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __str__(self) -> str:
+        return str(self.sll)
+
+    @property
+    def values(self) -> list[Any]:
+        return list(self._values)
+
+    @property
+    def window_stop(self) -> int:
+        return min(self.window_start + self.window_size, len(self._values))
+
+    @property
+    def nodes(self) -> list[Node]:
+        """The nodes inside the window."""
+        return self.sll.nodes
+
+    def is_visible(self, index: int) -> bool:
+        return self.window_start <= index < self.window_stop
+
+    def get_node(self, index: int) -> Node | None:
+        """Get the node at ``index`` of the whole list, or ``None`` if it's outside the window."""
+        if not self.is_visible(index):
+            return None
+
+        return self.sll.get_node(index - self.window_start)
+
+    def scroll_to(self, start: int) -> None:
+        """Move the window to start at index ``start`` of the list.
+
+        Nodes still inside the window are kept, and the ones leaving it are given the values entering it.
+        """
+        start = max(0, min(start, len(self._values) - self.window_size))
+        if start == self.window_start:
+            return
+
+        old_nodes = dict(zip(range(self.window_start, self.window_stop), self.sll.nodes))
+        self.window_start = start
+        self._show(old_nodes)
+        self._update_window()
+
+    def scroll_into_view(self, index: int) -> None:
+        """Move the window as little as possible for it to show the node at ``index``."""
+        if index < self.window_start:
+            self.scroll_to(index)
+        elif index >= self.window_stop:
+            self.scroll_to(index - self.window_size + 1)
+
+    def insert_node(self, index: int, value) -> None:
+        positive_index = index if index >= 0 else len(self._values) + index
+        if positive_index < 0 or positive_index > len(self._values):
+            raise IndexError(f"Index {index} is invalid for length {len(self._values)}")
+
+        old_nodes = dict(zip(range(self.window_start, self.window_stop), self.sll.nodes))
+        self._values.insert(positive_index, value)
+        self._shift_pointer_indices(positive_index, 1)
+
+        if positive_index < self.window_start:
+            # The nodes in the window keep their place in the list
+            self.window_start += 1
+        elif positive_index < self.window_start + self.window_size:
+            # The node pushed out of the window, if any, is recycled for the inserted value
+            self._show(
+                {
+                    node_index if node_index < positive_index else node_index + 1: node
+                    for node_index, node in old_nodes.items()
+                },
+            )
+
+        self._update_window()
+
+    def remove_node(self, index: int) -> None:
+        """Remove the value at ``index`` of the list, along with the labeled pointers pointing at it.
+
+        The value after the window takes the place of the removed one, or, at the end of the list, the value before
+        the window does, so the window stays full for as long as the list is long enough.
+        """
+        positive_index = index if index >= 0 else len(self._values) + index
+        if positive_index < 0 or positive_index >= len(self._values):
+            raise IndexError(f"Index {index} is invalid for length {len(self._values)}")
+
+        removed_labels = [
+            label for label, pointer_index in self.pointer_indices.items() if pointer_index == positive_index
+        ]
+        for label in removed_labels:
+            self.remove_labeled_pointer(label)
+
+        old_nodes = dict(zip(range(self.window_start, self.window_stop), self.sll.nodes))
+        del self._values[positive_index]
+        self._shift_pointer_indices(positive_index, -1)
+
+        if positive_index < self.window_start:
+            self.window_start -= 1
+        elif positive_index in old_nodes:
+            if self.window_start > 0 and self.window_stop - self.window_start < self.window_size:
+                self.window_start -= 1
+
+            # The removed node is recycled for the value entering the window, if any
+            self._show(
+                {
+                    node_index if node_index < positive_index else node_index - 1: node
+                    for node_index, node in old_nodes.items()
+                    if node_index != positive_index
+                },
+            )
+
+        self._update_window()
+
+    def add_labeled_pointer(self, index: int, label: str, direction: Vector = DOWN) -> None:
+        """Point ``label`` at the node at ``index``, scrolling the window to show it."""
+        self.pointer_indices[label] = index
+        self.pointer_directions[label] = direction
+        self.scroll_into_view(index)
+        self._update_window()
+
+    def move_labeled_pointer(self, label: str, index: int) -> None:
+        """Point ``label`` at the node at ``index`` instead, scrolling the window to show it."""
+        self.pointer_indices[label] = index
+        self.scroll_into_view(index)
+        self._update_window()
+
+    def remove_labeled_pointer(self, label: str) -> None:
+        del self.pointer_indices[label]
+        del self.pointer_directions[label]
+        if label in self.sll.graph.labeled_pointers:
+            self.sll.graph.remove_labeled_pointer(label)
+
+    def extend(self, values: Iterable) -> None:
+        values = list(values)
+        window_stop = self.window_stop
+        self._values.extend(values)
+        self.sll.extend(self._values[window_stop : self.window_stop], center=False)
+        self._update_window()
+
+    def _shift_pointer_indices(self, from_index: int, offset: int) -> None:
+        for label, pointer_index in self.pointer_indices.items():
+            if pointer_index >= from_index:
+                self.pointer_indices[label] = pointer_index + offset
+
+    def _show(self, kept_nodes: dict[int, Node]) -> None:
+        """Make the nodes of the list show the values inside the window, recycling the nodes that left it.
+
+        Every node not in ``kept_nodes`` is given a value entering the window and moved in place of it, so nodes are
+        only created when the window grows and only removed when it shrinks.
+
+        Args:
+            kept_nodes: The nodes already showing the value at their index of the whole list, by that index, laid out
+                in order. Those whose index is outside the window are recycled too.
+        """
+        graph = self.sll.graph
+        kept_nodes = {index: node for index, node in kept_nodes.items() if self.is_visible(index)}
+        recycled_nodes = iter([node for node in self.sll.nodes if node not in kept_nodes.values()])
+        anchor_index, anchor = next(iter(kept_nodes.items()), (self.window_start, None))
+        anchor_center = ORIGIN if anchor is None else anchor.get_center()
+
+        nodes = []
+        for index in range(self.window_start, self.window_stop):
+            node = kept_nodes.get(index)
+            if node is None:
+                node = next(recycled_nodes, None)
+                if node is None:
+                    node = graph.add_vertex(self.sll.create_node(self._values[index]))
+                else:
+                    node.set_contents(self._values[index])
+
+                node.move_to(anchor_center + (index - anchor_index) * np.array(RELATIVE_POSITION))
+
+            nodes.append(node)
+
+        for node, next_node in zip(nodes, nodes[1:]):
+            self.sll.set_next(node, next_node)
+
+        if nodes:
+            graph.remove(*graph.get_outgoing_edges(nodes[-1]))
+
+        for node in recycled_nodes:
+            graph.remove(*graph.get_incident_edges(node))
+            graph.remove(node)
+
+        # Edges whose nodes were both recycled are still connected to the same nodes, which have moved since
+        update_edges([self.sll.get_next_pointer(node) for node in nodes[:-1]])
+
+    def _update_window(self) -> None:
+        self.sll.move_to(ORIGIN)
+        self._update_pointers()
+        self._update_ellipses()
+
+    def _update_pointers(self) -> None:
+        """Show the pointers to nodes inside the window and hide the others."""
+        labeled_pointers = self.sll.graph.labeled_pointers
+        for label, index in self.pointer_indices.items():
+            node = self.get_node(index)
+            if node is None:
+                if label in labeled_pointers:
+                    self.sll.graph.remove_labeled_pointer(label)
+            elif label in labeled_pointers:
+                self.sll.move_labeled_pointer(label, node)
+            else:
+                self.sll.add_labeled_pointer(node, label, direction=self.pointer_directions[label], center=False)
+
+    def _update_ellipses(self) -> None:
+        self.remove(self.leading_ellipsis, self.trailing_ellipsis)
+        nodes = self.sll.nodes
+
+        if self.window_start > 0 and nodes:
+            self.leading_ellipsis.next_to(nodes[0], LEFT)
+            self.add(self.leading_ellipsis)
+
+        if self.window_stop < len(self._values) and nodes:
+            self.trailing_ellipsis.next_to(nodes[-1], RIGHT)
+            self.add(self.trailing_ellipsis)
+
+
+def get_default_window_size(margin: int = DEFAULT_WINDOW_MARGIN) -> int:
+    """Get the number of nodes that fit in the frame, plus ``margin`` nodes on either side."""
+    return math.ceil(config.frame_width / RELATIVE_POSITION[0]) + 2 * margin
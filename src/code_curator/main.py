@@ -6,10 +6,12 @@ from __future__ import annotations
 
 __all__: Sequence[str] = []
 
+import argparse
 import importlib
 import logging
 import os
 import subprocess
+import wave
 import yaml
 from collections.abc import Mapping
 from collections.abc import Sequence
@@ -17,11 +19,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from manim import config
-from moviepy.editor import concatenate_videoclips
-from moviepy.editor import VideoFileClip
-from moviepy.editor import AudioFileClip
-from moviepy.editor import CompositeVideoClip
-from moviepy.editor import CompositeAudioClip
 
 from code_curator.ai_audio_creator import AIAudioCreator
 from code_curator.script_handling.aligned_animation_script import AlignedAnimationScript
@@ -34,6 +31,12 @@ from code_curator.script_handling.components.alignment_script.alignments.alignme
 from code_curator.script_handling.simple_script_parser_factory import (
     SimpleScriptParserFactory,
 )
+from code_curator.rendering.checkpoint import CheckpointStore
+from code_curator.rendering.profiler import PHASES
+from code_curator.rendering.profiler import RenderProfiler
+from code_curator.rendering.segment_cache import SegmentCache
+from code_curator.rendering.segmented_render import render_in_segments
+from code_curator.rendering.tex_cache import TexCache
 
 
 if TYPE_CHECKING:
@@ -122,7 +125,96 @@ def get_script_text_from_animation_script(animation_script_info: Mapping) -> str
     ).strip()
 
 
+def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="curate", description=__doc__)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to render with. The timeline is split into this many segments rendered in parallel.",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=None,
+        help="Number of segments to split the timeline into. Defaults to the number of jobs. More segments let more "
+        "of the video be reused from the cache after an edit.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every segment and parse every Tex instead of reusing the ones from earlier renders.",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=0,
+        help="Save the state of the scene every this many entries of the script, so that later renders, e.g. after "
+        "a crash, fast-forward from there. Checkpoints aren't used when 0.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Write how long each entry of the script took to render, per phase, to this JSON file and log it as a "
+        "table.",
+    )
+    parser.add_argument(
+        "--profile-sort",
+        choices=("total", "frames", "fps", *PHASES),
+        default="total",
+        help="Column to sort the profile by.",
+    )
+    parser.add_argument(
+        "--entry",
+        default=None,
+        help="Only render from when this entry of the script starts until the next entry does.",
+    )
+    parser.add_argument(
+        "--from",
+        dest="start_time",
+        type=float,
+        default=None,
+        help="Only render from this many seconds into the timeline. Takes precedence over the start of --entry.",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end_time",
+        type=float,
+        default=None,
+        help="Only render until this many seconds into the timeline. Takes precedence over the end of --entry.",
+    )
+    return parser.parse_args(args)
+
+
+def get_time_range(
+    args: argparse.Namespace,
+    aligned_animation_script: AlignedAnimationScript,
+) -> tuple[float, float] | None:
+    if args.entry is None and args.start_time is None and args.end_time is None:
+        return None
+
+    start_time, end_time = 0.0, aligned_animation_script.run_time
+    if args.entry is not None:
+        start_time, end_time = aligned_animation_script.get_entry_window(args.entry)
+
+    if args.start_time is not None:
+        start_time = args.start_time
+
+    if args.end_time is not None:
+        end_time = args.end_time
+
+    return start_time, end_time
+
+
+def get_audio_duration(audio_path: str | os.PathLike) -> float:
+    with wave.open(str(audio_path), "rb") as audio_file:
+        return audio_file.getnframes() / audio_file.getframerate()
+
+
 def main() -> None:
+    args = parse_args()
     ai_speech_requested = True
     problem_dir = Path(
         Path.home(),
@@ -138,6 +230,7 @@ def main() -> None:
         PROBLEM_NAME,
     )
 
+    audio_path = None
     if ai_speech_requested:
         script_text = get_script_text_from_animation_script(
             yaml.safe_load(
@@ -163,7 +256,12 @@ def main() -> None:
         aligned_animation_script=aligned_animation_script,
     )
 
-    video_instance = video_cls(animation_script=aligned_animation_script)
+    time_range = get_time_range(args, aligned_animation_script)
+    video_path = Path(
+        Path.home(),
+        "Videos",
+        "FULL_VIDEO.mp4" if time_range is None else f"Video_{time_range[0]:g}-{time_range[1]:g}.mp4",
+    )
 
     # def get_attr(self, attr_name: str):
     #     return getattr(video_instance, attr_name)
@@ -172,31 +270,33 @@ def main() -> None:
     #     stream_cls.__get_attr__ = get_attr
     #     video_instance.__dict__[stream_cls.__name__] = stream_cls
 
-    video_instance.render()
+    # The narration ends with the video
+    audio_start = aligned_animation_script.run_time - get_audio_duration(audio_path) if audio_path is not None else 0.0
+    profiler = RenderProfiler() if args.profile is not None else None
+    render_in_segments(
+        video_cls,
+        aligned_animation_script,
+        output_path=video_path,
+        num_jobs=args.jobs,
+        num_segments=args.segments,
+        segment_cache=None if args.no_cache else SegmentCache.default(),
+        time_range=time_range,
+        checkpoint_store=CheckpointStore.default(args.checkpoint_every) if args.checkpoint_every > 0 else None,
+        audio_path=audio_path,
+        audio_start=audio_start,
+        profiler=profiler,
+        tex_cache=None if args.no_cache else TexCache.default(),
+    )
+
+    if profiler is not None:
+        profiler.write_json(args.profile, sort_by=args.profile_sort)
+        logger.info(f"Render profile:\n{profiler.format_table(sort_by=args.profile_sort)}")
+
     # create_scenes(
     #     scene_classes, problem_dir,
     #     aligned_animation_script.get_scenes(),
     # )
 
-    # Combine video and audio together!
-    video_clip = VideoFileClip(
-        str(
-            Path(
-                Path.cwd() / "media",
-                "videos",
-                f"{RESOLUTION}p{FRAME_RATE}",
-                "Video.mp4",
-            ),
-        ),
-    )
-
-    audio_clip = AudioFileClip(str(audio_path))
-    final_clip = video_clip.set_audio(CompositeAudioClip([audio_clip.set_start(aligned_animation_script.run_time - audio_clip.duration)]))
-    final_clip.write_videofile(
-        str(Path(Path.home(), "Videos", "FULL_VIDEO.mp4")),
-        fps=FRAME_RATE,
-    )
-
 
 def postmortem_main():
     try:
@@ -9,6 +9,11 @@ from manim import VMobject
 
 
 class NullVMobject(VMobject):
+    # Missing like any other attribute, as ``__init__`` doesn't set them, instead of finding the hooks
+    # ``code_curator.boundary_cache`` installs on ``Mobject``
+    points = None
+    submobjects = None
+
     def __init__(self) -> None:
         pass
 
@@ -0,0 +1,164 @@
+"""Checkpoints of the state of a scene at entry boundaries of its script.
+
+Reaching the start of a window means calling every earlier ``Video`` method and finishing its animations. For the
+last windows of a long video that is most of the work. A checkpoint stores the state of the scene right before an
+entry of the script is called so that later renders, e.g. after a crash, continue from there instead.
+
+The key of a checkpoint only covers the entries before it: their names, start times and sources, together with the
+code they rely on. Editing an entry therefore keeps every checkpoint before it usable.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from manim import config
+
+from code_curator.custom_logging.custom_logger import CustomLogger
+from code_curator.rendering.segment_cache import get_code_hash
+from code_curator.rendering.segment_cache import get_method_source
+from code_curator.rendering.state_hash import get_state_attrs
+
+if TYPE_CHECKING:
+    from code_curator.animations.curator_animation import CuratorAnimation
+
+
+logger = CustomLogger.getLogger(__name__)
+
+
+class CheckpointStore:
+    def __init__(self, directory: str | os.PathLike, interval: int = 10) -> None:
+        """Store checkpoints in ``directory``.
+
+        Args:
+            directory: Where to store the checkpoints.
+            interval: Number of entries of the script between two checkpoints.
+        """
+        self.directory = Path(directory)
+        self.interval = interval
+
+    @classmethod
+    def default(cls, interval: int = 10) -> CheckpointStore:
+        return cls(Path(config.media_dir, "curator_cache", "checkpoints"), interval=interval)
+
+    def is_due(self, entry_index: int) -> bool:
+        return entry_index > 0 and entry_index % self.interval == 0
+
+    def has(self, key: str) -> bool:
+        return self._get_path(key).exists()
+
+    def save(self, key: str, curator_animation: CuratorAnimation) -> None:
+        """Store the state of the scene ``curator_animation`` plays under ``key``.
+
+        Scenes holding something that can't be pickled, like a lambda, or nested too deeply to be pickled, are logged
+        and skipped.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(key)
+        temp_path = path.with_name(f"{path.stem}_{os.getpid()}{path.suffix}")
+
+        try:
+            with temp_path.open("wb") as file:
+                _ScenePickler(file, curator_animation).dump(_get_scene_state(curator_animation))
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+            logger.warning(f"Skipping checkpoint as the scene can't be pickled: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        # Renamed once complete so other processes never load a partially written checkpoint
+        os.replace(temp_path, path)
+
+    def load(self, key: str, curator_animation: CuratorAnimation) -> bool:
+        """Restore the state stored under ``key`` into the scene ``curator_animation`` plays.
+
+        Returns:
+            Whether the state was restored. Checkpoints that can't be loaded anymore, e.g. because a class they
+            contain was renamed, are logged and left alone.
+        """
+        try:
+            with self._get_path(key).open("rb") as file:
+                state = _SceneUnpickler(file, curator_animation).load()
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+            logger.warning(f"Ignoring checkpoint {key} as it can't be loaded: {e}")
+            return False
+
+        _set_scene_state(curator_animation, state)
+        return True
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+
+def get_checkpoint_keys(curator_animation: CuratorAnimation) -> list[str]:
+    """Get the key of the checkpoint before each entry of the script ``curator_animation`` plays.
+
+    The key at index ``i`` is the one of the checkpoint taken right before the method at index ``i`` of its
+    ``pending_queue`` is called, so no method may have been called yet.
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        config.frame_width,
+        config.frame_height,
+        # The frames fast-forwarding plays, and therefore the state before each entry, depend on the frame rate
+        config.frame_rate,
+        f"{curator_animation.animation_pool.total_run_time:.6f}",
+        get_code_hash(curator_animation),
+    ):
+        hasher.update(str(part).encode())
+
+    keys = []
+    for method in curator_animation.pending_queue:
+        keys.append(hasher.hexdigest())
+
+        for part in (method.__name__, f"{method.start_alpha:.9f}", get_method_source(method)):
+            hasher.update(str(part).encode())
+
+    return keys
+
+
+def _get_scene_state(curator_animation: CuratorAnimation) -> dict:
+    return {
+        "scene_attrs": get_state_attrs(curator_animation.scene),
+        "submobjects": curator_animation.mobject.submobjects,
+        "animations": list(curator_animation.animation_pool.animations),
+    }
+
+
+def _set_scene_state(curator_animation: CuratorAnimation, state: dict) -> None:
+    curator_animation.scene.__dict__.update(state["scene_attrs"])
+    curator_animation.mobject.submobjects = state["submobjects"]
+    for anim in state["animations"]:
+        curator_animation.animation_pool.schedule(anim)
+
+
+class _ScenePickler(pickle.Pickler):
+    """Pickle the state of a scene without the scene and its top level mobject themselves.
+
+    Both are referenced from all over the state, e.g. by the bound methods used as updaters, and are replaced by the
+    ones of the scene the state is loaded into.
+    """
+
+    def __init__(self, file, curator_animation: CuratorAnimation) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.persistent_ids = {
+            id(curator_animation.scene): "scene",
+            id(curator_animation.mobject): "mobject",
+        }
+
+    def persistent_id(self, obj) -> str | None:
+        return self.persistent_ids.get(id(obj))
+
+
+class _SceneUnpickler(pickle.Unpickler):
+    def __init__(self, file, curator_animation: CuratorAnimation) -> None:
+        super().__init__(file)
+        self.persistent_objects = {
+            "scene": curator_animation.scene,
+            "mobject": curator_animation.mobject,
+        }
+
+    def persistent_load(self, pid: str):
+        return self.persistent_objects[pid]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+from manim import CairoRenderer
+
+from code_curator.rendering.state_hash import hash_mobject_state
+
+
+class CuratorCairoRenderer(CairoRenderer):
+    """Cairo renderer that doesn't rasterize frames again while nothing on screen changes.
+
+    Narration often continues while nothing is animated. During these holds the frame Cairo drew last is sent to the
+    encoder again instead of drawing an identical one. Updaters still run on every frame, so a hold only lasts as
+    long as the hash of everything on screen stays the same.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.previous_state_hash: str | None = None
+
+    def render(self, scene, time, moving_mobjects) -> None:
+        running_entry_names = self._get_running_entry_names(scene)
+        profiler = getattr(scene, "profiler", None)
+        start = perf_counter()
+
+        if running_entry_names is None or running_entry_names:
+            # Hashing is skipped while animating, as the frame is about to change anyway
+            self.previous_state_hash = None
+            super().render(scene, time, moving_mobjects)
+        else:
+            state_hash = "".join(hash_mobject_state(mob) for mob in [*scene.mobjects, *scene.foreground_mobjects])
+            if state_hash != self.previous_state_hash:
+                self.update_frame(scene, moving_mobjects)
+                self.previous_state_hash = state_hash
+
+            self.add_frame(self.get_frame())
+
+        if profiler is not None:
+            profiler.add_frame(running_entry_names or [], perf_counter() - start)
+
+    @staticmethod
+    def _get_running_entry_names(scene) -> list[str] | None:
+        """Get the names of the entries with a running animation, or ``None`` if ``scene`` doesn't play a script."""
+        # Looked up without creating the animation, for scenes rendered by calling ``play`` directly
+        curator_animation = scene.__dict__.get("curator_animation")
+        if curator_animation is None:
+            return None
+
+        return list(dict.fromkeys(anim.method_name for anim in curator_animation.animation_pool.animations))
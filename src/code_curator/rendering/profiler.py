@@ -0,0 +1,118 @@
+"""Attribute the wall-clock time of a render to the entries of its script.
+
+Time is measured per entry and per phase:
+
+* ``call``: calling the ``Video`` method of the entry.
+* ``prepare``: turning what it returned into animations.
+* ``begin``: adding the animations to the scene and beginning them.
+* ``interpolate``: interpolating the animations on every frame.
+* ``finish``: finishing the animations and cleaning them up.
+* ``rasterize``: drawing the frames the animations play in. A frame shared by several entries is split evenly
+  between them. Frames without any animation are attributed to :data:`IDLE_ENTRY_NAME`.
+
+Updaters can't be attributed to an entry, so their time is attributed to :data:`UPDATERS_ENTRY_NAME`.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from contextlib import AbstractContextManager
+
+
+PHASES = ("call", "prepare", "begin", "interpolate", "finish", "updaters", "rasterize")
+IDLE_ENTRY_NAME = "<idle>"
+UPDATERS_ENTRY_NAME = "<updaters>"
+
+
+class RenderProfiler:
+    def __init__(self) -> None:
+        self.seconds: dict[str, dict[str, float]] = {}
+        self.frames: dict[str, int] = {}
+
+    @contextlib.contextmanager
+    def measure(self, entry_name: str, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(entry_name, phase, time.perf_counter() - start)
+
+    def add_time(self, entry_name: str, phase: str, seconds: float) -> None:
+        entry_seconds = self.seconds.setdefault(entry_name, dict.fromkeys(PHASES, 0.0))
+        entry_seconds[phase] += seconds
+
+    def add_frame(self, entry_names: Sequence[str], rasterize_seconds: float) -> None:
+        """Count a frame the animations of ``entry_names`` play in, which took ``rasterize_seconds`` to draw."""
+        entry_names = entry_names or [IDLE_ENTRY_NAME]
+        for entry_name in entry_names:
+            self.frames[entry_name] = self.frames.get(entry_name, 0) + 1
+            self.add_time(entry_name, "rasterize", rasterize_seconds / len(entry_names))
+
+    def merge(self, other: RenderProfiler) -> None:
+        """Add everything ``other`` measured, e.g. in another process, to this profiler."""
+        for entry_name, entry_seconds in other.seconds.items():
+            for phase, seconds in entry_seconds.items():
+                self.add_time(entry_name, phase, seconds)
+
+        for entry_name, frames in other.frames.items():
+            self.frames[entry_name] = self.frames.get(entry_name, 0) + frames
+
+    def get_rows(self, sort_by: str = "total") -> list[dict[str, float | int | str]]:
+        """Get one row per entry, in descending order of ``sort_by``.
+
+        Args:
+            sort_by: Column to sort by: ``"total"``, ``"frames"``, ``"fps"`` or one of :data:`PHASES`.
+        """
+        rows = []
+        for entry_name, entry_seconds in self.seconds.items():
+            total = sum(entry_seconds.values())
+            frames = self.frames.get(entry_name, 0)
+            rows.append(
+                {
+                    "entry": entry_name,
+                    **entry_seconds,
+                    "total": total,
+                    "frames": frames,
+                    "fps": frames / total if total > 0 else 0.0,
+                },
+            )
+
+        return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+    def write_json(self, path: str | os.PathLike, sort_by: str = "total") -> None:
+        Path(path).write_text(json.dumps(self.get_rows(sort_by), indent=4), encoding="utf-8")
+
+    def format_table(self, sort_by: str = "total") -> str:
+        columns = ("entry", *PHASES, "total", "frames", "fps")
+        lines = [
+            [
+                str(row[column]) if column in ("entry", "frames") else f"{row[column]:.3f}"
+                for column in columns
+            ]
+            for row in self.get_rows(sort_by)
+        ]
+
+        widths = [max([len(column), *(len(line[index]) for line in lines)]) for index, column in enumerate(columns)]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if index == 0 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(line, widths))
+            )
+            for line in [list(columns), *lines]
+        )
+
+
+def profile(profiler: RenderProfiler | None, entry_name: str, phase: str) -> AbstractContextManager[None]:
+    """Measure the ``phase`` of ``entry_name`` with ``profiler``, or do nothing when it's ``None``."""
+    if profiler is None:
+        return contextlib.nullcontext()
+
+    return profiler.measure(entry_name, phase)
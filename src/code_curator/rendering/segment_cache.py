@@ -0,0 +1,165 @@
+"""On-disk cache of rendered segments.
+
+Manim's own cache is keyed by ``Scene.play`` call, and a whole video is a single call, so any change invalidates all
+of it. Segments are instead keyed by what determines their frames:
+
+* the length of the segment and the output format,
+* the state of the scene when the segment starts, both what is drawn and what the methods may read, and
+* the source of every ``Video`` method with an animation running during the segment, together with when it starts
+  relative to the start of the segment, and
+* the rest of the code the methods rely on: the ``code_curator`` package and the module the ``Video`` is defined in.
+
+Editing one entry of the script therefore only re-renders the segments that entry's animations play in.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from manim import config
+
+from code_curator.rendering.state_hash import hash_scene_state
+
+if TYPE_CHECKING:
+    from code_curator.animations.curator_animation import CuratorAnimation
+
+
+class SegmentCache:
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+
+    @classmethod
+    def default(cls) -> SegmentCache:
+        return cls(Path(config.media_dir, "curator_cache", "segments"))
+
+    def get(self, key: str) -> Path | None:
+        path = self._get_path(key)
+        if not path.exists():
+            return None
+
+        return path
+
+    def put(self, key: str, movie_path: str | os.PathLike) -> Path:
+        """Store a copy of ``movie_path`` under ``key`` and return the path of the copy."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(key)
+
+        # Copy then rename so other processes never see a partially written segment
+        temp_path = path.with_name(f"{path.stem}_{os.getpid()}{path.suffix}")
+        shutil.copyfile(movie_path, temp_path)
+        os.replace(temp_path, path)
+
+        return path
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{config.movie_file_extension}"
+
+
+def get_segment_key(curator_animation: CuratorAnimation) -> str:
+    """Get the cache key of the segment ``curator_animation`` plays.
+
+    ``curator_animation`` must already be fast-forwarded to the start of its window.
+    """
+    timeline_run_time = curator_animation.animation_pool.total_run_time
+
+    def get_relative_start_time(start_alpha: float) -> str:
+        return f"{(start_alpha - curator_animation.window_start_alpha) * timeline_run_time:.6f}"
+
+    hasher = hashlib.sha256()
+    for part in (
+        config.pixel_width,
+        config.pixel_height,
+        config.frame_rate,
+        config.background_color,
+        f"{curator_animation.run_time:.6f}",
+        hash_scene_state(curator_animation.scene, curator_animation.mobject),
+        get_code_hash(curator_animation),
+    ):
+        hasher.update(str(part).encode())
+
+    running_animations = sorted(
+        curator_animation.animation_pool.animations,
+        key=lambda anim: (anim.start_alpha, anim.method_name),
+    )
+    for anim in running_animations:
+        method = getattr(curator_animation.scene, anim.method_name)
+        for part in (
+            anim.method_name,
+            get_method_source(method),
+            get_relative_start_time(anim.start_alpha),
+            anim.run_time,
+        ):
+            hasher.update(str(part).encode())
+
+    for method in curator_animation.pending_queue:
+        if method.start_alpha >= curator_animation.window_end_alpha:
+            break
+
+        for part in (method.__name__, get_method_source(method), get_relative_start_time(method.start_alpha)):
+            hasher.update(str(part).encode())
+
+    return hasher.hexdigest()
+
+
+def get_method_source(method) -> str:
+    try:
+        return inspect.getsource(method)
+    except (OSError, TypeError):
+        # Source isn't available, e.g. for methods defined in an interactive session
+        return method.__func__.__code__.co_code.hex()
+
+
+def get_code_hash(curator_animation: CuratorAnimation) -> str:
+    """Hash the code the methods of the script ``curator_animation`` plays rely on, besides their own sources.
+
+    That is every source file of the ``code_curator`` package, e.g. its data structures, and the module the scene is
+    defined in with the methods of the script left out, e.g. helper methods and the values of module level
+    constants. The methods of the script are left out so that editing one of them keeps the keys of the segments it
+    doesn't play in the same.
+    """
+    try:
+        scene_module_path = inspect.getsourcefile(type(curator_animation.scene))
+    except TypeError:
+        # The scene is defined in an interactive session
+        scene_module_path = None
+
+    scene_module_source = _read_source(scene_module_path)
+    for method_info in curator_animation.animation_script.entries:
+        method = getattr(curator_animation.scene, method_info["name"])
+        scene_module_source = scene_module_source.replace(get_method_source(method), "")
+
+    hasher = hashlib.sha256()
+    hasher.update(_get_package_hash(excluded_path=scene_module_path).encode())
+    hasher.update(scene_module_source.encode())
+    return hasher.hexdigest()
+
+
+@functools.cache
+def _get_package_hash(excluded_path: str | None) -> str:
+    package_dir = Path(__file__).resolve().parents[1]
+    excluded_path = Path(excluded_path).resolve() if excluded_path is not None else None
+
+    hasher = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        if path.resolve() == excluded_path:
+            continue
+
+        hasher.update(path.relative_to(package_dir).as_posix().encode())
+        hasher.update(path.read_bytes())
+
+    return hasher.hexdigest()
+
+
+def _read_source(path: str | None) -> str:
+    if path is None:
+        return ""
+
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return ""
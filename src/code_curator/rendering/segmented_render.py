@@ -0,0 +1,312 @@
+"""Render the timeline of a :class:`~base_scene.BaseScene` as independent time segments in parallel.
+
+A video is played by a single :class:`~animations.curator_animation.CuratorAnimation`, so manim can only ever use
+one core for it. Here the timeline is instead split into frame aligned windows. Every window is rendered by its own
+process, which fast-forwards the scene to the start of its window without rendering and then only rasterizes the
+frames inside of it. The resulting partial movies are then joined without re-encoding, muxing in the narration in
+the same pass.
+
+Segments are stored in a :class:`~rendering.segment_cache.SegmentCache` so later renders only redo the segments whose
+content changed.
+"""
+from __future__ import annotations
+
+import contextlib
+import math
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from manim import config
+from manim import tempconfig
+
+from code_curator.custom_logging.custom_logger import CustomLogger
+from code_curator.rendering.profiler import RenderProfiler
+from code_curator.rendering.segment_cache import get_segment_key
+from code_curator.rendering.tex_cache import enable_tex_cache
+from code_curator.rendering.tex_cache import prewarm_tex_cache
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+    from code_curator.base_scene import BaseScene
+    from code_curator.rendering.checkpoint import CheckpointStore
+    from code_curator.rendering.segment_cache import SegmentCache
+    from code_curator.rendering.tex_cache import TexCache
+
+
+logger = CustomLogger.getLogger(__name__)
+
+
+def split_timeline(
+    run_time: float,
+    frame_rate: float,
+    num_segments: int,
+    snap_to: Sequence[float] = (),
+    time_range: tuple[float, float] | None = None,
+    max_snap_distance: float = 0.25,
+) -> list[tuple[float, float]]:
+    """Split ``run_time`` seconds of timeline into at most ``num_segments`` frame aligned windows.
+
+    Every window starts exactly on a frame so that rendering each of them separately produces the same frames, in
+    the same order, as rendering the whole timeline at once. A window ends half a frame before the next one starts
+    so that the time progression manim creates for it (``np.arange(0, run_time, 1 / frame_rate)``) contains exactly
+    the window's frames regardless of floating point error.
+
+    Args:
+        run_time: Length of the timeline in seconds.
+        frame_rate: Frames per second the timeline will be rendered at.
+        num_segments: Maximum number of windows to create.
+        snap_to: Times, in seconds, windows should preferably start at. Each boundary between two windows is moved
+            to the first frame at or after the closest of these times, if it is close enough. Starting windows where
+            entries of the script start keeps the segments an entry plays in the same when other entries change, so
+            more of them can be reused from the cache.
+        time_range: The ``(start, end)`` times, in seconds, of the only part of the timeline to split. Only the frames
+            a full render would show during it are kept. The whole timeline is split when not given.
+        max_snap_distance: How far a boundary may be moved to snap it, as a fraction of the length of a window.
+            Boundaries without a time of ``snap_to`` that close stay where they are, so windows keep roughly the
+            same length. Below one half, two boundaries can never snap to the same time.
+
+    Returns:
+        The ``(start, end)`` times, in seconds, of each window in the order they are played.
+
+    Raises:
+        ValueError: If ``time_range`` contains no frame.
+    """
+    num_frames = len(np.arange(0, run_time, 1 / frame_rate))
+    first_frame, stop_frame = 0, num_frames
+    if time_range is not None:
+        first_frame, stop_frame = (min(_get_frame_at(time, frame_rate), num_frames) for time in time_range)
+        if stop_frame <= first_frame:
+            raise ValueError(f"No frame is shown between {time_range[0]}s and {time_range[1]}s")
+
+    num_range_frames = stop_frame - first_frame
+    num_segments = max(1, min(num_segments, num_range_frames))
+    frame_boundaries = [
+        first_frame + round(index * num_range_frames / num_segments) for index in range(num_segments + 1)
+    ]
+
+    snap_frames = sorted({_get_frame_at(time, frame_rate) for time in snap_to})
+    snap_frames = [frame for frame in snap_frames if first_frame < frame < stop_frame]
+    if snap_frames:
+        max_snap_frames = max_snap_distance * num_range_frames / num_segments
+        inner_boundaries = set()
+        for boundary in frame_boundaries[1:-1]:
+            closest_frame = min(snap_frames, key=lambda frame: abs(frame - boundary))
+            inner_boundaries.add(closest_frame if abs(closest_frame - boundary) <= max_snap_frames else boundary)
+
+        frame_boundaries = [first_frame, *sorted(inner_boundaries), stop_frame]
+
+    return [
+        (start_frame / frame_rate, (end_frame - 0.5) / frame_rate)
+        for start_frame, end_frame in zip(frame_boundaries, frame_boundaries[1:])
+    ]
+
+
+def render_in_segments(
+    video_cls: type[BaseScene],
+    animation_script,
+    output_path: str | os.PathLike,
+    num_jobs: int = 1,
+    num_segments: int | None = None,
+    segment_cache: SegmentCache | None = None,
+    time_range: tuple[float, float] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    audio_path: str | os.PathLike | None = None,
+    audio_start: float = 0.0,
+    profiler: RenderProfiler | None = None,
+    tex_cache: TexCache | None = None,
+) -> Path:
+    """Render ``video_cls`` playing ``animation_script`` as segments using ``num_jobs`` processes.
+
+    Args:
+        video_cls: The scene to render. It must be importable by the worker processes.
+        animation_script: The script ``video_cls`` plays.
+        output_path: Where to write the final video.
+        num_jobs: Number of processes to render with. Segments are rendered in this process when it is 1.
+        num_segments: Number of windows to split the timeline into. Defaults to ``num_jobs``.
+        segment_cache: Where to look up segments rendered before and store newly rendered ones. Every segment is
+            rendered when not given.
+        time_range: The ``(start, end)`` times, in seconds, of the only part of the timeline to render. Everything
+            before it is fast-forwarded through without rendering. The whole timeline is rendered when not given.
+        checkpoint_store: Where to save checkpoints of the state of the scene and to resume from them. With it, a
+            render that was interrupted only renders the segments that aren't cached yet, each fast-forwarded from
+            the latest checkpoint before it.
+        audio_path: Narration to add to the video. The video is silent when not given.
+        audio_start: Where on the timeline, in seconds, the narration starts. It may be negative to cut off its
+            beginning.
+        profiler: What to attribute the time spent on each entry of ``animation_script`` to, across every
+            process. Segments reused from ``segment_cache`` aren't measured. Nothing is measured when not given.
+        tex_cache: Where to look up the paths of every Tex and store newly parsed ones. The tex strings
+            ``video_cls`` used when it was last rendered are compiled into it in parallel first. Every process
+            parses its Tex itself when not given.
+
+    Returns:
+        The path of the final video.
+    """
+    windows = split_timeline(
+        run_time=animation_script.run_time,
+        frame_rate=config["frame_rate"],
+        num_segments=num_segments or num_jobs,
+        snap_to=[entry["start_time"] for entry in animation_script.entries],
+        time_range=time_range,
+    )
+    if tex_cache is not None:
+        prewarm_tex_cache(tex_cache, video_cls.__name__, num_jobs=num_jobs)
+
+    logger.info(f"Rendering {len(windows)} segments of {video_cls.__name__} with {num_jobs} processes")
+
+    with tempfile.TemporaryDirectory(prefix="curator_segments_") as segments_dir:
+        render_args = (
+            [video_cls] * len(windows),
+            [animation_script] * len(windows),
+            windows,
+            [Path(segments_dir, f"segment_{index:05}") for index, _ in enumerate(windows)],
+            [segment_cache] * len(windows),
+            [checkpoint_store] * len(windows),
+            # Every segment is measured separately, as worker processes can't update ``profiler`` themselves
+            [RenderProfiler() if profiler is not None else None for _ in windows],
+            [tex_cache] * len(windows),
+        )
+        if num_jobs > 1:
+            with ProcessPoolExecutor(max_workers=num_jobs) as executor:
+                results = list(executor.map(_render_segment, *render_args))
+        else:
+            results = list(map(_render_segment, *render_args))
+
+        segment_paths = []
+        for segment_path, segment_profiler in results:
+            segment_paths.append(segment_path)
+            if profiler is not None:
+                profiler.merge(segment_profiler)
+
+        return concatenate_segments(
+            segment_paths,
+            output_path,
+            audio_path=audio_path,
+            audio_offset=audio_start - windows[0][0],
+        )
+
+
+def concatenate_segments(
+    segment_paths: Sequence[str | os.PathLike],
+    output_path: str | os.PathLike,
+    audio_path: str | os.PathLike | None = None,
+    audio_offset: float = 0.0,
+) -> Path:
+    """Join ``segment_paths``, in order, into ``output_path`` without re-encoding them.
+
+    Args:
+        segment_paths: The partial movies to join.
+        output_path: Where to write the joined video.
+        audio_path: Audio to add to the video. Only the audio is encoded, the video stream is copied as is.
+        audio_offset: When, in seconds into the video, the audio starts. The beginning of the audio is cut off when
+            negative. The video is cut short if the audio ends before it does, and vice versa.
+
+    Returns:
+        The path of the joined video.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    segment_list_path = output_path.with_name(f"{output_path.stem}_segments.txt")
+    segment_list_path.write_text(
+        "".join(f"file 'file:{Path(path).resolve().as_posix()}'\n" for path in segment_paths),
+        encoding="utf-8",
+    )
+
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(segment_list_path),
+    ]
+    if audio_path is None:
+        command += ["-c", "copy"]
+    else:
+        # Seeking in the audio input cuts off its beginning, while an input offset delays it
+        command += [
+            *(["-ss", f"{-audio_offset:.6f}"] if audio_offset < 0 else ["-itsoffset", f"{audio_offset:.6f}"]),
+            "-i",
+            str(audio_path),
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            "-c:v",
+            "copy",
+            "-c:a",
+            "aac",
+            "-shortest",
+        ]
+
+    command += [
+        "-loglevel",
+        config.ffmpeg_loglevel.lower(),
+        "-nostdin",
+        str(output_path),
+    ]
+
+    try:
+        subprocess.run(command, check=True)
+    finally:
+        segment_list_path.unlink()
+
+    return output_path
+
+
+def _render_segment(
+    video_cls: type[BaseScene],
+    animation_script,
+    window: tuple[float, float],
+    segment_dir: Path,
+    segment_cache: SegmentCache | None,
+    checkpoint_store: CheckpointStore | None,
+    profiler: RenderProfiler | None,
+    tex_cache: TexCache | None,
+) -> tuple[Path, RenderProfiler | None]:
+    tex_cache_context = (
+        enable_tex_cache(tex_cache, manifest_name=video_cls.__name__)
+        if tex_cache is not None
+        else contextlib.nullcontext()
+    )
+
+    # Only the video directory is changed so that every segment still shares the same Tex cache
+    with tex_cache_context, tempconfig({"video_dir": str(segment_dir), "progress_bar": "none"}):
+        scene = video_cls(
+            animation_script=animation_script,
+            render_window=window,
+            checkpoint_store=checkpoint_store,
+        )
+        # Fast-forwarding is needed anyway to render the segment, so doing it first costs nothing on a cache miss
+        scene.curator_animation.fast_forward()
+
+        key = None
+        if segment_cache is not None:
+            key = get_segment_key(scene.curator_animation)
+            cached_path = segment_cache.get(key)
+            if cached_path is not None:
+                logger.info(f"Reusing cached segment {window[0]:.3f}s - {window[1]:.3f}s")
+                return cached_path, profiler
+
+        # Attached this late so that neither the entries fast-forwarded through nor cached segments are measured
+        scene.attach_profiler(profiler)
+        scene.render()
+
+        movie_path = Path(scene.renderer.file_writer.movie_file_path)
+        if segment_cache is None:
+            return movie_path, profiler
+
+        return segment_cache.put(key, movie_path), profiler
+
+
+def _get_frame_at(time: float, frame_rate: float) -> int:
+    """Get the index of the first frame shown at or after ``time``."""
+    # Rounded first so that times lying exactly on a frame aren't pushed to the next one by floating point error
+    return math.ceil(round(time * frame_rate, 6))
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import types
+import weakref
+from typing import Any
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from manim import Mobject
+    from manim import Scene
+
+
+# Every attribute of a mobject the Cairo camera reads when drawing it
+_RENDERED_ATTRIBUTE_NAMES = (
+    "points",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "z_index",
+    "pixel_array",
+)
+
+
+def hash_mobject_state(mobject: Mobject) -> str:
+    """Hash everything about ``mobject`` and its family that affects how it looks on screen.
+
+    Two mobjects with the same hash are drawn identically, which makes the hash usable both as part of a cache key
+    and to tell whether anything changed between two frames.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for mob in mobject.get_family():
+        hasher.update(type(mob).__name__.encode())
+        hasher.update(len(mob.submobjects).to_bytes(8, "little"))
+
+        for attr_name in _RENDERED_ATTRIBUTE_NAMES:
+            value = getattr(mob, attr_name, None)
+            if value is None:
+                continue
+
+            hasher.update(attr_name.encode())
+            try:
+                hasher.update(np.ascontiguousarray(value, dtype=np.float64).tobytes())
+            except (TypeError, ValueError):
+                hasher.update(repr(value).encode())
+
+    return hasher.hexdigest()
+
+
+def get_state_attrs(scene: Scene) -> dict[str, Any]:
+    """Get the attributes of ``scene`` that its ``Video`` methods set, which make up its state along with its mobjects.
+
+    .. seealso:: :attr:`~base_scene.BaseScene.non_state_attr_names`
+    """
+    return {name: value for name, value in scene.__dict__.items() if name not in scene.non_state_attr_names}
+
+
+def hash_scene_state(scene: Scene, mobject: Mobject) -> str:
+    """Hash the whole state of ``scene``, whose mobjects are the family of ``mobject``, not only what is drawn.
+
+    The methods of a script may read more than what is drawn, e.g. the edges of a graph, the labels of pointers, the
+    values of nodes or an attribute of the scene, and then draw something different from the same frame. Besides
+    :func:`hash_mobject_state`, this hashes the attributes of the scene from :func:`get_state_attrs` and every
+    attribute of every member of the family, following lists, dicts, sets and other objects.
+
+    Members of the family are hashed as their position in it wherever they are referenced, so the hash doesn't depend
+    on where they are in memory. For the same reason, sets are hashed regardless of their order.
+    """
+    hasher = _StateHasher(scene, mobject)
+    hasher.update(hash_mobject_state(mobject))
+    hasher.update(get_state_attrs(scene))
+    for mob in mobject.get_family():
+        hasher.update_attributes(mob, excluded=_RENDERED_ATTRIBUTE_NAMES)
+
+    return hasher.hexdigest()
+
+
+class _StateHasher:
+    def __init__(self, scene: Scene, mobject: Mobject) -> None:
+        self._hasher = hashlib.blake2b(digest_size=16)
+        self._scene = scene
+        # The position of each object already hashed, from the family of ``mobject`` on
+        self._indices: dict[int, int] = {id(mob): index for index, mob in enumerate(mobject.get_family())}
+        # The objects kept alive until hashed, so another one can't be given the id of one that's gone
+        self._hashed: list[Any] = []
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+    def update(self, value: Any) -> None:
+        write = self._write
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            write(type(value).__name__, repr(value))
+        elif value is self._scene:
+            write("scene")
+        elif isinstance(value, np.ndarray):
+            write("ndarray", value.dtype.str, repr(value.shape))
+            self._hasher.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, (list, tuple)):
+            write(type(value).__name__, str(len(value)))
+            for item in value:
+                self.update(item)
+        elif isinstance(value, (set, frozenset)):
+            write(type(value).__name__, *sorted(self._get_digest(item) for item in value))
+        elif isinstance(value, dict):
+            write(type(value).__name__, str(len(value)))
+            for key, item in value.items():
+                self.update(key)
+                self.update(item)
+        elif isinstance(value, weakref.ref):
+            write("weakref")
+            self.update(value())
+        elif isinstance(value, types.MethodType):
+            write("method", value.__func__.__qualname__)
+            self.update(value.__self__)
+        elif isinstance(value, (types.FunctionType, types.BuiltinFunctionType, type)):
+            write("function", getattr(value, "__module__", None) or "", value.__qualname__)
+        elif isinstance(value, types.ModuleType):
+            write("module", value.__name__)
+        elif id(value) in self._indices:
+            # A member of the family, or an object referenced more than once
+            write("ref", str(self._indices[id(value)]))
+        else:
+            self._indices[id(value)] = len(self._indices)
+            self._hashed.append(value)
+            self.update_attributes(value)
+
+    def update_attributes(self, value: Any, excluded: tuple[str, ...] = ()) -> None:
+        write = self._write
+        write("object", type(value).__module__, type(value).__qualname__)
+        attrs = getattr(value, "__dict__", None)
+        if attrs is None:
+            # Such as objects defining ``__slots__``, which hash as their type alone
+            return
+
+        for name, attr in attrs.items():
+            # The ``original_id`` of a copy is where the mobject it copies was in memory
+            if name not in excluded and name != "original_id":
+                write(name)
+                self.update(attr)
+
+    def _get_digest(self, value: Any) -> str:
+        hasher = self._hasher
+        self._hasher = hashlib.blake2b(digest_size=16)
+        try:
+            self.update(value)
+            return self._hasher.hexdigest()
+        finally:
+            self._hasher = hasher
+
+    def _write(self, *parts: str) -> None:
+        for part in parts:
+            self._hasher.update(part.encode())
+            self._hasher.update(b"\0")
@@ -0,0 +1,225 @@
+"""On-disk cache of the paths LaTeX produces, shared by every process.
+
+Manim already keeps the SVG files LaTeX compiles to, but it parses them again in every process, and parsing is
+where most of the time of creating a :class:`~manim.Tex` goes once the SVG exists. Renders are split over fresh
+processes, as are the tests, so this is paid for every ``Element``, ``ProblemText`` and ``Vertex`` label over and
+over. This cache stores the parsed paths instead, so a process only unpickles them.
+
+Only parsing is cached, not compiling. Manim writes the ``.tex`` file, and compiles it with LaTeX and dvisvgm
+whenever its SVG file is missing, before the paths are looked up here, as the key is taken from the name of that SVG
+file. A cache filled in another media directory therefore still needs LaTeX to produce the SVG files.
+
+Entries are keyed by manim's own hash of the ``.tex`` file, which covers the preamble of the template, the
+environment and the tex string. The font size isn't part of it, as manim only scales the parsed paths to the font
+size afterwards, so one entry serves every font size.
+
+Every tex string a video uses is also recorded in a manifest, from which :func:`prewarm_tex_cache` compiles the
+ones missing from the cache in parallel before a render starts.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from manim import config
+from manim import RendererType
+from manim import SingleStringMathTex
+from manim import tempconfig
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manim.utils.hashing import hash_obj
+from manim.utils.tex_file_writing import delete_nonsvg_files
+
+from code_curator.custom_logging.custom_logger import CustomLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from manim import TexTemplate
+    from manim import VMobject
+
+
+logger = CustomLogger.getLogger(__name__)
+
+_enabled_tex_cache: TexCache | None = None
+_manifest_name: str | None = None
+_manim_init_svg_mobject = SingleStringMathTex.init_svg_mobject
+
+
+class TexCache:
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+
+    @classmethod
+    def default(cls) -> TexCache:
+        return cls(Path(config.media_dir, "curator_cache", "tex"))
+
+    def get(self, key: str) -> list[VMobject] | None:
+        """Get the paths stored under ``key``, or ``None`` if there are none."""
+        try:
+            with self._get_path(key).open("rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+            logger.warning(f"Ignoring Tex cache entry {key} as it can't be loaded: {e}")
+            return None
+
+    def put(self, key: str, mobjects: Sequence[VMobject]) -> None:
+        """Store ``mobjects`` under ``key``.
+
+        The mobjects themselves are stored, rather than only their points, so that the ones loaded back have the same
+        class and the whole style of the ones manim parsed.
+        """
+        self._write(self._get_path(key), list(mobjects))
+
+    def record(self, manifest_name: str, key: str, tex_mobject: SingleStringMathTex) -> None:
+        """Record in the manifest ``manifest_name`` that ``tex_mobject``, stored under ``key``, is used."""
+        path = self.directory / "manifests" / manifest_name / f"{key}.pickle"
+        if not path.exists():
+            self._write(path, (tex_mobject.tex_string, tex_mobject.tex_environment, tex_mobject.tex_template))
+
+    def get_manifest(self, manifest_name: str) -> dict[str, tuple[str, str, TexTemplate]]:
+        """Get the ``(tex_string, tex_environment, tex_template)`` recorded in ``manifest_name`` by key."""
+        manifest = {}
+        for path in Path(self.directory, "manifests", manifest_name).glob("*.pickle"):
+            try:
+                with path.open("rb") as file:
+                    manifest[path.stem] = pickle.load(file)
+            except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+                logger.warning(f"Ignoring Tex manifest entry {path} as it can't be loaded: {e}")
+
+        return manifest
+
+    def has(self, key: str) -> bool:
+        return self._get_path(key).exists()
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / "mobjects" / f"{key}.pickle"
+
+    @staticmethod
+    def _write(path: Path, obj) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written then renamed so other processes never load a partially written file
+        temp_path = path.with_name(f"{path.stem}_{os.getpid()}{path.suffix}")
+        with temp_path.open("wb") as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+
+def get_tex_key(tex_mobject: SingleStringMathTex) -> str:
+    """Get the key of the paths ``tex_mobject`` is made of.
+
+    The name of the SVG file LaTeX compiled ``tex_mobject`` to is already a hash of the whole ``.tex`` file, so
+    only what changes how that file is parsed is added to it.
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        Path(tex_mobject.file_name).stem,
+        tex_mobject.svg_default,
+        tex_mobject.path_string_config,
+    ):
+        hasher.update(str(part).encode())
+
+    return hasher.hexdigest()
+
+
+@contextlib.contextmanager
+def enable_tex_cache(tex_cache: TexCache, manifest_name: str | None = None) -> Iterator[None]:
+    """Look up the paths of every :class:`~manim.Tex` created inside of this context in ``tex_cache``.
+
+    Manim parses Tex itself again once the context exits.
+
+    Args:
+        tex_cache: Where to look up the paths and store newly parsed ones.
+        manifest_name: Name of the manifest to record every tex string in, usually the name of the video being
+            rendered. Nothing is recorded when not given.
+    """
+    global _enabled_tex_cache, _manifest_name
+    previous_state = (_enabled_tex_cache, _manifest_name, SingleStringMathTex.__dict__.get("init_svg_mobject"))
+    _enabled_tex_cache = tex_cache
+    _manifest_name = manifest_name
+
+    # Patched on the class every Tex and MathTex derives from, as manim creates more of them internally, e.g. one
+    # per part of every MathTex
+    SingleStringMathTex.init_svg_mobject = _init_svg_mobject
+    try:
+        yield
+    finally:
+        _enabled_tex_cache, _manifest_name, previous_init_svg_mobject = previous_state
+        if previous_init_svg_mobject is None:
+            # Inherited from ``SVGMobject`` before it was patched
+            del SingleStringMathTex.init_svg_mobject
+        else:
+            SingleStringMathTex.init_svg_mobject = previous_init_svg_mobject
+
+
+def prewarm_tex_cache(tex_cache: TexCache, manifest_name: str, num_jobs: int = 1) -> int:
+    """Compile and parse every tex string in the manifest ``manifest_name`` missing from ``tex_cache``.
+
+    The tex strings a video needs are only known once it ran, so these are the ones it used the last time it was
+    rendered. Since the manifest outlives the entries, everything it used is compiled again in parallel after e.g.
+    clearing the cache or upgrading manim, rather than one by one by every segment.
+
+    Args:
+        tex_cache: The cache to fill.
+        manifest_name: The manifest to take the tex strings from.
+        num_jobs: Number of processes to compile with.
+
+    Returns:
+        The number of tex strings compiled.
+    """
+    missing = [request for key, request in tex_cache.get_manifest(manifest_name).items() if not tex_cache.has(key)]
+    if not missing:
+        return 0
+
+    logger.info(f"Compiling {len(missing)} tex strings of {manifest_name} with {num_jobs} processes")
+    prewarm_args = ([tex_cache] * len(missing), *zip(*missing))
+    if num_jobs > 1:
+        with ProcessPoolExecutor(max_workers=num_jobs) as executor:
+            list(executor.map(_prewarm_tex, *prewarm_args))
+    else:
+        list(map(_prewarm_tex, *prewarm_args))
+
+    # Cleaned up once every process is done, as cleaning up deletes the files the others are still compiling
+    if not config["no_latex_cleanup"]:
+        delete_nonsvg_files()
+
+    return len(missing)
+
+
+def _init_svg_mobject(self: SingleStringMathTex, use_svg_cache: bool) -> None:
+    tex_cache = _enabled_tex_cache
+    if tex_cache is None or config.renderer != RendererType.CAIRO:
+        _manim_init_svg_mobject(self, use_svg_cache)
+        return
+
+    key = get_tex_key(self)
+    if _manifest_name is not None:
+        tex_cache.record(_manifest_name, key, self)
+
+    # Manim's in memory cache is faster still, so the disk is only used when it misses
+    hash_val = hash_obj(self.hash_seed)
+    if use_svg_cache and hash_val in SVG_HASH_TO_MOB_MAP:
+        _manim_init_svg_mobject(self, use_svg_cache)
+        return
+
+    mobjects = tex_cache.get(key)
+    if mobjects is None:
+        _manim_init_svg_mobject(self, use_svg_cache)
+        tex_cache.put(key, self.submobjects)
+        return
+
+    self.add(*mobjects)
+    if use_svg_cache:
+        SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+
+
+def _prewarm_tex(tex_cache: TexCache, tex_string: str, tex_environment: str, tex_template: TexTemplate) -> None:
+    with enable_tex_cache(tex_cache), tempconfig({"no_latex_cleanup": True}):
+        SingleStringMathTex(tex_string, tex_environment=tex_environment, tex_template=tex_template)
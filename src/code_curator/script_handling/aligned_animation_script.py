@@ -37,6 +37,21 @@ class AlignedAnimationScript:
     def entries(self):
         return self._animation_script["Video"].entries
 
+    def get_entry_window(self, name: str) -> tuple[float, float]:
+        """Get the ``(start, end)`` times, in seconds, from when entry ``name`` starts until the next entry does."""
+        for index, entry in enumerate(self.entries):
+            if entry["name"] != name:
+                continue
+
+            start_time = entry["start_time"]
+            for next_entry in self.entries[index + 1 :]:
+                if next_entry["start_time"] > start_time:
+                    return start_time, next_entry["start_time"]
+
+            return start_time, self.run_time
+
+        raise ValueError(f"There is no entry named {name!r}")
+
     @property
     def stream_names(self) -> Sequence[str]:
         return self._animation_script.keys()
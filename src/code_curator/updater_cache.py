@@ -0,0 +1,136 @@
+"""Whether the family of a mobject has updaters, cached until updaters are added to or removed from it.
+
+:meth:`~custom_vmobject.CustomVMobject.update` skips the members of its family that have nothing to update in their
+own families, which are most of them: the paths making up Tex and shapes, and whole vertices and nodes. Finding them
+means walking the family, so whether a family has updaters is computed once and every member it was computed from
+watches it. A member that already knows the answer for its own family is watched instead of walked, and passes any
+change on to the mobjects watching it.
+
+Changes are seen through hooks installed on the methods of :class:`~manim.Mobject` that add and remove updaters and
+submobjects. Adding or removing submobjects only changes anything when their families have updaters, so edges
+taking their tips off and putting them back on every frame keep the answers cached. Appending to ``updaters`` or
+``submobjects`` directly, or assigning ``submobjects``, isn't seen, so a mobject with updaters must be added through
+those methods for the family it is added to to be updated.
+
+Cached state is kept here by ``id`` rather than on the mobjects, so copies and pickles of a mobject start uncached.
+"""
+from __future__ import annotations
+
+import functools
+import weakref
+from typing import TYPE_CHECKING
+
+from manim import Mobject
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+class _CacheEntry:
+    __slots__ = ("ref", "watchers", "has_updaters")
+
+    def __init__(self, ref: weakref.ref) -> None:
+        self.ref = ref
+        # The watching mobjects by id, whose answers were computed from this one
+        self.watchers: dict[int, weakref.ref] = {}
+        self.has_updaters: bool | None = None
+
+
+_entries: dict[int, _CacheEntry] = {}
+
+
+def has_updaters_in_family(mobject: Mobject) -> bool:
+    """Whether any member of the family of ``mobject``, ``mobject`` included, has updaters."""
+    entry = _get_entry(mobject)
+    if entry.has_updaters is not None:
+        return entry.has_updaters
+
+    has_updaters = False
+    stack = [mobject]
+    while stack:
+        mob = stack.pop()
+        mob_entry = _get_entry(mob)
+        mob_entry.watchers[id(mobject)] = entry.ref
+        if mob is not mobject and mob_entry.has_updaters is not None:
+            has_updaters = has_updaters or mob_entry.has_updaters
+            continue
+
+        has_updaters = has_updaters or bool(mob.updaters)
+        # A ``NullVMobject`` has no submobjects at all
+        stack.extend(mob.submobjects or ())
+
+    entry.has_updaters = has_updaters
+    return has_updaters
+
+
+def invalidate(mobject: Mobject) -> None:
+    """Forget whether the family of ``mobject``, and of every mobject watching it, has updaters."""
+    stack = [mobject]
+    while stack:
+        mob = stack.pop()
+        entry = _entries.get(id(mob))
+        if entry is None or entry.ref() is not mob:
+            continue
+
+        entry.has_updaters = None
+        # Watchers watch again when they find out whether their family has updaters again
+        watchers, entry.watchers = entry.watchers, {}
+        for watcher_ref in watchers.values():
+            watcher = watcher_ref()
+            if watcher is not None and watcher is not mob:
+                stack.append(watcher)
+
+
+def _get_entry(mobject: Mobject) -> _CacheEntry:
+    mobject_id = id(mobject)
+    entry = _entries.get(mobject_id)
+    if entry is None or entry.ref() is not mobject:
+        entry = _entries[mobject_id] = _CacheEntry(weakref.ref(mobject, functools.partial(_forget, mobject_id)))
+
+    return entry
+
+
+def _forget(mobject_id: int, ref: weakref.ref) -> None:
+    entry = _entries.get(mobject_id)
+    if entry is not None and entry.ref is ref:
+        del _entries[mobject_id]
+
+
+def _invalidating_updaters(method_name: str):
+    method = getattr(Mobject, method_name)
+
+    @functools.wraps(method)
+    def wrapper(self: Mobject, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        invalidate(self)
+        return result
+
+    return wrapper
+
+
+def _invalidating_submobjects(method_name: str, get_mobjects: Callable[..., Iterable[Mobject]]):
+    method = getattr(Mobject, method_name)
+
+    @functools.wraps(method)
+    def wrapper(self: Mobject, *args, **kwargs):
+        mobjects = list(get_mobjects(*args, **kwargs))
+        result = method(self, *args, **kwargs)
+        if any(has_updaters_in_family(mob) for mob in mobjects if isinstance(mob, Mobject)):
+            invalidate(self)
+
+        return result
+
+    return wrapper
+
+
+for _method_name in ("add_updater", "remove_updater", "clear_updaters"):
+    setattr(Mobject, _method_name, _invalidating_updaters(_method_name))
+
+for _method_name, _get_mobjects in (
+    ("add", lambda *mobjects: mobjects),
+    ("add_to_back", lambda *mobjects: mobjects),
+    ("remove", lambda *mobjects: mobjects),
+    ("insert", lambda index, mobject: [mobject]),
+):
+    setattr(Mobject, _method_name, _invalidating_submobjects(_method_name, _get_mobjects))
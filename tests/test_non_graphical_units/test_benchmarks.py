@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare
+
+
+def test_cases_are_importable() -> None:
+    assert {"singly_linked_list", "graph", "code", "code_diff"} <= set(CASES)
+
+
+def test_compare_reports_only_regressions_beyond_tolerance() -> None:
+    baseline = {
+        "case": {"build_seconds": 1.0, "peak_memory_bytes": 100.0, "frames_per_second": 10.0},
+    }
+    results = {
+        "case": {"build_seconds": 1.5, "peak_memory_bytes": 110.0, "frames_per_second": 7.0},
+        "new_case": {"build_seconds": 10.0},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.2)
+
+    assert regressions == [
+        "case build_seconds: 1.5 (baseline 1)",
+        "case frames_per_second: 7 (baseline 10)",
+    ]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from manim import config
+from manim import FadeIn
+from manim import RIGHT
+from manim import Square
+from manim import Wait
+
+from code_curator.base_scene import BaseScene
+
+
+class AnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 4.0
+        self.entries = [
+            {"name": "fade_in_first_square", "start_time": 1.0},
+            {"name": "fade_in_second_square", "start_time": 1.0},
+            {"name": "wait", "start_time": 1.5},
+        ]
+
+
+class PoolScene(BaseScene):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.first_square = Square()
+        self.second_square = Square()
+
+    def fade_in_first_square(self):
+        return FadeIn(self.first_square, run_time=2.0)
+
+    def fade_in_second_square(self):
+        return FadeIn(self.second_square, run_time=1.0)
+
+    def wait(self):
+        return Wait(run_time=0.5)
+
+
+def test_methods_starting_at_the_same_time_start_on_the_same_frame() -> None:
+    curator_animation = PoolScene(animation_script=AnimationScript()).curator_animation
+    curator_animation.fast_forward()
+
+    curator_animation.interpolate_mobject(0.2)
+    assert len(curator_animation.pending_queue) == 3
+
+    curator_animation.interpolate_mobject(0.26)
+    assert len(curator_animation.pending_queue) == 1
+    assert [anim.method_name for anim in curator_animation.animation_pool.animations] == [
+        "fade_in_first_square",
+        "fade_in_second_square",
+    ]
+
+
+def test_animations_leave_the_pool_once_they_end() -> None:
+    curator_animation = PoolScene(animation_script=AnimationScript()).curator_animation
+    curator_animation.fast_forward()
+
+    curator_animation.interpolate_mobject(0.4)
+    assert len(curator_animation.animation_pool.animations) == 3
+
+    curator_animation.interpolate_mobject(0.55)
+    assert [anim.method_name for anim in curator_animation.animation_pool.animations] == ["fade_in_first_square"]
+    assert curator_animation.scene.second_square.get_stroke_opacity() == 1
+
+    curator_animation.interpolate_mobject(0.8)
+    assert not curator_animation.animation_pool.animations
+
+
+class RecordingAnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 4.0
+        self.entries = [
+            {"name": "fade_in_first_square", "start_time": 1.0},
+            {"name": "record_first_square_opacity", "start_time": 3.0},
+        ]
+
+
+class RecordingScene(PoolScene):
+    def record_first_square_opacity(self):
+        self.recorded_opacity = self.first_square.get_stroke_opacity()
+
+
+def test_fast_forwarding_calls_methods_before_finishing_animations_like_frames_do() -> None:
+    scene = RecordingScene(animation_script=RecordingAnimationScript(), render_window=(3.5, 4.0))
+
+    scene.curator_animation.fast_forward()
+
+    # The fade in ends when the method starts, so the method still sees it running
+    assert scene.recorded_opacity < 1
+    assert scene.first_square.get_stroke_opacity() == 1
+    assert not scene.curator_animation.animation_pool.animations
+
+
+class MovingAnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 4.0
+        self.entries = [
+            {"name": "start_moving_square", "start_time": 0.51},
+            {"name": "fade_in_first_square", "start_time": 1.013},
+            {"name": "record_first_square_opacity", "start_time": 2.2},
+        ]
+
+
+class MovingScene(RecordingScene):
+    def start_moving_square(self):
+        self.second_square.add_updater(lambda mob, dt: mob.shift(dt * RIGHT))
+        self.add(self.second_square)
+
+
+def test_fast_forwarding_reaches_the_state_a_single_play_reaches_at_the_window_start() -> None:
+    window_start = 3.0
+    fast_forwarded_scene = MovingScene(animation_script=MovingAnimationScript(), render_window=(window_start, 4.0))
+    fast_forwarded_scene.curator_animation.fast_forward()
+
+    # Plays the frames before the window as ``Scene.play`` does when the timeline isn't split
+    played_scene = MovingScene(animation_script=MovingAnimationScript())
+    played_scene.curator_animation.fast_forward()
+    played_scene.animations = [played_scene.curator_animation]
+    played_scene.last_t = 0
+    for t in np.arange(0, window_start, 1 / config.frame_rate):
+        played_scene.update_to_time(t)
+
+    assert fast_forwarded_scene.recorded_opacity == played_scene.recorded_opacity
+    np.testing.assert_allclose(fast_forwarded_scene.second_square.points, played_scene.second_square.points)
+    np.testing.assert_allclose(
+        fast_forwarded_scene.first_square.get_stroke_opacity(),
+        played_scene.first_square.get_stroke_opacity(),
+    )
+    assert fast_forwarded_scene.curator_animation.first_frame_dt == pytest.approx(1 / config.frame_rate)
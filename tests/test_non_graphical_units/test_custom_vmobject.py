@@ -5,8 +5,12 @@ import pytest
 from manim import Circle
 from manim import Line
 from manim import Square
+from manim import VGroup
+from manim import VMobject
 
+from code_curator.custom_vmobject import copy_on_write
 from code_curator.custom_vmobject import CustomVMobject
+from code_curator.custom_vmobject import get_updater_dependents
 from code_curator.null_vmobject import NullVMobject
 
 
@@ -65,3 +69,180 @@ def test_center_with_quasi_add_and_normal_add(parent: CustomVMobject) -> None:
     parent.quasi_add(quasi_mob)
 
     assert np.array_equal(parent_center_before_quasi_add, parent.get_center())
+
+
+def test_force_update_runs_suspended_updaters_and_keeps_them_suspended(parent: CustomVMobject) -> None:
+    child = Square()
+    parent.add(child)
+    parent.add_updater(lambda mob: mob.shift((1.0, 0.0, 0.0)))
+    child.add_updater(lambda mob: mob.shift((0.0, 1.0, 0.0)))
+    parent.suspend_updating()
+
+    parent.force_update(recursive=False)
+
+    assert np.allclose(child.get_center(), (1.0, 0.0, 0.0))
+
+    parent.force_update()
+
+    assert np.allclose(child.get_center(), (2.0, 1.0, 0.0))
+    assert parent.updating_suspended
+    assert child.updating_suspended
+
+
+def test_copy_on_write_only_copies_written_mobjects(parent: CustomVMobject) -> None:
+    written = Square()
+    shared = Circle()
+    holder = CustomVMobject()
+    holder.add(written)
+    parent.add(holder, shared)
+    parent.quasi_add(Line())
+
+    target, (written_copy,) = copy_on_write(parent, [written])
+    written_copy.set_opacity(0)
+
+    assert target is not parent
+    assert target.submobjects[0] is not holder
+    assert target.submobjects[0].submobjects == [written_copy]
+    assert target.submobjects[1] is shared
+    assert target.quasi_mobjects == parent.quasi_mobjects
+    assert target.original_id == str(id(parent))
+    assert written_copy.original_id == str(id(written))
+    assert written.get_stroke_opacity() == 1
+
+
+def test_copy_on_write_copies_what_shells_reference_outside_of_the_family(parent: CustomVMobject) -> None:
+    written = Square()
+    shared = Circle()
+    parent.add(written, shared)
+    parent.members = [written, shared]
+    # Like the lines of a ``Paragraph``, which group the members of its family without being in it
+    parent.grouped = VGroup(shared)
+
+    target, (written_copy,) = copy_on_write(parent, [written])
+
+    assert target.members == [written_copy, shared]
+    assert parent.members == [written, shared]
+    assert target.grouped is not parent.grouped
+    assert target.grouped.submobjects == [shared]
+
+
+def test_update_passes_dt_only_to_updaters_taking_it(parent: CustomVMobject) -> None:
+    calls = []
+    parent.add_updater(lambda mob, dt: calls.append(dt))
+    parent.add_updater(lambda mob: calls.append(None))
+    parent.updaters.append(lambda mob, dt: calls.append(-dt))
+
+    parent.update(dt=0.5)
+
+    assert calls == [0.5, None, -0.5]
+
+
+class UpdateCountingVMobject(CustomVMobject):
+    def __init__(self, *mobjects) -> None:
+        super().__init__()
+        self.add(*mobjects)
+        self.update_count = 0
+
+    def update(self, dt: float = 0, recursive: bool = True):
+        self.update_count += 1
+        return super().update(dt, recursive)
+
+
+def test_update_skips_subtrees_without_updaters(parent: CustomVMobject) -> None:
+    square = Square()
+    holder = UpdateCountingVMobject(UpdateCountingVMobject(square))
+    parent.add(holder)
+
+    parent.update()
+    assert holder.update_count == 0
+
+    calls = []
+    square.add_updater(lambda mob: calls.append(mob))
+    parent.update()
+    assert holder.update_count == 1
+    assert calls == [square]
+
+    square.clear_updaters()
+    parent.update()
+    assert holder.update_count == 1
+
+
+def test_update_sees_mobjects_with_updaters_added_to_a_skipped_subtree(parent: CustomVMobject) -> None:
+    inner = UpdateCountingVMobject(Square())
+    holder = UpdateCountingVMobject(inner)
+    parent.add(holder)
+    parent.update()
+
+    calls = []
+    circle = Circle()
+    circle.add_updater(lambda mob: calls.append(mob))
+    inner.add(circle)
+    parent.update()
+
+    assert calls == [circle]
+
+    inner.remove(circle)
+    parent.update()
+
+    assert calls == [circle]
+    assert holder.update_count == 1
+
+
+def test_boundary_without_quasi_mobjects_matches_vmobject(parent: CustomVMobject) -> None:
+    holder = CustomVMobject()
+    holder.add(Square(), Circle().shift((1.0, 0.0, 0.0)))
+    parent.add(Line(), holder)
+
+    assert np.array_equal(parent.get_points_defining_boundary(), VMobject.get_points_defining_boundary(parent))
+
+
+def test_boundary_is_cached_until_family_changes(parent: CustomVMobject) -> None:
+    square = Square()
+    holder = CustomVMobject()
+    holder.add(square)
+    parent.add(holder)
+    boundary = parent.get_points_defining_boundary()
+
+    assert parent.get_points_defining_boundary() is boundary
+
+    square.shift((1.0, 0.0, 0.0))
+    assert np.array_equal(parent.get_points_defining_boundary(), VMobject.get_points_defining_boundary(parent))
+    assert np.allclose(parent.get_center(), (1.0, 0.0, 0.0))
+
+    circle = Circle().shift((3.0, 0.0, 0.0))
+    holder.add(circle)
+    assert np.array_equal(parent.get_points_defining_boundary(), VMobject.get_points_defining_boundary(parent))
+
+    holder.remove(circle)
+    assert np.allclose(parent.get_center(), (1.0, 0.0, 0.0))
+
+    parent.quasi_add(circle)
+    assert np.allclose(parent.get_center(), (1.0, 0.0, 0.0))
+    assert np.allclose(parent.get_right(), square.get_right())
+
+
+def test_critical_points_match_vmobject(parent: CustomVMobject) -> None:
+    parent.add(Square(), Circle().shift((1.0, 2.0, 0.0)))
+
+    for direction in (np.array((-1.0, 0.0, 0.0)), np.array((0.0, 0.0, 0.0)), np.array((1.0, 1.0, 0.0))):
+        assert np.allclose(parent.get_critical_point(direction), VMobject.get_critical_point(parent, direction))
+
+
+class DependentVMobject(CustomVMobject):
+    def __init__(self, dependency, *mobjects) -> None:
+        super().__init__()
+        self.add(*mobjects)
+        self.dependency = dependency
+
+    def get_updater_dependencies(self):
+        return [self.dependency]
+
+
+def test_dependents_sharing_members_list_them_once(parent: CustomVMobject) -> None:
+    dependency = Square()
+    shared_member = Circle().add_updater(lambda mob: mob)
+    first_dependent = DependentVMobject(dependency, shared_member)
+    second_dependent = DependentVMobject(dependency, shared_member)
+    parent.add(dependency, first_dependent, second_dependent)
+
+    assert get_updater_dependents(parent, [dependency]) == [shared_member]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import pickle
+
 import numpy as np
 import pytest
+from manim import BLACK
+from manim import Circle
 from manim import DOWN
 from manim import Point
+from manim import Square
 
+from code_curator.custom_vmobject import get_updater_dependents
 from code_curator.data_structures.graph import Edge
 from code_curator.data_structures.graph import Graph
 from code_curator.data_structures.graph import LabeledLine
@@ -42,6 +48,27 @@ def test_vertex_with_contents() -> None:
     assert vertex.label_mobject is None
 
 
+def test_hidden_label_is_shown_later() -> None:
+    vertex = Vertex(0, show_label=False)
+
+    assert vertex.label == 0
+    assert vertex.submobjects == [vertex.container]
+
+    vertex.add_label()
+
+    assert vertex.label_mobject in vertex.submobjects
+    assert vertex.label_mobject in vertex.quasi_mobjects
+    assert vertex.label == 0
+
+
+def test_label_placed_on_surrounding_circle() -> None:
+    vertex = Vertex(0, label_out=True, label_dist=0.1, label_revolve_angle_in_degrees=90)
+
+    helper_circle = Circle().surround(vertex.container, stretch=True, buffer_factor=1.5)
+    helper_circle.move_to(vertex.container.get_center())
+    assert np.allclose(vertex.label_mobject.get_center(), helper_circle.point_at_angle(np.pi / 2), atol=1e-3)
+
+
 EXCEPTION_MATCH = "You must provide Mobjects as the vertices"
 
 
@@ -221,6 +248,32 @@ def test_get_vertex(graph) -> None:
     assert graph.get_vertex(2) is vertex
 
 
+def test_edge_index_follows_reconnected_and_removed_vertices(graph) -> None:
+    vertex_one = graph.add_vertex(0)
+    vertex_two = graph.add_vertex(1)
+    vertex_three = graph.add_vertex(2)
+    edge = graph.add_edge(vertex_one, vertex_two, directedness="->")
+
+    assert graph.get_outgoing_edges(vertex_one) == [edge]
+    assert graph.get_incoming_edges(vertex_two) == [edge]
+    assert graph.get_edge_from_to(vertex_one, vertex_two) is edge
+
+    edge.reconnect(vertex_two, vertex_three, angle_in_degrees=0)
+
+    assert graph.get_incoming_edges(vertex_two) == []
+    assert graph.get_incoming_edges(vertex_three) == [edge]
+    assert graph.get_edges_connecting_vertices(vertex_three, vertex_one) == [edge]
+
+    graph.remove(vertex_one)
+
+    assert graph.get_outgoing_edges(vertex_one) == []
+    assert graph.get_incident_edges(vertex_three) == [edge]
+
+    graph.remove(edge)
+
+    assert graph.get_incident_edges(vertex_three) == []
+
+
 
 # TODO: Test the various ways you can construct a emtpy
 #  1. Adding vertices and then edges connecting them
@@ -290,3 +343,128 @@ def test_labeled_line_by_single_coordinate() -> None:
 
     assert np.array_equal(labeled_line.start, [0, 1, 0])
     assert np.array_equal(labeled_line.end, coordinate)
+
+
+def test_edge_follows_moved_vertex_in_place() -> None:
+    vertex_one = Vertex(0)
+    vertex_two = Vertex(1).shift((2.0, 0.0, 0.0))
+    edge = Edge(vertex_one, vertex_two, directedness="->")
+    line = edge.line
+    tip = edge.line.tip
+
+    vertex_two.shift((0.0, 2.0, 0.0))
+    edge.update()
+
+    direction = np.array([1.0, 1.0, 0.0]) / np.sqrt(2)
+    assert edge.line is line
+    assert edge.line.tip is tip
+    assert np.allclose(edge.line.get_start(), direction * vertex_one.container.radius)
+    assert np.allclose(tip.tip_point, vertex_two.get_center() - direction * vertex_two.container.radius)
+
+
+def test_get_vertex_after_removing_vertex_with_shared_label(graph) -> None:
+    vertex_one = graph.add_vertex(0)
+    vertex_two = graph.add_vertex(Vertex(0))
+
+    graph.remove(vertex_one)
+
+    assert graph.get_vertex(0) is vertex_two
+
+    graph.remove(vertex_two)
+
+    with pytest.raises(LookupError):
+        graph.get_vertex(0)
+
+
+def test_vertices_whose_labels_cant_be_indexed_are_still_found(graph) -> None:
+    listed = graph.add_vertex([0, 1], show_label=False)
+    square_label = Square()
+    unvalued = graph.add_vertex(Vertex(square_label, show_label=False))
+
+    assert graph.get_vertex([0, 1]) is listed
+    with pytest.raises(LookupError):
+        graph.get_vertex(square_label)
+
+    graph.remove(listed)
+    graph.remove(unvalued)
+
+    with pytest.raises(LookupError):
+        graph.get_vertex([0, 1])
+
+
+def test_degrees_follow_added_reconnected_and_removed_edges(graph) -> None:
+    vertex_one = graph.add_vertex(0)
+    vertex_two = graph.add_vertex(1)
+    vertex_three = graph.add_vertex(2)
+    edge = graph.add_edge(vertex_one, vertex_two, directedness="->")
+
+    assert graph.get_out_degree(vertex_one) == 1
+    assert graph.get_in_degree(vertex_two) == 1
+    assert set(graph.get_vertices_with_no_incoming_edges()) == {vertex_one, vertex_three}
+    assert set(graph.get_vertices_with_no_outgoing_edges()) == {vertex_two, vertex_three}
+
+    edge.reconnect(vertex_two, vertex_three, angle_in_degrees=0)
+
+    assert graph.get_in_degree(vertex_two) == 0
+    assert graph.get_in_degree(vertex_three) == 1
+    assert set(graph.get_vertices_with_no_incoming_edges()) == {vertex_one, vertex_two}
+
+    graph.remove(edge)
+
+    assert graph.get_out_degree(vertex_one) == 0
+    assert set(graph.get_vertices_with_no_outgoing_edges()) == {vertex_one, vertex_two, vertex_three}
+
+
+def test_labeled_line_follows_moved_pointee() -> None:
+    vertex = Vertex(0)
+    labeled_line = LabeledLine(vertex, direction=DOWN)
+
+    vertex.shift((1.0, 1.0, 0.0))
+    labeled_line.update()
+
+    assert np.allclose(labeled_line.end, vertex.get_boundary_point(-DOWN))
+
+
+def test_updater_dependents_of_moved_vertex(graph) -> None:
+    vertex_one = graph.add_vertex(0)
+    vertex_two = graph.add_vertex(1)
+    vertex_three = graph.add_vertex(2)
+    edge_one_two = graph.add_edge(vertex_one, vertex_two)
+    edge_two_three = graph.add_edge(vertex_two, vertex_three)
+    graph.add_labeled_pointer(vertex_three, "p", direction=DOWN, color=BLACK)
+    pointer = graph.get_labeled_pointer("p")
+
+    assert get_updater_dependents(graph, [vertex_one]) == [edge_one_two]
+    assert get_updater_dependents(graph, [vertex_three]) == [edge_two_three, pointer.line, pointer.label_mobject]
+
+
+def test_copied_edge_leaves_its_graph_behind(graph) -> None:
+    edge = graph.add_edge(0, 1)
+
+    edge_copy = edge.copy()
+
+    assert edge_copy.graph is None
+    assert edge.graph is graph
+    assert not any(isinstance(mob, Graph) for mob in edge_copy.get_family())
+
+
+def test_copied_graph_indexes_its_copied_edges(graph) -> None:
+    graph.add_edge(0, 1)
+
+    graph_copy = graph.copy()
+    (edge_copy,) = graph_copy.edges
+    vertex_two = graph_copy.add_vertex(2)
+    edge_copy.vertex_two = vertex_two
+
+    assert edge_copy.graph is graph_copy
+    assert graph_copy.get_incident_edges(vertex_two) == [edge_copy]
+    assert graph.get_incident_edges(vertex_two) == []
+
+
+def test_pickled_edge_keeps_its_graph(graph) -> None:
+    graph.add_edge(0, 1)
+
+    graph_copy = pickle.loads(pickle.dumps(graph))
+    (edge_copy,) = graph_copy.edges
+
+    assert edge_copy.graph is graph_copy
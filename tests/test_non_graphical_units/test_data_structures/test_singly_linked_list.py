@@ -255,6 +255,23 @@ def test_insert_at_index_two_of_three_node_sll() -> None:
     validate_sll(sll, 0, 1, 10, 2, has_null=True, has_head_pointer=True, has_tail_pointer=True, color=WHITE)
 
 
+def test_extend_empty_sll_showing_null() -> None:
+    sll = SinglyLinkedList.create_sll(color=WHITE).add_null()
+
+    sll.extend([0, 1, 2])
+
+    validate_sll(sll, 0, 1, 2, has_null=True, has_head_pointer=False, has_tail_pointer=False, color=WHITE)
+
+
+def test_extend_sll_showing_null_with_pointers() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, color=WHITE).add_null().add_head_pointer().add_tail_pointer()
+
+    sll.extend([2, 3])
+
+    validate_sll(sll, 0, 1, 2, 3, has_null=True, has_head_pointer=True, has_tail_pointer=True, color=WHITE)
+    assert sll.get_node(3).get_x() - sll.get_node(2).get_x() == pytest.approx(2.0)
+
+
 def test_add_null_node_to_non_empty_sll() -> None:
     sll = SinglyLinkedList(0, color=WHITE)
 
@@ -554,3 +571,103 @@ def test_adding_node() -> None:
     sll.add(node_to_add)
 
     validate_sll(sll, 0, 1, has_null=True, has_head_pointer=True, has_tail_pointer=True, color=WHITE)
+
+
+def test_animate_passes_target_submobjects_to_chained_calls() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, 2, color=WHITE)
+    node = sll.get_node(1)
+
+    builder = sll.animate.remove_node(node).insert_node(0, 10)
+
+    assert sll.target.values == [10, 0, 2]
+    assert builder.get_target_submobjects_by_original_id()[str(id(node))] is not node
+    assert sll.values == [0, 1, 2]
+
+
+def test_animating_a_labeled_pointer_only_copies_the_pointer() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, 2, color=WHITE)
+    sll.add_labeled_pointer(sll.head, "curr", direction=DOWN)
+    pointer = sll.get_labeled_pointer("curr")
+
+    sll.animate.move_labeled_pointer("curr", sll.tail)
+
+    target_pointer = sll.target.get_labeled_pointer("curr")
+    assert target_pointer is not pointer
+    assert target_pointer.pointee is sll.tail
+    assert all(target_node is node for target_node, node in zip(sll.target.nodes, sll.nodes))
+    assert pointer.pointee is sll.head
+
+
+def test_animating_a_whole_sll_after_a_pointer_copies_it_again() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, 2, color=WHITE)
+    sll.add_labeled_pointer(sll.head, "curr", direction=DOWN)
+
+    sll.animate.move_labeled_pointer("curr", sll.tail).flatten()
+
+    target_pointer = sll.target.get_labeled_pointer("curr")
+    assert target_pointer.pointee is sll.target.tail
+    assert sll.target.tail.original_id == str(id(sll.tail))
+    assert sll.get_labeled_pointer("curr").pointee is sll.head
+
+
+def test_cached_tail_follows_appended_and_removed_nodes() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, color=WHITE).add_null()
+    assert sll.tail.value == 1
+
+    sll.extend([2, 3])
+
+    assert sll.tail.value == 3
+
+    sll.remove_node(-1)
+
+    assert sll.tail.value == 2
+    assert sll.get_next(sll.tail) is sll.null
+
+
+def test_cached_ends_follow_changes_made_through_the_graph() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, 2, color=WHITE)
+    head = sll.head
+    assert sll.tail.value == 2
+
+    sll.graph.remove(sll.get_next_pointer(sll.get_node(1)))
+
+    assert sll.tail.value == 1
+
+    sll.graph.remove(sll.get_next_pointer(head))
+    sll.graph.remove(head)
+
+    assert sll.head.value == 1
+    assert sll.tail.value == 1
+
+
+def test_cached_tail_follows_edges_relinked_directly() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, 2, color=WHITE)
+    assert sll.tail.value == 2
+
+    sll.get_next_pointer(sll.head).vertex_two = sll.tail
+
+    assert sll.tail.value == 2
+    assert sll.values == [0, 2]
+
+    sll.get_next_pointer(sll.head).vertex_two = None
+
+    assert sll.tail is sll.head
+
+
+def test_shrink_pointer_target_updaters_are_bound_to_target() -> None:
+    sll = SinglyLinkedList.create_sll(0, 1, color=WHITE).add_head_pointer()
+
+    target, _ = sll.shrink_pointer(sll.get_next_pointer(sll.head))
+
+    assert target is not sll
+    assert target.updaters
+    assert all(updater.__self__ is target for updater in target.updaters)
+
+
+def test_cached_tail_follows_relinked_nodes() -> None:
+    sll = SinglyLinkedList.create_sll(10, -2, 7, 0, color=WHITE).add_null()
+    assert sll.tail.value == 0
+
+    sll.set_next(sll.head, sll.null)
+
+    assert sll.tail is sll.head
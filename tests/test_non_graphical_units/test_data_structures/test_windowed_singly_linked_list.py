@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from code_curator.data_structures.windowed_singly_linked_list import WindowedSinglyLinkedList
+
+
+def test_only_nodes_inside_window_are_created() -> None:
+    sll = WindowedSinglyLinkedList(*range(1000), window_size=4)
+
+    assert len(sll) == 1000
+    assert [node.value for node in sll.nodes] == [0, 1, 2, 3]
+    assert sll.get_node(4) is None
+    assert sll.trailing_ellipsis in sll.submobjects
+    assert sll.leading_ellipsis not in sll.submobjects
+
+
+def test_scrolling_keeps_nodes_still_inside_window() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=4)
+    kept_node = sll.get_node(2)
+
+    sll.scroll_to(2)
+
+    assert [node.value for node in sll.nodes] == [2, 3, 4, 5]
+    assert sll.get_node(2) is kept_node
+    assert sll.leading_ellipsis in sll.submobjects
+
+    sll.scroll_to(100)
+
+    assert [node.value for node in sll.nodes] == [6, 7, 8, 9]
+    assert sll.trailing_ellipsis not in sll.submobjects
+
+
+def test_inserting_and_removing_outside_window_keeps_visible_nodes() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=3)
+    sll.scroll_to(3)
+
+    sll.insert_node(0, -1)
+
+    assert sll.window_start == 4
+    assert [node.value for node in sll.nodes] == [3, 4, 5]
+
+    sll.remove_node(4)
+
+    assert sll.values == [-1, 0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert [node.value for node in sll.nodes] == [4, 5, 6]
+
+
+def test_pointers_are_hidden_outside_window() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=3)
+    sll.add_labeled_pointer(1, "curr")
+
+    assert sll.sll.get_labeled_pointer("curr").pointee is sll.get_node(1)
+
+    sll.scroll_to(5)
+
+    assert "curr" not in sll.sll.graph.labeled_pointers
+
+    sll.move_labeled_pointer("curr", 9)
+
+    assert sll.window_start == 7
+    assert sll.sll.get_labeled_pointer("curr").pointee is sll.get_node(9)
+
+
+def test_scrolling_recycles_nodes_leaving_window() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=4)
+    node_ids = {id(node) for node in sll.nodes}
+
+    sll.scroll_to(2)
+
+    assert [node.value for node in sll.nodes] == [2, 3, 4, 5]
+    assert {id(node) for node in sll.nodes} == node_ids
+
+    sll.scroll_to(6)
+
+    assert [node.value for node in sll.nodes] == [6, 7, 8, 9]
+    assert {id(node) for node in sll.nodes} == node_ids
+
+
+def test_removing_node_removes_pointers_to_it() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=3)
+    sll.add_labeled_pointer(1, "prev")
+    sll.add_labeled_pointer(2, "curr")
+
+    sll.remove_node(2)
+
+    assert "curr" not in sll.pointer_indices
+    assert "curr" not in sll.sll.graph.labeled_pointers
+    assert sll.sll.get_labeled_pointer("prev").pointee is sll.get_node(1)
+
+
+def test_removing_near_end_refills_window_from_preceding_values() -> None:
+    sll = WindowedSinglyLinkedList(*range(10), window_size=3)
+    sll.scroll_to(7)
+    node_ids = {id(node) for node in sll.nodes}
+
+    sll.remove_node(8)
+
+    assert sll.window_start == 6
+    assert [node.value for node in sll.nodes] == [6, 7, 9]
+    assert {id(node) for node in sll.nodes} == node_ids
+    assert sll.leading_ellipsis in sll.submobjects
+    assert sll.trailing_ellipsis not in sll.submobjects
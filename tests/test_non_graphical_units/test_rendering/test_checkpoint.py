@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from manim import FadeIn
+from manim import PI
+from manim import Rotate
+from manim import Square
+
+from code_curator.base_scene import BaseScene
+from code_curator.rendering.checkpoint import CheckpointStore
+from code_curator.rendering.state_hash import hash_mobject_state
+
+called_method_names = []
+
+
+class AnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 3.0
+        self.entries = [
+            {"name": "fade_in_square", "start_time": 0.0},
+            {"name": "rotate_square", "start_time": 1.0},
+            {"name": "rotate_square_back", "start_time": 2.0},
+        ]
+
+
+class CheckpointedScene(BaseScene):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.square = Square()
+
+    def fade_in_square(self):
+        called_method_names.append("fade_in_square")
+        return FadeIn(self.square)
+
+    def rotate_square(self):
+        called_method_names.append("rotate_square")
+        return Rotate(self.square, angle=PI / 3)
+
+    def rotate_square_back(self):
+        called_method_names.append("rotate_square_back")
+        return Rotate(self.square, angle=-PI / 6)
+
+
+def test_fast_forwarding_resumes_from_latest_checkpoint(tmp_path) -> None:
+    checkpoint_store = CheckpointStore(tmp_path, interval=1)
+
+    def fast_forward_scene() -> CheckpointedScene:
+        scene = CheckpointedScene(
+            animation_script=AnimationScript(),
+            render_window=(2.5, 2.9),
+            checkpoint_store=checkpoint_store,
+        )
+        scene.curator_animation.fast_forward()
+        return scene
+
+    called_method_names.clear()
+    first_scene = fast_forward_scene()
+    assert called_method_names == ["fade_in_square", "rotate_square", "rotate_square_back"]
+
+    called_method_names.clear()
+    second_scene = fast_forward_scene()
+    assert called_method_names == ["rotate_square_back"]
+
+    assert second_scene.submobjects == [second_scene.square]
+    assert hash_mobject_state(second_scene.mobjects[0]) == hash_mobject_state(first_scene.mobjects[0])
+
+
+def test_checkpoints_are_due_every_interval() -> None:
+    checkpoint_store = CheckpointStore("checkpoints", interval=3)
+
+    assert [index for index in range(10) if checkpoint_store.is_due(index)] == [3, 6, 9]
+
+
+def test_scenes_nested_too_deeply_are_skipped(tmp_path) -> None:
+    checkpoint_store = CheckpointStore(tmp_path, interval=1)
+    scene = CheckpointedScene(animation_script=AnimationScript(), checkpoint_store=checkpoint_store)
+    nested = []
+    for _ in range(100_000):
+        nested = [nested]
+    scene.nested = nested
+
+    checkpoint_store.save("key", scene.curator_animation)
+
+    assert not checkpoint_store.has("key")
+    assert list(tmp_path.iterdir()) == []
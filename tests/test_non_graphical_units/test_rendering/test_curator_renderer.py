@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from manim import RIGHT
+from manim import Square
+
+from code_curator.base_scene import BaseScene
+from code_curator.rendering.curator_renderer import CuratorCairoRenderer
+
+
+class AnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 1.0
+        self.entries = []
+
+
+def test_base_scene_renders_with_curator_renderer() -> None:
+    assert isinstance(BaseScene().renderer, CuratorCairoRenderer)
+
+
+def test_idle_frames_are_only_rasterized_when_something_changed(monkeypatch) -> None:
+    scene = BaseScene(animation_script=AnimationScript())
+    square = Square()
+    scene.add(square)
+    scene.curator_animation.fast_forward()
+
+    renderer = scene.renderer
+    rasterized_frames = []
+    added_frames = []
+    monkeypatch.setattr(renderer, "update_frame", lambda *args, **kwargs: rasterized_frames.append(args))
+    monkeypatch.setattr(renderer, "add_frame", lambda frame: added_frames.append(frame))
+
+    renderer.render(scene, 0, [])
+    renderer.render(scene, 0, [])
+    assert len(rasterized_frames) == 1
+    assert len(added_frames) == 2
+
+    square.shift(RIGHT)
+    renderer.render(scene, 0, [])
+    assert len(rasterized_frames) == 2
+    assert len(added_frames) == 3
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+
+from code_curator.rendering.profiler import IDLE_ENTRY_NAME
+from code_curator.rendering.profiler import RenderProfiler
+
+
+def test_frames_are_split_between_running_entries() -> None:
+    profiler = RenderProfiler()
+
+    profiler.add_frame(["draw_list", "draw_code"], rasterize_seconds=0.5)
+    profiler.add_frame([], rasterize_seconds=0.25)
+
+    assert profiler.frames == {"draw_list": 1, "draw_code": 1, IDLE_ENTRY_NAME: 1}
+    assert profiler.seconds["draw_list"]["rasterize"] == 0.25
+    assert profiler.seconds[IDLE_ENTRY_NAME]["rasterize"] == 0.25
+
+
+def test_merged_profiles_add_up() -> None:
+    profiler = RenderProfiler()
+    profiler.add_time("draw_list", "call", 1.0)
+    other_profiler = RenderProfiler()
+    other_profiler.add_time("draw_list", "call", 2.0)
+    other_profiler.add_frame(["draw_list"], rasterize_seconds=1.0)
+
+    profiler.merge(other_profiler)
+
+    assert profiler.seconds["draw_list"]["call"] == 3.0
+    assert profiler.frames["draw_list"] == 1
+
+
+def test_report_is_sorted(tmp_path) -> None:
+    profiler = RenderProfiler()
+    profiler.add_time("fast_entry", "interpolate", 1.0)
+    profiler.add_time("slow_entry", "interpolate", 3.0)
+    profiler.add_frame(["fast_entry"], rasterize_seconds=1.0)
+
+    profiler.write_json(tmp_path / "profile.json")
+    rows = json.loads((tmp_path / "profile.json").read_text())
+
+    assert [row["entry"] for row in rows] == ["slow_entry", "fast_entry"]
+    assert rows[1]["fps"] == 0.5
+    assert [row["entry"] for row in profiler.get_rows(sort_by="frames")] == ["fast_entry", "slow_entry"]
+    assert profiler.format_table().splitlines()[1].startswith("slow_entry")
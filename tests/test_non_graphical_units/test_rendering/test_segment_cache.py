@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from manim import FadeIn
+from manim import Square
+
+from code_curator.base_scene import BaseScene
+from code_curator.rendering import segment_cache as segment_cache_module
+from code_curator.rendering.segment_cache import SegmentCache
+from code_curator.rendering.segment_cache import get_code_hash
+from code_curator.rendering.segment_cache import get_method_source
+from code_curator.rendering.segment_cache import get_segment_key
+from code_curator.rendering.state_hash import hash_mobject_state
+
+
+class AnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 1.0
+        self.entries = [{"name": "fade_in_square", "start_time": 0.0}]
+
+
+class SquareScene(BaseScene):
+    def fade_in_square(self):
+        return FadeIn(Square())
+
+
+def test_cache_returns_stored_segment(tmp_path) -> None:
+    segment_cache = SegmentCache(tmp_path / "cache")
+    movie_path = tmp_path / "movie.mp4"
+    movie_path.write_bytes(b"frames")
+
+    assert segment_cache.get("key") is None
+
+    cached_path = segment_cache.put("key", movie_path)
+
+    assert segment_cache.get("key") == cached_path
+    assert cached_path.read_bytes() == b"frames"
+    assert segment_cache.get("other_key") is None
+
+
+def test_state_hash_changes_with_what_is_drawn() -> None:
+    square = Square()
+    initial_hash = hash_mobject_state(square)
+
+    assert hash_mobject_state(Square()) == initial_hash
+
+    square.shift(1e-3)
+    shifted_hash = hash_mobject_state(square)
+    assert shifted_hash != initial_hash
+
+    square.set_fill(opacity=0.5)
+    assert hash_mobject_state(square) != shifted_hash
+
+
+def test_code_hash_covers_helpers_but_not_script_methods(monkeypatch) -> None:
+    scene = SquareScene(animation_script=AnimationScript())
+    entry_source = get_method_source(scene.fade_in_square)
+
+    def get_code_hash_with_module_source(module_source: str) -> str:
+        monkeypatch.setattr(segment_cache_module, "_read_source", lambda path: module_source)
+        return get_code_hash(scene.curator_animation)
+
+    helper_hash = get_code_hash_with_module_source("HELPER_RADIUS = 1\n")
+
+    assert get_code_hash_with_module_source("HELPER_RADIUS = 1\n" + entry_source) == helper_hash
+    assert get_code_hash_with_module_source("HELPER_RADIUS = 2\n" + entry_source) != helper_hash
+
+
+def test_segment_key_changes_with_state_that_is_not_drawn() -> None:
+    def get_key_of_square_with(value, count) -> str:
+        scene = SquareScene(animation_script=AnimationScript())
+        square = Square()
+        square.value = value
+        scene.add(square)
+        scene.count = count
+        scene.curator_animation.fast_forward()
+        return get_segment_key(scene.curator_animation)
+
+    key = get_key_of_square_with({"next": [1, 2]}, 0)
+
+    assert get_key_of_square_with({"next": [1, 2]}, 0) == key
+    assert get_key_of_square_with({"next": [2, 1]}, 0) != key
+    assert get_key_of_square_with({"next": [1, 2]}, 1) != key
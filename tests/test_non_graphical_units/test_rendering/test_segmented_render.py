@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import subprocess
+
+import numpy as np
+import pytest
+from manim import FadeIn
+from manim import Square
+
+from code_curator.base_scene import BaseScene
+from code_curator.rendering.profiler import RenderProfiler
+from code_curator.rendering.segment_cache import SegmentCache
+from code_curator.rendering.segment_cache import get_segment_key
+from code_curator.rendering.segmented_render import _render_segment
+from code_curator.rendering.segmented_render import concatenate_segments
+from code_curator.rendering.segmented_render import split_timeline
+
+
+class AnimationScript:
+    def __init__(self) -> None:
+        self.run_time = 2.0
+        self.entries = [
+            {"name": "fade_in_square", "start_time": 0.0},
+            {"name": "fade_in_small_square", "start_time": 1.0},
+        ]
+
+
+class TwoEntryScene(BaseScene):
+    def fade_in_square(self):
+        return FadeIn(Square())
+
+    def fade_in_small_square(self):
+        return FadeIn(Square().scale(0.5))
+
+
+@pytest.mark.parametrize(
+    ("run_time", "frame_rate", "num_segments"),
+    (
+        (1.0, 15, 1),
+        (1.0, 15, 4),
+        (10.3, 15, 7),
+        (61.7, 30, 32),
+        (3.01, 60, 3),
+    ),
+)
+def test_segments_contain_exactly_the_frames_of_the_whole_timeline(run_time, frame_rate, num_segments) -> None:
+    windows = split_timeline(run_time, frame_rate, num_segments)
+
+    segment_frame_times = [
+        start + t for start, end in windows for t in np.arange(0, end - start, 1 / frame_rate)
+    ]
+
+    assert np.allclose(segment_frame_times, np.arange(0, run_time, 1 / frame_rate))
+
+
+def test_segments_start_on_frames() -> None:
+    frame_rate = 15
+
+    windows = split_timeline(10.0, frame_rate, 6)
+
+    for start, _ in windows:
+        assert np.isclose(start * frame_rate, round(start * frame_rate))
+
+
+def test_more_segments_than_frames() -> None:
+    windows = split_timeline(0.2, 15, 10)
+
+    assert len(windows) == 3
+
+
+def test_segments_snap_to_the_closest_start_time() -> None:
+    frame_rate = 15
+
+    windows = split_timeline(10.0, frame_rate, 2, snap_to=[0.0, 1.0, 4.4, 9.0])
+
+    assert [round(start * frame_rate) for start, _ in windows] == [0, 66]
+
+
+def test_segments_only_snap_to_close_start_times() -> None:
+    frame_rate = 15
+
+    windows = split_timeline(10.0, frame_rate, 3, snap_to=[1.0, 7.0])
+
+    assert [round(start * frame_rate) for start, _ in windows] == [0, 50, 105]
+
+
+def test_time_range_keeps_only_the_frames_shown_during_it() -> None:
+    frame_rate = 15
+    run_time = 10.0
+    time_range = (2.01, 4.0)
+
+    windows = split_timeline(run_time, frame_rate, 3, time_range=time_range)
+
+    segment_frame_times = [
+        start + t for start, end in windows for t in np.arange(0, end - start, 1 / frame_rate)
+    ]
+    full_frame_times = np.arange(0, run_time, 1 / frame_rate)
+    expected_frame_times = full_frame_times[
+        (full_frame_times >= time_range[0]) & (full_frame_times < time_range[1] - 1e-9)
+    ]
+    assert np.allclose(segment_frame_times, expected_frame_times)
+
+
+def test_time_range_without_frames() -> None:
+    with pytest.raises(ValueError):
+        split_timeline(10.0, 15, 1, time_range=(2.01, 2.02))
+
+
+@pytest.mark.parametrize(
+    ("audio_offset", "offset_args"),
+    (
+        (1.5, ["-itsoffset", "1.500000"]),
+        (-2.25, ["-ss", "2.250000"]),
+    ),
+)
+def test_audio_is_muxed_without_reencoding_video(tmp_path, monkeypatch, audio_offset, offset_args) -> None:
+    commands = []
+    monkeypatch.setattr(subprocess, "run", lambda command, **kwargs: commands.append(command))
+
+    concatenate_segments(
+        [tmp_path / "segment_0.mp4", tmp_path / "segment_1.mp4"],
+        tmp_path / "video.mp4",
+        audio_path=tmp_path / "audio.wav",
+        audio_offset=audio_offset,
+    )
+
+    (command,) = commands
+    audio_input_index = command.index(str(tmp_path / "audio.wav"))
+    assert command[audio_input_index - 3 : audio_input_index - 1] == offset_args
+    assert command[command.index("-c:v") + 1] == "copy"
+
+
+def test_cached_segments_are_not_measured(tmp_path) -> None:
+    window = (1.0, 1.9)
+    segment_cache = SegmentCache(tmp_path / "cache")
+    scene = TwoEntryScene(animation_script=AnimationScript(), render_window=window)
+    scene.curator_animation.fast_forward()
+    movie_path = tmp_path / "movie.mp4"
+    movie_path.write_bytes(b"frames")
+    cached_path = segment_cache.put(get_segment_key(scene.curator_animation), movie_path)
+
+    segment_path, profiler = _render_segment(
+        TwoEntryScene,
+        AnimationScript(),
+        window,
+        tmp_path / "segment",
+        segment_cache,
+        checkpoint_store=None,
+        profiler=RenderProfiler(),
+        tex_cache=None,
+    )
+
+    assert segment_path == cached_path
+    assert profiler.seconds == {}
+    assert profiler.frames == {}
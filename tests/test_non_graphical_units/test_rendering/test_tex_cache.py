@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+from manim import Circle
+from manim import SingleStringMathTex
+from manim import Square
+from manim import TexTemplate
+
+from code_curator.rendering.tex_cache import TexCache
+from code_curator.rendering.tex_cache import enable_tex_cache
+
+
+def test_cache_returns_stored_paths(tmp_path) -> None:
+    tex_cache = TexCache(tmp_path)
+    square = Square().set_fill("#FF0000", opacity=0.5)
+    circle = Circle().set_stroke(width=3)
+
+    assert tex_cache.get("key") is None
+
+    tex_cache.put("key", [square, circle])
+    cached_square, cached_circle = tex_cache.get("key")
+
+    assert type(cached_square) is Square
+    assert np.array_equal(cached_square.points, square.points)
+    assert cached_square.get_style(simple=True) == square.get_style(simple=True)
+    assert cached_square.get_fill_opacity() == 0.5
+    assert type(cached_circle) is Circle
+    assert np.array_equal(cached_circle.points, circle.points)
+    assert cached_circle.get_stroke_width() == 3
+    assert tex_cache.get("other_key") is None
+
+
+class RecordedTex:
+    def __init__(self, tex_string: str) -> None:
+        self.tex_string = tex_string
+        self.tex_environment = "align*"
+        self.tex_template = TexTemplate()
+
+
+def test_manifest_keeps_every_recorded_tex_string_once(tmp_path) -> None:
+    tex_cache = TexCache(tmp_path)
+
+    tex_cache.record("Video", "first_key", RecordedTex("1"))
+    tex_cache.record("Video", "second_key", RecordedTex("2"))
+    tex_cache.record("Video", "first_key", RecordedTex("1"))
+    tex_cache.record("OtherVideo", "third_key", RecordedTex("3"))
+
+    manifest = tex_cache.get_manifest("Video")
+
+    assert sorted(manifest) == ["first_key", "second_key"]
+    assert manifest["second_key"][:2] == ("2", "align*")
+    assert tex_cache.get_manifest("MissingVideo") == {}
+
+
+def test_tex_cache_is_only_enabled_inside_its_context(tmp_path) -> None:
+    manim_init_svg_mobject = SingleStringMathTex.init_svg_mobject
+
+    with enable_tex_cache(TexCache(tmp_path)):
+        assert SingleStringMathTex.init_svg_mobject is not manim_init_svg_mobject
+
+    assert SingleStringMathTex.init_svg_mobject is manim_init_svg_mobject
+    assert "init_svg_mobject" not in vars(SingleStringMathTex)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from manim import WHITE
+
+from code_curator.animations.singly_linked_list.transform_sll import TransformSinglyLinkedList
+from code_curator.code.custom_code import CustomCode
+from code_curator.data_structures.singly_linked_list import SinglyLinkedList
+
+
+def test_only_outermost_mobjects_are_animated() -> None:
+    sll = SinglyLinkedList(0, 1, color=WHITE)
+    sll.generate_target()
+    sll.target.insert_node(2, 2)
+
+    transform = TransformSinglyLinkedList(sll, methods=[])
+
+    transformed_mobjects = [anim.mobject for anim in transform.transform_animations]
+    faded_in_mobjects = [anim.mobject for anim in transform.fading_in_animations]
+    for mobjects in (transformed_mobjects, faded_in_mobjects):
+        for mob in mobjects:
+            assert not any(mob in other.get_family()[1:] for other in mobjects)
+
+    assert transform.fading_out_animations == []
+    assert len(faded_in_mobjects) == 2  # The new node and the edge pointing to it
+
+
+def test_nothing_fades_when_highlighting_one_of_identical_lines() -> None:
+    code = CustomCode(code="x = 1\nx = 1\nx = 1")
+
+    _, transform = code.fade_in_lines(1)
+
+    assert transform.fading_out_animations == []
+    assert transform.fading_in_animations == []
+    transformed_mobjects = [anim.mobject for anim in transform.transform_animations]
+    assert transformed_mobjects == code.code[1].family_members_with_points()